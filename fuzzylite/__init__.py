@@ -16,11 +16,13 @@
 """
 # flake8: noqa
 
+import sys
+import typing
 # noinspection PyUnresolvedReferences
 from math import inf, isinf, isnan, nan
 
-from fuzzylite import examples
 from fuzzylite.activation import *
+from fuzzylite.context import *
 from fuzzylite.defuzzifier import *
 from fuzzylite.engine import *
 from fuzzylite.exporter import *
@@ -28,17 +30,40 @@ from fuzzylite.factory import *
 from fuzzylite.hedge import *
 from fuzzylite.importer import *
 from fuzzylite.library import *
+from fuzzylite.named import *
 from fuzzylite.norm import *
 from fuzzylite.operation import *
+from fuzzylite.profiler import *
 from fuzzylite.rule import *
 from fuzzylite.term import *
 from fuzzylite.variable import *
 
+if typing.TYPE_CHECKING:
+    from typing import List
+
 lib: Library = Library(decimals=3,
                        abs_tolerance=1e-5,
-                       floating_point_type=float,
-                       factory_manager=FactoryManager())
+                       floating_point_type=float)
 __name__ = lib.name
 __version__ = lib.version
 __doc__ = lib.summary
 scalar = lib.floating_point
+
+
+def __getattr__(name: str) -> object:
+    # the examples and the benchmark are imported on first use to keep importing the library fast
+    if name in {"benchmark", "examples"}:
+        import importlib
+        return importlib.import_module(f"fuzzylite.{name}")
+    raise AttributeError(f"module '{__package__}' has no attribute '{name}'")
+
+
+def __dir__() -> 'List[str]':
+    return sorted((set(globals()) - {"__getattr__", "__dir__", "sys", "typing"})
+                  | {"benchmark", "examples"})
+
+
+if sys.version_info < (3, 7):
+    # the attributes of modules (PEP 562) require Python 3.7, hence the examples and the benchmark
+    # are imported up front in Python 3.6
+    from fuzzylite import benchmark, examples
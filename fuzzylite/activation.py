@@ -21,11 +21,15 @@ __all__ = ["Activation", "General", "First", "Last", "Highest", "Lowest", "Propo
 import enum
 import heapq
 import operator
+import typing
 from typing import Callable, List, Tuple, Union
 
 from .operation import Op
 from .rule import Rule, RuleBlock
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # noqa: F401
+
 
 class Activation:
 
@@ -36,6 +40,14 @@ class Activation:
     def activate(self, rule_block: RuleBlock) -> None:
         raise NotImplementedError()
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        """
+        Activates the rule block when the values of the input variables are arrays, whose
+        elements are the rows of the batch of inputs processed by `Engine.process_batch`. The
+        states of the rules are not modified.
+        """
+        raise NotImplementedError()
+
     def parameters(self) -> str:
         return ""
 
@@ -57,11 +69,46 @@ class General(Activation):
         disjunction = rule_block.disjunction
         implication = rule_block.implication
 
-        for rule in rule_block.rules:
-            rule.deactivate()
+        # only the rules activated by the previous activation (if known) need to be deactivated,
+        # and the rules that cannot fire are left with activation degrees of zero
+        fired = rule_block._fired
+        if fired is None:
+            rule_block.deactivate_rules()
+        else:
+            rule_block._fired = None
+            for rule in fired:
+                rule.deactivate()
+        fired = []
+        for rule in rule_block.firing_rules():
             if rule.is_loaded():
+                fired.append(rule)
                 rule.activate_with(conjunction, disjunction)
                 rule.trigger(implication)
+        rule_block._fired = fired
+
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        conjunction = rule_block.conjunction
+        disjunction = rule_block.disjunction
+        implication = rule_block.implication
+
+        for rule in rule_block.rules:
+            if rule.is_loaded():
+                rule.trigger_array(rule.activate_with_array(conjunction, disjunction),
+                                   implication)
+
+
+def _activation_degrees_array(rule_block: RuleBlock) -> Tuple[List[Rule], 'np.ndarray']:
+    import numpy as np
+    conjunction = rule_block.conjunction
+    disjunction = rule_block.disjunction
+
+    rules = [rule for rule in rule_block.rules if rule.is_loaded()]
+    if not rules:
+        return rules, np.zeros((0,))
+    degrees = np.broadcast_arrays(
+        *[np.asarray(rule.activate_with_array(conjunction, disjunction), dtype=float)
+          for rule in rules])
+    return rules, np.array(degrees, dtype=float).reshape((len(rules),) + np.shape(degrees[0]))
 
 
 def _activate_positional(activation: Union['First', 'Last'], rule_block: RuleBlock) -> None:
@@ -77,9 +124,8 @@ def _activate_positional(activation: Union['First', 'Last'], rule_block: RuleBlo
     else:
         raise ValueError()
 
+    rule_block.deactivate_rules()
     for rule in rules:
-        rule.deactivate()
-
         if rule.is_loaded():
             activation_degree = rule.activate_with(conjunction, disjunction)
             if (activated < activation.rules
@@ -89,6 +135,29 @@ def _activate_positional(activation: Union['First', 'Last'], rule_block: RuleBlo
                 activated += 1
 
 
+def _activate_positional_batch(activation: Union['First', 'Last'],
+                               rule_block: RuleBlock) -> None:
+    import numpy as np
+    implication = rule_block.implication
+
+    rules, degrees = _activation_degrees_array(rule_block)
+    if isinstance(activation, First):
+        indexes = range(len(rules))
+    elif isinstance(activation, Last):
+        indexes = reversed(range(len(rules)))
+    else:
+        raise ValueError()
+
+    activated = np.zeros(degrees.shape[1:], dtype=int)
+    for index in indexes:
+        activation_degree = degrees[index]
+        selected = ((activated < activation.rules)
+                    & Op.gt_array(activation_degree, 0.0)
+                    & (activation_degree >= activation.threshold))
+        rules[index].trigger_array(np.where(selected, activation_degree, 0.0), implication)
+        activated += selected
+
+
 class First(Activation):
 
     def __init__(self, rules: int = 1, threshold: float = 0.0) -> None:
@@ -108,6 +177,9 @@ class First(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_positional(self, rule_block)
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        _activate_positional_batch(self, rule_block)
+
 
 class Last(Activation):
 
@@ -128,6 +200,9 @@ class Last(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_positional(self, rule_block)
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        _activate_positional_batch(self, rule_block)
+
 
 def _activate_ranking(activation: Union['Highest', 'Lowest'], rule_block: RuleBlock) -> None:
     conjunction = rule_block.conjunction
@@ -143,8 +218,8 @@ def _activate_ranking(activation: Union['Highest', 'Lowest'], rule_block: RuleBl
     else:
         raise ValueError()
 
+    rule_block.deactivate_rules()
     for index, rule in enumerate(rule_block.rules):
-        rule.deactivate()
         if rule.is_loaded():
             activation_degree = rule.activate_with(conjunction, disjunction)
             if Op.gt(activation_degree, 0.0):
@@ -157,6 +232,30 @@ def _activate_ranking(activation: Union['Highest', 'Lowest'], rule_block: RuleBl
         activated += 1
 
 
+def _activate_ranking_batch(activation: Union['Highest', 'Lowest'],
+                            rule_block: RuleBlock) -> None:
+    import numpy as np
+    implication = rule_block.implication
+
+    if isinstance(activation, Highest):
+        sign = -1
+    elif isinstance(activation, Lowest):
+        sign = 1
+    else:
+        raise ValueError()
+
+    rules, degrees = _activation_degrees_array(rule_block)
+    eligible = Op.gt_array(degrees, 0.0)
+    # stable sorting breaks ties by the index of the rule, as the heap does
+    order = np.argsort(np.where(eligible, sign * degrees, np.inf), axis=0, kind='stable')
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order,
+                      np.arange(len(rules)).reshape((-1,) + (1,) * (degrees.ndim - 1)), axis=0)
+    selected = eligible & (rank < activation.rules)
+    for index, rule in enumerate(rules):
+        rule.trigger_array(np.where(selected[index], degrees[index], 0.0), implication)
+
+
 class Highest(Activation):
 
     def __init__(self, rules: int = 1) -> None:
@@ -172,6 +271,9 @@ class Highest(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_ranking(self, rule_block)
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        _activate_ranking_batch(self, rule_block)
+
 
 class Lowest(Activation):
 
@@ -188,6 +290,9 @@ class Lowest(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_ranking(self, rule_block)
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        _activate_ranking_batch(self, rule_block)
+
 
 class Proportional(Activation):
 
@@ -198,9 +303,8 @@ class Proportional(Activation):
 
         activate: List[Rule] = []
         sum_degrees = 0.0
+        rule_block.deactivate_rules()
         for rule in rule_block.rules:
-            rule.deactivate()
-
             if rule.is_loaded():
                 activation_degree = rule.activate_with(conjunction, disjunction)
                 if Op.gt(activation_degree, 0.0):
@@ -211,6 +315,16 @@ class Proportional(Activation):
             rule.activation_degree /= sum_degrees
             rule.trigger(implication)
 
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        import numpy as np
+        implication = rule_block.implication
+
+        rules, degrees = _activation_degrees_array(rule_block)
+        degrees = np.where(Op.gt_array(degrees, 0.0), degrees, 0.0)
+        sum_degrees = degrees.sum(axis=0)
+        for index, rule in enumerate(rules):
+            rule.trigger_array(degrees[index] / sum_degrees, implication)
+
 
 class Threshold(Activation):
     @enum.unique
@@ -256,9 +370,21 @@ class Threshold(Activation):
         disjunction = rule_block.disjunction
         implication = rule_block.implication
 
+        rule_block.deactivate_rules()
         for rule in rule_block.rules:
-            rule.deactivate()
             if rule.is_loaded():
                 activation_degree = rule.activate_with(conjunction, disjunction)
                 if self.comparator.operator(activation_degree, self.threshold):
                     rule.trigger(implication)
+
+    def activate_batch(self, rule_block: RuleBlock) -> None:
+        import numpy as np
+        conjunction = rule_block.conjunction
+        disjunction = rule_block.disjunction
+        implication = rule_block.implication
+
+        for rule in rule_block.rules:
+            if rule.is_loaded():
+                activation_degree = rule.activate_with_array(conjunction, disjunction)
+                selected = self.comparator.operator(activation_degree, self.threshold)
+                rule.trigger_array(np.where(selected, activation_degree, 0.0), implication)
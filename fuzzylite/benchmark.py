@@ -0,0 +1,330 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Benchmark"]
+
+import math
+import sys
+import time
+import typing
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+from .engine import Engine
+from .operation import Op
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path  # noqa: F401
+
+
+class Benchmark:
+    """
+      The Benchmark class measures the performance of an engine replaying a dataset of expected
+      values in the FuzzyLite Dataset (FLD) format, namely the throughput and the percentiles of
+      the latencies of processing each row of inputs, and the absolute errors of the output
+      values against the expected values. The results are dictionaries that can be serialized
+      to JSON to track the performance across releases and compare the modes of processing.
+
+      Usage: python -m fuzzylite.benchmark [patterns] [--rows N] [--mode M] [--output FILE]
+
+      @see Engine
+      @see FldExporter
+      @since 7.0
+    """
+
+    # the modes of processing the rows of inputs: one at a time with `Engine.process` (also
+    # incrementally), or in batches of rows with `Engine.process_batch`
+    MODES = ("process", "incremental", "batch")
+
+    def __init__(self, name: str, engine: Engine, data: Sequence[Sequence[float]],
+                 tolerance: Optional[float] = None) -> None:
+        """
+        Creates the benchmark.
+        :param name: is the name of the benchmark
+        :param engine: is the engine to benchmark
+        :param data: is the rows of the values of the input variables followed by the expected
+        values of the output variables
+        :param tolerance: is the absolute tolerance of the errors, or `lib.abs_tolerance` if None
+        """
+        from . import lib
+        self.name = name
+        self.engine = engine
+        self.data = data
+        self.tolerance = lib.abs_tolerance if tolerance is None else tolerance
+
+    def exact(self) -> 'Benchmark':
+        """
+        Sets the Centroid and Bisector defuzzifiers of the engine to compute the piecewise-linear
+        terms exactly instead of sampling them (the datasets of the examples were generated by
+        sampling them).
+        :return: this benchmark
+        """
+        from .defuzzifier import Bisector, Centroid
+        for variable in self.engine.output_variables:
+            if isinstance(variable.defuzzifier, (Bisector, Centroid)):
+                variable.defuzzifier.exact = True
+        return self
+
+    @staticmethod
+    def read_fld(path: Union[str, 'Path'], rows: Optional[int] = None) -> List[List[float]]:
+        """
+        Reads the rows of values of a FuzzyLite Dataset, skipping the header and comments.
+        :param path: is the path to the FuzzyLite Dataset
+        :param rows: is the maximum number of rows to read, or None to read all
+        :return: the rows of values
+        """
+        result: List[List[float]] = []
+        with open(path) as fld:
+            next(fld, None)
+            for line in fld:
+                if rows is not None and len(result) >= rows:
+                    break
+                line = line.partition("#")[0]
+                if line.strip():
+                    result.append([Op.scalar(value) for value in line.split()])
+        return result
+
+    @staticmethod
+    def from_files(fll: Union[str, 'Path'], fld: Union[str, 'Path'],
+                   rows: Optional[int] = None, name: Optional[str] = None) -> 'Benchmark':
+        """
+        Creates the benchmark of the engine in the FuzzyLite Language file with the dataset in
+        the FuzzyLite Dataset file.
+        :param fll: is the path to the engine in the FuzzyLite Language
+        :param fld: is the path to the FuzzyLite Dataset of expected values
+        :param rows: is the maximum number of rows to read, or None to read all
+        :param name: is the name of the benchmark, or the name of the FLL file if None
+        :return: the benchmark
+        """
+        from pathlib import Path
+
+        from .importer import FllImporter
+        engine = FllImporter().from_file(fll)
+        return Benchmark(Path(fll).stem if name is None else name, engine,
+                         Benchmark.read_fld(fld, rows))
+
+    @staticmethod
+    def examples(patterns: Sequence[str] = ("**/*",),
+                 rows: Optional[int] = None) -> Iterator['Benchmark']:
+        """
+        Creates the benchmarks of the engines in `fuzzylite/examples` with their datasets.
+        :param patterns: is the glob patterns of the examples relative to the directory of the
+        examples and without suffix (eg, `mamdani/*` or `terms/Triangle`)
+        :param rows: is the maximum number of rows to read per dataset, or None to read all
+        :return: the benchmarks sorted by name, created as they are iterated
+        """
+        from pathlib import Path
+        root = Path(__file__).parent / "examples"
+        paths = {path for pattern in patterns for path in root.glob(f"{pattern}.fll")
+                 if path.with_suffix(".fld").exists()}
+        for path in sorted(paths):
+            yield Benchmark.from_files(path, path.with_suffix(".fld"), rows,
+                                       path.relative_to(root).with_suffix("").as_posix())
+
+    def measure(self, mode: str = "process", batch_size: int = 1024) -> Dict[str, object]:
+        """
+        Measures the engine processing every row of inputs in the dataset.
+        :param mode: is the mode of processing the rows in `Benchmark.MODES`, where the latencies
+        of the `batch` mode are the times to process each batch divided by its number of rows
+        :param batch_size: is the number of rows per batch in the `batch` mode
+        :return: the dictionary of results, where the latencies are in microseconds, the
+        errors are the number of output values that differ from the expected values by more
+        than the tolerance (where nan equals nan), and the exceptions are the number of rows
+        whose processing raised an exception, whose output values are nan
+        """
+        if mode not in Benchmark.MODES:
+            raise ValueError(f"expected a mode in {Benchmark.MODES}, but found '{mode}'")
+        engine = self.engine
+        inputs = len(engine.input_variables)
+        outputs = len(engine.output_variables)
+        for row, values in enumerate(self.data):
+            if len(values) != inputs + outputs:
+                raise ValueError(f"expected {inputs + outputs} values in row {row}, "
+                                 f"but found {len(values)}")
+
+        engine.restart()
+        if mode == "batch":
+            latencies, obtained, exceptions, seconds = self._measure_batches(batch_size)
+        else:
+            latencies, obtained, exceptions, seconds = self._measure_rows(mode == "incremental")
+
+        max_error = None
+        errors = 0
+        for values, outputs_obtained in zip(self.data, obtained):
+            for expected, value in zip(values[inputs:], outputs_obtained):
+                if Op.neq(expected, value, self.tolerance):
+                    errors += 1
+                if math.isfinite(expected) and math.isfinite(value):
+                    error = abs(expected - value)
+                    max_error = error if max_error is None else max(max_error, error)
+
+        latencies.sort()
+        rows = len(self.data)
+        return {
+            "name": self.name,
+            "mode": mode,
+            "inputs": inputs,
+            "outputs": outputs,
+            "rules": sum(len(block.rules) for block in engine.rule_blocks),
+            "rows": rows,
+            "seconds": seconds,
+            "throughput": rows / seconds if seconds > 0.0 else None,
+            "latency": {
+                "mean": sum(latencies) / len(latencies) if latencies else None,
+                "p50": Benchmark.percentile(latencies, 50.0),
+                "p99": Benchmark.percentile(latencies, 99.0),
+                "max": latencies[-1] if latencies else None,
+            },
+            "max_error": max_error,
+            "errors": errors,
+            "exceptions": exceptions,
+        }
+
+    def _measure_rows(self, incremental: bool) -> typing.Tuple[List[float], List[List[float]],
+                                                               int, float]:
+        engine = self.engine
+        process = engine.process if not incremental else lambda: engine.process(incremental=True)
+        input_variables = engine.input_variables
+        output_variables = engine.output_variables
+        failed = [math.nan] * len(output_variables)
+        clock = time.perf_counter
+        latencies: List[float] = []
+        obtained: List[List[float]] = []
+        exceptions = 0
+        for values in self.data:
+            for variable, value in zip(input_variables, values):
+                variable.value = value
+            start = clock()
+            try:
+                process()
+                latencies.append(clock() - start)
+                obtained.append([variable.value for variable in output_variables])
+            except Exception:
+                latencies.append(clock() - start)
+                obtained.append(failed)
+                exceptions += 1
+        seconds = math.fsum(latencies)
+        return [latency * 1e6 for latency in latencies], obtained, exceptions, seconds
+
+    def _measure_batches(self, batch_size: int) -> typing.Tuple[List[float], List[List[float]],
+                                                                int, float]:
+        import numpy as np
+        if batch_size < 1:
+            raise ValueError(f"expected a batch size of at least 1, but found {batch_size}")
+        inputs = len(self.engine.input_variables)
+        data = np.array(self.data, dtype=float).reshape(len(self.data), -1)
+        clock = time.perf_counter
+        latencies: List[float] = []
+        obtained: List[List[float]] = []
+        seconds = 0.0
+        exceptions = 0
+        for start in range(0, len(data), batch_size):
+            batch = data[start:start + batch_size, :inputs]
+            begin = clock()
+            try:
+                outputs = self.engine.process_batch(batch).tolist()
+            except Exception:
+                # the rows of the batch are processed again one at a time to find the rows
+                # that raise the exception
+                outputs = []
+                for row in batch:
+                    try:
+                        outputs.extend(self.engine.process_batch(row[np.newaxis]).tolist())
+                    except Exception:
+                        outputs.append([math.nan] * len(self.engine.output_variables))
+                        exceptions += 1
+            elapsed = clock() - begin
+            seconds += elapsed
+            latencies.extend([elapsed * 1e6 / len(batch)] * len(batch))
+            obtained.extend(outputs)
+        return latencies, obtained, exceptions, seconds
+
+    @staticmethod
+    def percentile(values: Sequence[float], percent: float) -> Optional[float]:
+        """
+        Computes the percentile of the sorted values using the nearest-rank method.
+        :param values: is the sorted values
+        :param percent: is the percent in [0, 100]
+        :return: the percentile, or None if there are no values
+        """
+        if not values:
+            return None
+        rank = math.ceil(percent / 100.0 * len(values))
+        return values[min(len(values), max(1, rank)) - 1]
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    """
+    Benchmarks the engines in `fuzzylite/examples` replaying their datasets, printing the
+    progress to the standard error and the results in JSON to the standard output (or a file).
+    :param arguments: is the command-line arguments, or `sys.argv[1:]` if None
+    """
+    import argparse
+    import json
+    import platform
+
+    from . import lib
+    parser = argparse.ArgumentParser(
+        prog="python -m fuzzylite.benchmark",
+        description="Benchmarks the example engines against their FuzzyLite Datasets")
+    parser.add_argument("patterns", nargs="*", default=["**/*"],
+                        help="glob patterns of the examples without suffix (eg, 'mamdani/*')")
+    parser.add_argument("--rows", type=int, default=None,
+                        help="maximum number of rows per dataset (default: all)")
+    parser.add_argument("--mode", choices=Benchmark.MODES, default="process",
+                        help="mode of processing the rows (default: process)")
+    parser.add_argument("--batch-size", type=int, default=1024,
+                        help="number of rows per batch in the batch mode (default: 1024)")
+    parser.add_argument("--exact", action="store_true",
+                        help="defuzzify piecewise-linear terms exactly instead of sampling them "
+                             "as the datasets were generated (default: sampled)")
+    parser.add_argument("--output", default=None,
+                        help="path to the JSON file of results (default: standard output)")
+    options = parser.parse_args(arguments)
+
+    results = []
+    for benchmark in Benchmark.examples(options.patterns, options.rows):
+        if options.exact:
+            benchmark.exact()
+        result = benchmark.measure(options.mode, options.batch_size)
+        results.append(result)
+        latency: Dict[str, Optional[float]] = result["latency"]  # type: ignore
+        print(f"{benchmark.name:<48} {result['rows']:>8} rows "
+              f"{latency['p50'] or math.nan:>10.1f} us (p50) "
+              f"{latency['p99'] or math.nan:>10.1f} us (p99) "
+              f"{result['errors']:>6} errors", file=sys.stderr)
+
+    report = {
+        "library": lib.name,
+        "version": lib.version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "mode": options.mode,
+        "rows": options.rows,
+        "exact": options.exact,
+        "benchmarks": results,
+    }
+    text = json.dumps(report, indent=2, allow_nan=False)
+    if options.output:
+        with open(options.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
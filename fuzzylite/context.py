@@ -0,0 +1,108 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Context"]
+
+import threading
+import typing
+from typing import Callable, Dict, List, Optional
+
+if typing.TYPE_CHECKING:
+    from .engine import Engine, _Increment  # noqa: F401
+    from .rule import Rule, RuleBlock  # noqa: F401
+    from .term import Aggregated, Term  # noqa: F401
+    from .variable import InputVariable, OutputVariable, Variable  # noqa: F401
+
+try:
+    import contextvars
+except ImportError:  # Python 3.6
+    contextvars = None  # type: ignore
+
+
+class _ThreadLocalVar(threading.local):
+    # substitutes contextvars.ContextVar in Python 3.6, where the contexts are activated per
+    # thread (but not per asyncio task), and the tokens are the previous values
+    def __init__(self, default: object = None) -> None:
+        self.value = default
+
+    def get(self) -> object:
+        return self.value
+
+    def set(self, value: object) -> object:
+        token, self.value = self.value, value
+        return token
+
+    def reset(self, token: object) -> None:
+        self.value = token
+
+
+_context: 'contextvars.ContextVar[Optional[Context]]' = (
+    contextvars.ContextVar("fuzzylite.context", default=None) if contextvars
+    else _ThreadLocalVar(None))  # type: ignore
+
+# number of contexts active in any thread or asyncio task, such that the components of the engines
+# read and write their state directly in themselves (without looking up the current context) when
+# no context is active
+_active = 0
+_active_lock = threading.Lock()
+
+
+class Context:
+    """
+      The Context class holds the state of the engines that changes when processing inputs,
+      namely the values of the variables, the memberships of the input values, the fuzzy values
+      and previous values of the output variables, the activation degrees and triggers of the
+      rules, the rules activated by the rule blocks, and the states of the incremental processes
+      of the engines. While a context is active (`with context: ...`), the components of the
+      engines read and write their state in the context instead of in themselves. Thus, a single
+      engine can be shared by multiple threads or asyncio tasks that process inputs at the same
+      time, each within its own context, without modifying the engine or making copies of it.
+
+      Contexts are activated per thread and per asyncio task (only per thread in Python 3.6), and
+      the state of the engine is used when no context is active. The engine (ie, its variables,
+      terms, rules, etc.) must not be modified while processing inputs in contexts.
+
+      @see Engine
+      @since 7.0
+    """
+
+    def __init__(self) -> None:
+        self.values: Dict['Variable', float] = {}
+        self.memberships: Dict['InputVariable', Dict['Term', float]] = {}
+        self.fuzzy: Dict['OutputVariable', 'Aggregated'] = {}
+        self.previous_values: Dict['OutputVariable', float] = {}
+        self.activation_degrees: Dict['Rule', float] = {}
+        self.triggered: Dict['Rule', bool] = {}
+        self.fired: Dict['RuleBlock', List['Rule']] = {}
+        self.increments: Dict['Engine', '_Increment'] = {}
+        self._tokens: List[object] = []
+
+    def __enter__(self) -> 'Context':
+        global _active
+        with _active_lock:
+            _active += 1
+        self._tokens.append(_context.set(self))
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        global _active
+        _context.reset(self._tokens.pop())  # type: ignore
+        with _active_lock:
+            _active -= 1
+
+    # gets the context that is active in the current thread or asyncio task, or None otherwise
+    current: Callable[[], Optional['Context']] = staticmethod(_context.get)  # type: ignore
@@ -21,11 +21,17 @@ __all__ = ["Defuzzifier", "IntegralDefuzzifier", "Bisector", "Centroid", "Larges
 
 import enum
 import math
-from math import nan
-from typing import Optional, Union
+import typing
+from math import isnan, nan
+from typing import List, Optional, Tuple, Union
 
+from .norm import AlgebraicProduct, Maximum, Minimum
 from .operation import Op
-from .term import Aggregated, Constant, Function, Linear, Term
+from .term import (Activated, Aggregated, Constant, Discrete, Function, Linear, Ramp, Rectangle,
+                   Term, Trapezoid, Triangle)
+
+if typing.TYPE_CHECKING:
+    import numpy as np  # noqa: F401
 
 
 class Defuzzifier:
@@ -43,6 +49,17 @@ class Defuzzifier:
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         raise NotImplementedError()
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        """
+        Defuzzifies the term when its membership function values are arrays (eg, an Aggregated
+        term whose activation degrees are arrays)
+        :param term: is the term to defuzzify
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the array of defuzzified values
+        """
+        raise NotImplementedError()
+
 
 class IntegralDefuzzifier(Defuzzifier):
     default_resolution = 100
@@ -63,15 +80,226 @@ class IntegralDefuzzifier(Defuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         raise NotImplementedError()
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        raise NotImplementedError()
+
+    def piecewise_linear(self, term: Term, minimum: float,
+                         maximum: float) -> Optional[List[Tuple[float, float, float, float]]]:
+        """
+        Computes the linear segments of the term within the range when the term is piecewise
+        linear, that is, when the term is a Triangle, Trapezoid, Rectangle, Ramp or Discrete, or
+        an Aggregated term with Maximum aggregation whose activated terms are such terms with
+        Minimum or AlgebraicProduct implication.
+        :param term: is the term to split into linear segments
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the list of segments (x0, x1, y0, y1) covering the range, or None if the term
+        is not piecewise linear or if it has more vertices than the resolution (in which case
+        sampling the term is cheaper)
+        """
+        if not math.isfinite(minimum + maximum) or minimum >= maximum:
+            return None
+
+        pieces = _pieces(term)
+        if pieces is None:
+            return None
+
+        vertices = {minimum, maximum}
+        for piece in pieces:
+            piece_vertices = _linear_vertices(piece)
+            if piece_vertices is None:
+                return None
+            vertices.update(x for x in piece_vertices if minimum < x < maximum)
+        if len(vertices) > self.resolution:
+            return None
+
+        # within each interval, the terms are linear, but the Minimum implication and the
+        # Maximum aggregation introduce additional vertices where the lines cross each other
+        points = sorted(vertices)
+        for x0, x1 in zip(points[:-1], points[1:]):
+            for piece in pieces:
+                if isinstance(piece, Activated) and isinstance(piece.implication, Minimum):
+                    y0, y1 = _line(piece.term, x0, x1)
+                    vertices.update(_crossing(x0, x1, y0 - piece.degree, y1 - piece.degree))
+
+        points = sorted(vertices)
+        for x0, x1 in zip(points[:-1], points[1:]):
+            lines = [_line(piece, x0, x1) for piece in pieces]
+            for i, (a0, a1) in enumerate(lines):
+                for b0, b1 in lines[i + 1:]:
+                    vertices.update(_crossing(x0, x1, a0 - b0, a1 - b1))
+
+        points = sorted(vertices)
+        return [(x0, x1) + _line(term, x0, x1) for x0, x1 in zip(points[:-1], points[1:])]
+
+    def piecewise_linear_array(self, term: Term, minimum: float, maximum: float
+                               ) -> Optional[Tuple['np.ndarray', 'np.ndarray',
+                                                   'np.ndarray', 'np.ndarray']]:
+        """
+        Computes the linear segments of the term like `piecewise_linear` when the activation
+        degrees of the term are arrays. The vertices
+        where the lines cross each other depend on the degrees, so each row considers every
+        candidate crossing, and the candidates that do not cross leave empty segments.
+        :param term: is the term to split into linear segments
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the arrays (x0, x1, y0, y1) with the segments of each row on the last axis, or
+        None if the term is not piecewise linear or if it has more vertices than the resolution
+        """
+        import numpy as np
+        if not math.isfinite(minimum + maximum) or minimum >= maximum:
+            return None
+
+        pieces = _pieces(term)
+        if pieces is None:
+            return None
+
+        # each piece is the linear term, its activation degree, and whether the degree clips it
+        linear: List[Tuple[Term, 'np.ndarray', bool]] = []
+        vertices = {minimum, maximum}
+        for piece in pieces:
+            degree, clipped = 1.0, False
+            if isinstance(piece, Activated):
+                if not isinstance(piece.implication, (Minimum, AlgebraicProduct)):
+                    return None
+                degree, clipped = piece.degree, isinstance(piece.implication, Minimum)
+                piece = piece.term
+            piece_vertices = _linear_vertices(piece)
+            if piece_vertices is None:
+                return None
+            vertices.update(x for x in piece_vertices if minimum < x < maximum)
+            linear.append((piece, np.asarray(degree, dtype=float), clipped))
+        if len(vertices) > self.resolution:
+            return None
+
+        degrees = np.broadcast_arrays(*(degree for _, degree, _ in linear))
+        shape = degrees[0].shape if degrees else ()
+        points = sorted(vertices)
+        candidates = [np.broadcast_to(x, shape) for x in points]
+        for x0, x1 in zip(points[:-1], points[1:]):
+            lines = []
+            for (piece, _, clipped), degree in zip(linear, degrees):
+                y0, y1 = _line(piece, x0, x1)
+                if clipped:
+                    lines.extend([(np.broadcast_to(y0, shape), np.broadcast_to(y1, shape)),
+                                  (degree, degree)])
+                else:
+                    lines.append((degree * y0, degree * y1))
+            for i, (a0, a1) in enumerate(lines):
+                for b0, b1 in lines[i + 1:]:
+                    crossing = _crossing_array(x0, x1, a0 - b0, a1 - b1)
+                    if not np.isnan(crossing).all():
+                        candidates.append(crossing)
+
+        x = np.sort(np.where(np.isnan(candidates), maximum, candidates), axis=0)
+        x = np.moveaxis(x, 0, -1)
+        x0, x1 = x[..., :-1], x[..., 1:]
+        xa, xb = x0 + 0.25 * (x1 - x0), x0 + 0.75 * (x1 - x0)
+        ya, yb = np.zeros(xa.shape), np.zeros(xb.shape)
+        for (piece, _, clipped), degree in zip(linear, degrees):
+            degree = np.expand_dims(degree, -1)
+            implication = np.minimum if clipped else np.multiply
+            ya = np.maximum(ya, implication(piece.membership_array(xa), degree))
+            yb = np.maximum(yb, implication(piece.membership_array(xb), degree))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(xb > xa, (yb - ya) / (xb - xa), 0.0)
+        return x0, x1, ya - slope * (xa - x0), yb + slope * (x1 - xb)
+
+    def sample_array(self, term: Term, minimum: float, maximum: float,
+                     from_maximum: bool = False) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Samples the membership function of the term at the midpoints of the resolution
+        :param term: is the term to sample
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :param from_maximum: whether to sample from the maximum to the minimum value
+        :return: the values of x sampled, and the membership function values sampled on the last
+        axis
+        """
+        import numpy as np
+        dx = (maximum - minimum) / self.resolution
+        if from_maximum:
+            x = maximum - (np.arange(self.resolution) + 0.5) * dx
+        else:
+            x = minimum + (np.arange(self.resolution) + 0.5) * dx
+        return x, term.membership_array(x)
+
+
+def _pieces(term: Term) -> Optional[List[Term]]:
+    # the terms whose maximum is the term
+    if isinstance(term, Aggregated):
+        if term.terms and not isinstance(term.aggregation, Maximum):
+            return None
+        return list(term.terms)
+    return [term]
+
+
+def _linear_vertices(term: Term) -> Optional[List[float]]:
+    if isinstance(term, Activated):
+        if (not isinstance(term.implication, (Minimum, AlgebraicProduct))
+                or not isinstance(term.degree, (float, int))):
+            return None
+        return _linear_vertices(term.term)
+    if isinstance(term, Triangle):
+        vertices = [term.vertex_a, term.vertex_b, term.vertex_c]
+    elif isinstance(term, Trapezoid):
+        vertices = [term.vertex_a, term.vertex_b, term.vertex_c, term.vertex_d]
+    elif isinstance(term, (Rectangle, Ramp)):
+        vertices = [term.start, term.end]
+    elif isinstance(term, Discrete):
+        vertices = list(term.x())
+    else:
+        return None
+    return [x for x in vertices if math.isfinite(x)]
+
+
+def _line(term: Term, x0: float, x1: float) -> Tuple[float, float]:
+    # the term is linear within the open interval, so the values at the (possibly
+    # discontinuous) vertices are extrapolated from the values at two inner points
+    xa = x0 + 0.25 * (x1 - x0)
+    xb = x0 + 0.75 * (x1 - x0)
+    ya = term.membership(xa)
+    yb = term.membership(xb)
+    if not xb > xa:
+        # the interval between vertices crossing at adjacent floats has no inner points
+        return ya, ya
+    slope = (yb - ya) / (xb - xa)
+    return ya - slope * (xa - x0), yb + slope * (x1 - xb)
+
+
+def _crossing(x0: float, x1: float, d0: float, d1: float) -> List[float]:
+    if d0 * d1 < 0.0:
+        return [x0 + d0 / (d0 - d1) * (x1 - x0)]
+    return []
+
+
+def _crossing_array(x0: float, x1: float, d0: 'np.ndarray', d1: 'np.ndarray') -> 'np.ndarray':
+    import numpy as np
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(d0 * d1 < 0.0, x0 + d0 / (d0 - d1) * (x1 - x0), nan)  # type: ignore
+
 
 class Bisector(IntegralDefuzzifier):
 
-    def __init__(self, resolution: Optional[int] = None) -> None:
+    def __init__(self, resolution: Optional[int] = None, exact: bool = False) -> None:
+        """
+        Creates the defuzzifier
+        :param resolution: is the number of samples of the membership function
+        :param exact: whether to defuzzify the terms exactly when they are piecewise linear
+        instead of sampling them, which is a setting of this library that is neither
+        configured nor exported in the FuzzyLite Language (the default samples every term to
+        compute the same values as the other fuzzylite libraries)
+        """
         super().__init__(resolution)
+        self.exact = exact
 
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
+        if self.exact:
+            result = self.defuzzify_exact(term, minimum, maximum)
+            if not isnan(result):
+                return result
         resolution = self.resolution
         dx = (maximum - minimum) / resolution
         counter = resolution
@@ -94,15 +322,118 @@ class Bisector(IntegralDefuzzifier):
         # Inverse weighted average to compensate
         return (left_area * x_right + right_area * x_left) / (left_area + right_area)
 
+    def defuzzify_exact(self, term: Term, minimum: float, maximum: float) -> float:
+        """
+        Computes the exact bisector of the term when it is piecewise linear
+        :param term: is the term to defuzzify
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the value that divides the area of the term into two equal parts, or nan if
+        the term is not piecewise linear or its area is not positive
+        """
+        segments = self.piecewise_linear(term, minimum, maximum)
+        if not segments:
+            return nan
+        areas = [0.5 * (x1 - x0) * (y0 + y1) for x0, x1, y0, y1 in segments]
+        remaining = 0.5 * math.fsum(areas)
+        if not remaining > 0.0:
+            return nan
+        for (x0, x1, y0, y1), area in zip(segments, areas):
+            if area < remaining:
+                remaining -= area
+                continue
+            # solves (y1 - y0) / 2 * t^2 + y0 * t = remaining / (x1 - x0) for t in [0, 1]
+            r = remaining / (x1 - x0)
+            denominator = y0 + math.sqrt(max(0.0, y0 * y0 + 2.0 * (y1 - y0) * r))
+            t = 2.0 * r / denominator if denominator > 0.0 else 0.0
+            return x0 + min(1.0, t) * (x1 - x0)
+        return segments[-1][1]
+
+    def defuzzify_exact_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        """
+        Computes `defuzzify_exact` when the activation degrees of the term are arrays
+        :param term: is the term to defuzzify
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the array of bisectors, with nan where they cannot be computed exactly
+        """
+        import numpy as np
+        segments = self.piecewise_linear_array(term, minimum, maximum)
+        if segments is None:
+            return np.asarray(nan)
+        x0, x1, y0, y1 = segments
+        areas = 0.5 * (x1 - x0) * (y0 + y1)
+        cumulative = np.cumsum(areas, axis=-1)
+        half = 0.5 * cumulative[..., -1:]
+        # the bisector is in the first segment whose cumulative area reaches half the area
+        index = np.expand_dims(np.argmax(cumulative >= half, axis=-1), -1)
+        x0, x1, y0, y1, area, remaining = (
+            np.take_along_axis(values, index, axis=-1)[..., 0]
+            for values in (x0, x1, y0, y1, areas, half - cumulative + areas))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = remaining / (x1 - x0)
+            denominator = y0 + np.sqrt(np.maximum(0.0, y0 * y0 + 2.0 * (y1 - y0) * r))
+            t = np.where(denominator > 0.0, 2.0 * r / denominator, 0.0)
+            return np.where(half[..., 0] > 0.0,  # type: ignore
+                            x0 + np.minimum(1.0, t) * (x1 - x0), nan)
+
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        exact = None
+        if self.exact:
+            exact = self.defuzzify_exact_array(term, minimum, maximum)
+            if not np.isnan(exact).any():
+                return exact
+        _, y_left = self.sample_array(term, minimum, maximum)
+        _, y_right = self.sample_array(term, minimum, maximum, from_maximum=True)
+        if not math.isfinite(minimum + maximum):
+            return np.full(y_left.shape[:-1], nan)
+        dx = (maximum - minimum) / self.resolution
+        shape = y_left.shape[:-1]
+        left = np.zeros(shape, dtype=int)
+        right = np.zeros(shape, dtype=int)
+        x_left, x_right = (np.full(shape, minimum), np.full(shape, maximum))
+        left_area, right_area = (np.zeros(shape), np.zeros(shape))
+
+        for _ in range(self.resolution):
+            is_left = left_area <= right_area
+            y = np.take_along_axis(y_left, left[..., np.newaxis], axis=-1)[..., 0]
+            x_left = np.where(is_left, minimum + (left + 0.5) * dx, x_left)
+            left_area = np.where(is_left, left_area + y, left_area)
+            left = left + is_left
+
+            y = np.take_along_axis(y_right, right[..., np.newaxis], axis=-1)[..., 0]
+            x_right = np.where(is_left, x_right, maximum - (right + 0.5) * dx)
+            right_area = np.where(is_left, right_area, right_area + y)
+            right = right + ~is_left
+
+        result = (left_area * x_right + right_area * x_left) / (left_area + right_area)
+        if exact is not None:
+            result = np.where(np.isnan(exact), result, exact)
+        return result  # type: ignore
+
 
 class Centroid(IntegralDefuzzifier):
 
-    def __init__(self, resolution: Optional[int] = None) -> None:
+    def __init__(self, resolution: Optional[int] = None, exact: bool = False) -> None:
+        """
+        Creates the defuzzifier
+        :param resolution: is the number of samples of the membership function
+        :param exact: whether to defuzzify the terms exactly when they are piecewise linear
+        instead of sampling them, which is a setting of this library that is neither
+        configured nor exported in the FuzzyLite Language (the default samples every term to
+        compute the same values as the other fuzzylite libraries)
+        """
         super().__init__(resolution)
+        self.exact = exact
 
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
+        if self.exact:
+            result = self.defuzzify_exact(term, minimum, maximum)
+            if not isnan(result):
+                return result
         resolution = self.resolution
         dx = (maximum - minimum) / resolution
         area = x_centroid = 0.0
@@ -113,6 +444,58 @@ class Centroid(IntegralDefuzzifier):
             area += y
         return x_centroid / area
 
+    def defuzzify_exact(self, term: Term, minimum: float, maximum: float) -> float:
+        """
+        Computes the exact centroid of the term when it is piecewise linear
+        :param term: is the term to defuzzify
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the centroid of the term, or nan if the term is not piecewise linear or its
+        area is not positive
+        """
+        segments = self.piecewise_linear(term, minimum, maximum)
+        if not segments:
+            return nan
+        area = math.fsum(0.5 * (x1 - x0) * (y0 + y1) for x0, x1, y0, y1 in segments)
+        if not area > 0.0:
+            return nan
+        x_centroid = math.fsum((x1 - x0) / 6.0 * (y0 * (2.0 * x0 + x1) + y1 * (x0 + 2.0 * x1))
+                               for x0, x1, y0, y1 in segments)
+        return x_centroid / area
+
+    def defuzzify_exact_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        """
+        Computes `defuzzify_exact` when the activation degrees of the term are arrays
+        :param term: is the term to defuzzify
+        :param minimum: is the minimum value of the range
+        :param maximum: is the maximum value of the range
+        :return: the array of centroids, with nan where they cannot be computed exactly
+        """
+        import numpy as np
+        segments = self.piecewise_linear_array(term, minimum, maximum)
+        if segments is None:
+            return np.asarray(nan)
+        x0, x1, y0, y1 = segments
+        area = (0.5 * (x1 - x0) * (y0 + y1)).sum(axis=-1)
+        x_centroid = ((x1 - x0) / 6.0 * (y0 * (2.0 * x0 + x1) + y1 * (x0 + 2.0 * x1))).sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(area > 0.0, x_centroid / area, nan)  # type: ignore
+
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        exact = None
+        if self.exact:
+            exact = self.defuzzify_exact_array(term, minimum, maximum)
+            if not np.isnan(exact).any():
+                return exact
+        x, y = self.sample_array(term, minimum, maximum)
+        if not math.isfinite(minimum + maximum):
+            return np.full(y.shape[:-1], nan)
+        result = (y * x).sum(axis=-1) / y.sum(axis=-1)
+        if exact is not None:
+            result = np.where(np.isnan(exact), result, exact)
+        return result  # type: ignore
+
 
 class LargestOfMaximum(IntegralDefuzzifier):
 
@@ -134,6 +517,19 @@ class LargestOfMaximum(IntegralDefuzzifier):
                 x_largest = x
         return x_largest
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        x, y = self.sample_array(term, minimum, maximum)
+        if not math.isfinite(minimum + maximum):
+            return np.full(y.shape[:-1], nan)
+        y_max = np.full(y.shape[:-1], -math.inf)
+        x_largest = np.full(y.shape[:-1], maximum)
+        for i in range(self.resolution):
+            is_largest = Op.ge_array(y[..., i], y_max)
+            y_max = np.where(is_largest, y[..., i], y_max)
+            x_largest = np.where(is_largest, x[i], x_largest)
+        return x_largest
+
 
 class MeanOfMaximum(IntegralDefuzzifier):
 
@@ -163,6 +559,25 @@ class MeanOfMaximum(IntegralDefuzzifier):
                 find_x_largest = False
         return (x_largest + x_smallest) / 2.0
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        x, y = self.sample_array(term, minimum, maximum)
+        if not math.isfinite(minimum + maximum):
+            return np.full(y.shape[:-1], nan)
+        y_max = np.full(y.shape[:-1], -math.inf)
+        x_smallest = np.full(y.shape[:-1], minimum)
+        x_largest = np.full(y.shape[:-1], maximum)
+        find_x_largest = np.full(y.shape[:-1], False)
+        for i in range(self.resolution):
+            is_greater = Op.gt_array(y[..., i], y_max)
+            is_equal = ~is_greater & find_x_largest & Op.eq_array(y[..., i], y_max)
+            is_lower = ~is_greater & ~is_equal & Op.lt_array(y[..., i], y_max)
+            y_max = np.where(is_greater, y[..., i], y_max)
+            x_smallest = np.where(is_greater, x[i], x_smallest)
+            x_largest = np.where(is_greater | is_equal, x[i], x_largest)
+            find_x_largest = (find_x_largest | is_greater) & ~is_lower
+        return (x_largest + x_smallest) / 2.0  # type: ignore
+
 
 class SmallestOfMaximum(IntegralDefuzzifier):
 
@@ -184,6 +599,19 @@ class SmallestOfMaximum(IntegralDefuzzifier):
                 x_smallest = x
         return x_smallest
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        x, y = self.sample_array(term, minimum, maximum)
+        if not math.isfinite(minimum + maximum):
+            return np.full(y.shape[:-1], nan)
+        y_max = np.full(y.shape[:-1], -math.inf)
+        x_smallest = np.full(y.shape[:-1], minimum)
+        for i in range(self.resolution):
+            is_greater = Op.gt_array(y[..., i], y_max)
+            y_max = np.where(is_greater, y[..., i], y_max)
+            x_smallest = np.where(is_greater, x[i], x_smallest)
+        return x_smallest
+
 
 class WeightedDefuzzifier(Defuzzifier):
     @enum.unique
@@ -215,6 +643,39 @@ class WeightedDefuzzifier(Defuzzifier):
             return WeightedDefuzzifier.Type.TakagiSugeno
         return WeightedDefuzzifier.Type.Tsukamoto
 
+    def weighted_arrays(self, fuzzy_output: Term) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Computes the weighted sum and the sum of weights of the activated terms whose degrees are
+        arrays. The activated terms contribute only where their activation degrees are not zero.
+        :param fuzzy_output: is the Aggregated term
+        :return: the arrays of weighted sums and sums of weights
+        """
+        import numpy as np
+        if not isinstance(fuzzy_output, Aggregated):
+            raise ValueError(f"expected an Aggregated term, but found {type(fuzzy_output)}")
+
+        if not self.type:
+            raise ValueError("expected a type of defuzzifier, but found none")
+
+        if not fuzzy_output.terms:
+            return np.full((), nan), np.full((), nan)
+
+        this_type = self.type
+        if self.type == WeightedDefuzzifier.Type.Automatic:
+            this_type = self.infer_type(fuzzy_output.terms[0])
+
+        weighted_sum = weights = np.zeros(())
+        for activated in fuzzy_output.terms:
+            w = np.asarray(activated.degree, dtype=float)
+            if this_type == WeightedDefuzzifier.Type.TakagiSugeno:
+                # Provides Takagi-Sugeno and Inverse Tsukamoto of Functions
+                z = activated.term.membership_array(w)
+            else:
+                z = activated.term.tsukamoto_array(w, fuzzy_output.minimum, fuzzy_output.maximum)
+            weighted_sum = weighted_sum + np.where(w != 0.0, w * z, 0.0)
+            weights = weights + w
+        return weighted_sum, weights
+
 
 class WeightedAverage(WeightedDefuzzifier):
 
@@ -253,6 +714,11 @@ class WeightedAverage(WeightedDefuzzifier):
 
         return weighted_sum / weights
 
+    def defuzzify_array(self, fuzzy_output: Term,
+                        unused_minimum: float = nan, unused_maximum: float = nan) -> 'np.ndarray':
+        weighted_sum, weights = self.weighted_arrays(fuzzy_output)
+        return weighted_sum / weights  # type: ignore
+
 
 class WeightedSum(WeightedDefuzzifier):
 
@@ -288,3 +754,8 @@ class WeightedSum(WeightedDefuzzifier):
                 weighted_sum += w * z
 
         return weighted_sum
+
+    def defuzzify_array(self, fuzzy_output: Term,
+                        unused_minimum: float = nan, unused_maximum: float = nan) -> 'np.ndarray':
+        weighted_sum, _ = self.weighted_arrays(fuzzy_output)
+        return weighted_sum
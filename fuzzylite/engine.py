@@ -15,19 +15,32 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
-__all__ = ["Engine"]
+__all__ = ["Engine", "LookupTableEngine"]
 
+import array
 import enum
-from math import nan
-from typing import Iterable, List, Optional, Tuple, Union
+import sys
+import typing
+from math import inf, isnan, nan
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from .activation import Activation
+from . import context as _context
+from .activation import Activation, General
+from .context import Context
 from .defuzzifier import Defuzzifier
 from .exporter import FllExporter
+from .named import NamedList
 from .norm import SNorm, TNorm
-from .rule import RuleBlock
+from .profiler import Profiler
+from .rule import Rule, RuleBlock
+from .term import Activated
 from .variable import InputVariable, OutputVariable, Variable
 
+if typing.TYPE_CHECKING:
+    from pathlib import Path  # noqa: F401
+
+    import numpy as np  # noqa: F401
+
 
 class Engine:
     @enum.unique
@@ -42,15 +55,17 @@ class Engine:
                  load_rules: bool = False) -> None:
         self.name = name
         self.description = description
-        self.input_variables: List[InputVariable] = []
-        self.output_variables: List[OutputVariable] = []
-        self.rule_blocks: List[RuleBlock] = []
+        self.input_variables: List[InputVariable] = NamedList()
+        self.output_variables: List[OutputVariable] = NamedList()
+        self.rule_blocks: List[RuleBlock] = NamedList()
         if input_variables:
             self.input_variables.extend(input_variables)
         if output_variables:
             self.output_variables.extend(output_variables)
         if rule_blocks:
             self.rule_blocks.extend(rule_blocks)
+        self._increment: Optional[_Increment] = None
+        self.profiler: Optional[Profiler] = None
         if load_rules:
             for rb in self.rule_blocks:
                 rb.load_rules(self)
@@ -95,65 +110,511 @@ class Engine:
         return [*self.input_variables, *self.output_variables]
 
     def variable(self, name: str) -> Variable:
-        for variable in self.variables:
-            if variable.name == name:
-                return variable
+        variable: Optional[Variable] = NamedList.search(self.input_variables, name)
+        if variable is None:
+            variable = NamedList.search(self.output_variables, name)
+        if variable is not None:
+            return variable
         raise ValueError(f"variable '{name}' not found in {v.name for v in self.variables}")
 
     def input_variable(self, name: str) -> InputVariable:
-        for variable in self.input_variables:
-            if variable.name == name:
-                return variable
+        variable = NamedList.search(self.input_variables, name)
+        if variable is not None:
+            return variable
         raise ValueError(f"input variable '{name}' not found in "
                          f"{v.name for v in self.input_variables}")
 
     def output_variable(self, name: str) -> OutputVariable:
-        for variable in self.output_variables:
-            if variable.name == name:
-                return variable
+        variable = NamedList.search(self.output_variables, name)
+        if variable is not None:
+            return variable
         raise ValueError(f"output variable '{name}' not found in "
                          f"{v.name for v in self.output_variables}")
 
     def rule_block(self, name: str) -> RuleBlock:
-        for block in self.rule_blocks:
-            if block.name == name:
-                return block
+        block = NamedList.search(self.rule_blocks, name)
+        if block is not None:
+            return block
         raise ValueError(f"rule block '{name}' not found in {r.name for r in self.rule_blocks}")
 
+    @property
+    def _incremental(self) -> Optional['_Increment']:
+        context = Context.current() if _context._active else None
+        return self._increment if context is None else context.increments.get(self)
+
+    @_incremental.setter
+    def _incremental(self, value: Optional['_Increment']) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._increment = value
+        elif value is None:
+            context.increments.pop(self, None)
+        else:
+            context.increments[self] = value
+
     def restart(self) -> None:
+        self._incremental = None
         for input_variable in self.input_variables:
             input_variable.value = nan
 
         for output_variable in self.output_variables:
             output_variable.clear()
 
-    def process(self) -> None:
-        from . import lib
+    def process(self, incremental: bool = False) -> None:
+        """
+        Processes the values of the input variables into the values of the output variables.
+        :param incremental: whether to activate only the rules whose antecedents reference the
+        input variables that changed since the previous incremental process (or any output
+        variable), keeping the terms activated by the other rules in the fuzzy outputs. Only rule
+        blocks with General activation are activated incrementally, and the rules over terms
+        whose membership depends on other values (see `InputVariable.is_dependent`) are always
+        activated. Changes to the variables, rule blocks and antecedents of the rules activate
+        all the rules, but changes to the terms and to the weights of the rules require
+        restarting the engine or processing it non-incrementally.
+
+        The fuzzy outputs and their activated terms are valid until the next process, which
+        clears the fuzzy outputs and reuses the activated terms (outside of contexts), hence the
+        activated terms must be copied (eg, with `copy.copy`) to keep them.
+
+        If the engine has a profiler, the time spent in each stage is recorded in the profiler.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            clock = profiler.clock
+            start = clock()
+
+        if not incremental:
+            self._incremental = None
 
         # Clear output values
         for variable in self.output_variables:
             variable.fuzzy.clear()
 
-        if lib.debugging:
-            pass
+        # Fuzzify input values
+        increment = self._start_increment() if incremental else None
+        changed = [input_variable for input_variable in self.input_variables
+                   if increment is None or increment.update(input_variable)]
+        for input_variable in changed:
+            if input_variable.enabled:
+                input_variable.fuzzify_terms()
+        if increment is not None:
+            # the rules over terms that depend on other values are activated as if changed
+            changed.extend(input_variable for input_variable in self.input_variables
+                           if input_variable not in changed
+                           and any(InputVariable.is_dependent(term)
+                                   for term in input_variable.terms))
+
+        if profiler is not None:
+            profiler.fuzzified(self, clock() - start)
 
         # Activate rule blocks
+        if increment is None:
+            self._activate()
+        else:
+            try:
+                self._activate_increment(increment, changed)
+            except BaseException:
+                self._incremental = None
+                raise
+
+        # Defuzzify output variables
+        for variable in self.output_variables:
+            if profiler is None:
+                variable.defuzzify()
+            else:
+                begin = clock()
+                variable.defuzzify()
+                profiler.defuzzified(variable, clock() - begin)
+
+        if profiler is not None:
+            profiler.processed(self, clock() - start)
+
+    def _activate(self) -> None:
+        profiler = self.profiler
         for block in self.rule_blocks:
-            if block.enabled:
+            if not block.enabled:
+                continue
+            if profiler is None:
+                block.activate()
+            else:
+                start = profiler.clock()
                 block.activate()
+                self._activated(profiler, block, start)
 
-        if lib.debugging:
-            pass
+    @staticmethod
+    def _activated(profiler: Profiler, block: RuleBlock, start: float) -> None:
+        # records the time spent activating the rule block since the start and the rules it fired
+        profiler.activated(block, profiler.clock() - start,
+                           sum(1 for rule in block.rules if rule.triggered))
 
-        # Defuzzify output variables
-        for variable in self.output_variables:
-            variable.defuzzify()
+    def _start_increment(self) -> '_Increment':
+        # the incremental state is discarded when the variables or the rule blocks change
+        key = (tuple(self.input_variables),
+               tuple((variable, variable.enabled) for variable in self.output_variables),
+               tuple((block, block.enabled, block.conjunction, block.disjunction,
+                      block.implication, block.activation) for block in self.rule_blocks))
+        increment = self._incremental
+        if increment is None or increment.key != key:
+            increment = self._incremental = _Increment(key)
+        return increment
+
+    def _activate_increment(self, increment: '_Increment',
+                            changed: List[InputVariable]) -> None:
+        outputs = [variable.fuzzy.terms for variable in self.output_variables]
+        profiler = self.profiler
+        for block in self.rule_blocks:
+            if not block.enabled:
+                continue
+            if profiler is not None:
+                start = profiler.clock()
+            if type(block.activation) is not General:
+                block.activate()
+                if profiler is not None:
+                    self._activated(profiler, block, start)
+                continue
+
+            dependencies = block.dependencies()
+            dirty: Optional[Set[Rule]] = None
+            if increment.dependencies.get(block) is dependencies:
+                # rules that depend on output variables are always activated
+                dirty = set()
+                for variable in [*changed, *self.output_variables]:
+                    dirty.update(dependencies.get(variable, ()))
+            increment.dependencies[block] = dependencies
+
+            conjunction = block.conjunction
+            disjunction = block.disjunction
+            implication = block.implication
+            block._fired = None  # the rules activated incrementally are not tracked
+            for rule in block.rules:
+                if dirty is None or rule in dirty:
+                    rule.deactivate()
+                    increment.activated.pop(rule, None)
+                    if rule.is_loaded():
+                        sizes = [len(terms) for terms in outputs]
+                        rule.activate_with(conjunction, disjunction)
+                        rule.trigger(implication)
+                        activated = [(index, term) for index, terms in enumerate(outputs)
+                                     for term in terms[sizes[index]:]]
+                        if activated:
+                            increment.activated[rule] = activated
+                else:
+                    for index, term in increment.activated.get(rule, ()):
+                        outputs[index].append(term)
+            if profiler is not None:
+                self._activated(profiler, block, start)
+
+    def process_batch(self, inputs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Processes a batch of inputs at once, as if each row of inputs were set as the values of
+        the input variables before calling `process`, but using arrays of values throughout.
+        The batch is processed in its own Context, leaving the state of the engine unchanged.
+        Unlike `process`, arithmetic errors result in nan values instead of raising exceptions.
+        :param inputs: is a matrix of shape (rows, number of input variables)
+        :return: the matrix of shape (rows, number of output variables) with the output values
+        """
+        import numpy as np
+        inputs = np.asarray(inputs, dtype=float)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.input_variables):
+            raise ValueError(f"expected a matrix of inputs with shape "
+                             f"(rows, {len(self.input_variables)}), but found {inputs.shape}")
+        rows = inputs.shape[0]
+        outputs = np.full((rows, len(self.output_variables)), nan)
+
+        # the batch is processed in its own context to leave the state of the engine unchanged
+        context = Context()
+        for output_variable in self.output_variables:
+            context.values[output_variable] = output_variable.value
+            context.previous_values[output_variable] = output_variable.previous_value
+        for index, input_variable in enumerate(self.input_variables):
+            value = inputs[:, index]
+            if input_variable.lock_range:
+                value = np.clip(value, input_variable.minimum, input_variable.maximum)
+            context.values[input_variable] = value  # type: ignore
 
-        if lib.debugging:
-            pass
+        with context, np.errstate(all='ignore'):
+            for block in self.rule_blocks:
+                if block.enabled:
+                    block.activate_batch()
+
+            for index, output_variable in enumerate(self.output_variables):
+                outputs[:, index] = output_variable.defuzzify_batch(rows)
+        return outputs
 
     def is_ready(self) -> Tuple[bool, str]:
         raise NotImplementedError()
 
     def infer_type(self) -> Tuple['Engine.Type', str]:
         raise NotImplementedError()
+
+
+class _Increment:
+    """
+      The _Increment class holds the state of the incremental processing of an engine, namely
+      the values of the input variables last processed, the dependencies of the rule blocks last
+      activated, and the terms activated by each rule to keep in the fuzzy outputs while the
+      rule is not activated again.
+    """
+
+    def __init__(self, key: Tuple[object, ...]) -> None:
+        self.key = key
+        self.values: Dict[InputVariable, Tuple[bool, float]] = {}
+        self.dependencies: Dict[RuleBlock, Dict[Variable, List[Rule]]] = {}
+        self.activated: Dict[Rule, List[Tuple[int, Activated]]] = {}
+
+    def update(self, variable: InputVariable) -> bool:
+        """
+        Records the value of the input variable and whether it is enabled.
+        :param variable: is the input variable
+        :return: whether the value or the enabled state changed since the previous record
+        """
+        enabled, value = variable.enabled, variable.value
+        previous = self.values.get(variable)
+        self.values[variable] = (enabled, value)
+        return (previous is None or previous[0] != enabled
+                or not (previous[1] == value or (isnan(previous[1]) and isnan(value))))
+
+
+class LookupTableEngine:
+    """
+      The LookupTableEngine class is a surrogate of an Engine that answers queries by multilinear
+      interpolation of the output values precomputed on a regular grid over the ranges of the
+      input variables, thereby computing each output in constant time regardless of the number of
+      rules and terms of the engine. The grid is sampled in the same order and with the same
+      values as `FldExporter.write_from_scope` with `resolution + 1` values per input variable.
+      The tables can be saved to and loaded from binary files to build them offline. The values
+      of the grid that are nan (eg, where no rules are activated) are left out of the
+      interpolation, whose weights are distributed among the other corners of the cell.
+
+      @see Engine
+      @see FldExporter
+      @since 7.0
+    """
+
+    # identifies the binary files of lookup tables
+    MAGIC = b"fuzzylite-lut 1\n"
+
+    def __init__(self, name: str = "",
+                 inputs: Optional[Iterable[Tuple[str, float, float]]] = None,
+                 outputs: Optional[Iterable[str]] = None,
+                 resolution: int = 1,
+                 table: Optional[Iterable[float]] = None,
+                 error: Optional[Iterable[float]] = None) -> None:
+        """
+        Creates the lookup table.
+        :param name: is the name of the engine
+        :param inputs: is the list of (name, minimum, maximum) of the input variables
+        :param outputs: is the list of names of the output variables
+        :param resolution: is the number of intervals into which each input range is divided
+        :param table: is the flat table of output values, where the values of the output variables
+        are contiguous, and the grid values of the last input variable change the fastest
+        :param error: is the sampled estimate of the absolute error of each output variable
+        """
+        self.name = name
+        self.inputs: List[Tuple[str, float, float]] = list(inputs) if inputs else []
+        self.outputs: List[str] = list(outputs) if outputs else []
+        self.resolution = resolution
+        self.table = array.array('d', table if table is not None else [])
+        self.error: List[float] = list(error) if error is not None else [nan] * len(self.outputs)
+
+        if resolution < 1:
+            raise ValueError(f"expected a resolution of at least 1, but found {resolution}")
+        expected = (resolution + 1) ** len(self.inputs) * len(self.outputs)
+        if len(self.table) != expected:
+            raise ValueError(f"expected a table of {expected} values, "
+                             f"but found {len(self.table)}")
+
+        # the offsets and corners of the cells, where the bits of the corners indicate whether
+        # the upper (bit on) or lower (bit off) grid value of each input variable is used
+        self._strides = [(resolution + 1) ** (len(self.inputs) - 1 - i)
+                         for i in range(len(self.inputs))]
+        self._corners = [(sum(stride for i, stride in enumerate(self._strides) if corner >> i & 1),
+                          corner) for corner in range(2 ** len(self.inputs))]
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}: {self.name} "
+                f"[{', '.join(name for name, *_ in self.inputs)}] -> [{', '.join(self.outputs)}] "
+                f"resolution={self.resolution} error={self.error}")
+
+    @staticmethod
+    def create(engine: Engine, resolution: int = 32,
+               chunk_size: int = 4096) -> 'LookupTableEngine':
+        """
+        Creates the lookup table of the engine by processing the values on the grid, and
+        estimates the error of the table as the maximum absolute error sampled at the centers of
+        the cells, which is not a bound of the interpolation error elsewhere.
+        The engine is processed with `Engine.process_batch` (requires numpy), so its state remains
+        unchanged and arithmetic errors result in nan values.
+        :param engine: is the engine to sample, whose input variables must have finite ranges
+        :param resolution: is the number of intervals into which each input range is divided
+        :param chunk_size: is the number of rows of inputs to process per batch
+        :return: the lookup table of the engine
+        """
+        import numpy as np
+        for iv in engine.input_variables:
+            if not (np.isfinite(iv.minimum) and np.isfinite(iv.maximum)):
+                raise ValueError(f"expected a finite range in input variable '{iv.name}', "
+                                 f"but found [{iv.minimum}, {iv.maximum}]")
+        if resolution < 1:
+            raise ValueError(f"expected a resolution of at least 1, but found {resolution}")
+
+        def sample(columns: List['np.ndarray']) -> 'np.ndarray':
+            shape = tuple(len(column) for column in columns)
+            rows = int(np.prod(shape))
+            outputs = np.empty((rows, len(engine.output_variables)))
+            for start in range(0, rows, chunk_size):
+                indices = np.unravel_index(np.arange(start, min(start + chunk_size, rows)), shape)
+                inputs = np.column_stack([column[index]
+                                          for column, index in zip(columns, indices)])
+                outputs[start:start + chunk_size] = engine.process_batch(
+                    inputs.reshape(-1, len(columns)))
+            return outputs
+
+        steps = [iv.drange / resolution for iv in engine.input_variables]
+        grid = [iv.minimum + np.arange(resolution + 1) * step
+                for iv, step in zip(engine.input_variables, steps)]
+        result = LookupTableEngine(
+            engine.name,
+            [(iv.name, iv.minimum, iv.maximum) for iv in engine.input_variables],
+            [ov.name for ov in engine.output_variables],
+            resolution,
+            array.array('d', sample(grid).tobytes()))
+
+        # the error is sampled at the centers of the cells, which are the farthest points from
+        # the grid values, counting as infinite the values that are nan in either
+        centers = [column[:-1] + 0.5 * step for column, step in zip(grid, steps)]
+        expected = sample(centers)
+        obtained = result.process_batch(np.column_stack(
+            [column.ravel() for column in np.meshgrid(*centers, indexing='ij')]
+        ).reshape(-1, len(centers)))
+        with np.errstate(invalid='ignore'):
+            error = np.abs(expected - obtained)
+        error[np.isnan(expected) & np.isnan(obtained)] = 0.0
+        error[np.isnan(error)] = inf
+        result.error = [float(e) for e in error.max(axis=0, initial=0.0)]
+        return result
+
+    def _cell(self, index: int, value: float) -> Tuple[int, float]:
+        # computes the lower grid index and the fraction of the cell in which the value lies
+        _, minimum, maximum = self.inputs[index]
+        if not maximum > minimum:
+            return 0, 0.0
+        position = (min(max(value, minimum), maximum) - minimum) / (maximum - minimum)
+        position *= self.resolution
+        lower = min(int(position), self.resolution - 1)
+        return lower, position - lower
+
+    def process(self, inputs: Iterable[float]) -> List[float]:
+        """
+        Computes the output values by multilinear interpolation of the table, where the input
+        values outside the ranges are clipped to the ranges, and the corners of the cell whose
+        values are nan are left out, resulting in nan only if all of the weighted corners are nan.
+        :param inputs: is the list of input values in the order of the input variables
+        :return: the list of output values in the order of the output variables
+        """
+        inputs = list(inputs)
+        if len(inputs) != len(self.inputs):
+            raise ValueError(f"expected {len(self.inputs)} input values, "
+                             f"but found {len(inputs)}")
+        base = 0
+        fractions = []
+        for index, value in enumerate(inputs):
+            if isnan(value):
+                return [nan] * len(self.outputs)
+            lower, fraction = self._cell(index, value)
+            base += lower * self._strides[index]
+            fractions.append(fraction)
+
+        outputs = len(self.outputs)
+        result = [0.0] * outputs
+        weights = [0.0] * outputs
+        for offset, corner in self._corners:
+            weight = 1.0
+            for index, fraction in enumerate(fractions):
+                weight *= fraction if corner >> index & 1 else 1.0 - fraction
+            # corners without weight are skipped, and so are the corners with nan values
+            if weight:
+                start = (base + offset) * outputs
+                for output in range(outputs):
+                    value = self.table[start + output]
+                    if not isnan(value):
+                        result[output] += weight * value
+                        weights[output] += weight
+        return [value / weight if weight else nan for value, weight in zip(result, weights)]
+
+    def process_batch(self, inputs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the output values of a batch of inputs at once (requires numpy).
+        :param inputs: is a matrix of shape (rows, number of input variables)
+        :return: the matrix of shape (rows, number of output variables) with the output values
+        @see process
+        """
+        import numpy as np
+        inputs = np.asarray(inputs, dtype=float)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.inputs):
+            raise ValueError(f"expected a matrix of inputs with shape "
+                             f"(rows, {len(self.inputs)}), but found {inputs.shape}")
+        table = np.frombuffer(self.table, dtype=float).reshape(-1, len(self.outputs))
+        base = np.zeros(inputs.shape[0], dtype=np.intp)
+        fractions = np.zeros_like(inputs)
+        for index, (_, minimum, maximum) in enumerate(self.inputs):
+            if maximum > minimum:
+                position = (np.clip(inputs[:, index], minimum, maximum) - minimum) \
+                    / (maximum - minimum) * self.resolution
+                lower = np.minimum(np.nan_to_num(position).astype(np.intp), self.resolution - 1)
+                base += lower * self._strides[index]
+                fractions[:, index] = position - lower
+
+        result = np.zeros((inputs.shape[0], len(self.outputs)))
+        weights = np.zeros_like(result)
+        for offset, corner in self._corners:
+            weight = np.ones(inputs.shape[0])
+            for index in range(len(self.inputs)):
+                fraction = fractions[:, index]
+                weight *= fraction if corner >> index & 1 else 1.0 - fraction
+            values = table[base + offset]
+            weight = np.where((weight[:, np.newaxis] == 0.0) | np.isnan(values),
+                              0.0, weight[:, np.newaxis])
+            result += np.where(weight == 0.0, 0.0, weight * values)
+            weights += weight
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.where(weights == 0.0, nan, result / weights)
+        result[np.isnan(inputs).any(axis=1)] = nan
+        return result
+
+    def save(self, path: Union[str, 'Path']) -> None:
+        """
+        Saves the lookup table to a binary file, which consists of the magic line, a line with
+        the properties of the table in JSON, and the values of the table as little-endian doubles.
+        :param path: is the path of the file
+        """
+        import json
+        header = json.dumps({"name": self.name, "inputs": self.inputs, "outputs": self.outputs,
+                             "resolution": self.resolution, "error": self.error})
+        table = array.array('d', self.table)
+        if sys.byteorder != "little":
+            table.byteswap()
+        with open(path, "wb") as file:
+            file.write(LookupTableEngine.MAGIC)
+            file.write(header.encode() + b"\n")
+            table.tofile(file)
+
+    @staticmethod
+    def load(path: Union[str, 'Path']) -> 'LookupTableEngine':
+        """
+        Loads the lookup table from a binary file.
+        :param path: is the path of the file
+        :return: the lookup table
+        @see save
+        """
+        import json
+        with open(path, "rb") as file:
+            if file.readline() != LookupTableEngine.MAGIC:
+                raise ValueError(f"expected a lookup table in file '{path}'")
+            header = json.loads(file.readline())
+            table = array.array('d', file.read())
+        if sys.byteorder != "little":
+            table.byteswap()
+        return LookupTableEngine(header["name"],
+                                 [tuple(i) for i in header["inputs"]],  # type: ignore
+                                 header["outputs"], header["resolution"], table, header["error"])
@@ -15,23 +15,31 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
-__all__ = ["Exporter", "FllExporter", "PythonExporter", "FldExporter"]
+__all__ = ["Exporter", "FllExporter", "PythonExporter", "FldExporter", "BinaryExporter"]
 
 import enum
 import io
+import itertools
 import math
+import struct
+import sys
+import time
 import typing
-from pathlib import Path
-from typing import Any, IO, List, Optional, Set, Union
+from array import array
+from typing import Any, Callable, Dict, IO, List, Optional, Set, Tuple, Type, Union
 
 from .operation import Op
 
 if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+
     from .activation import Activation  # noqa: F401
     from .defuzzifier import Defuzzifier  # noqa: F401
     from .engine import Engine
     from .norm import Norm  # noqa: F401
-    from .rule import Rule, RuleBlock
+    from .rule import Expression, Proposition, Rule, RuleBlock
     from .term import Term
     from .variable import InputVariable, OutputVariable, Variable
 
@@ -45,7 +53,8 @@ class Exporter:
     def to_string(self, instance: object) -> str:
         raise NotImplementedError()
 
-    def to_file(self, path: Union[str, Path], instance: object) -> None:
+    def to_file(self, path: Union[str, 'Path'], instance: object) -> None:
+        from pathlib import Path
         if isinstance(path, str):
             path = Path(path)
         with path.open(mode='w') as fll:
@@ -363,7 +372,7 @@ class PythonExporter(Exporter):
                        f"{self.format(term.name)}, ",
                        "[",
                        ", ".join(self.format(value)
-                                 for value in Discrete.values_from(term.xy)),
+                                 for value in term.values()),
                        "]"
                        ")"]
         elif isinstance(term, Function):
@@ -411,6 +420,8 @@ class PythonExporter(Exporter):
 
 
 class FldExporter(Exporter):
+    MAGIC = b"fuzzylite-fld 1\n"
+
     @enum.unique
     class ScopeOfValues(enum.Enum):
         EachVariable, AllVariables = range(2)
@@ -419,19 +430,36 @@ class FldExporter(Exporter):
                  separator: str = " ",
                  headers: bool = True,
                  input_values: bool = True,
-                 output_values: bool = True) -> None:
+                 output_values: bool = True,
+                 workers: int = 1,
+                 chunk_size: int = 1024) -> None:
+        """
+        :param separator: is the separator of the values
+        :param headers: whether to write the names of the variables in the first line
+        :param input_values: whether to write the values of the input variables
+        :param output_values: whether to write the values of the output variables
+        :param workers: is the number of processes to write the values from a scope (see
+        `write_from_scope`), where values are written by the current process if workers <= 1
+        :param chunk_size: is the number of rows of values each worker processes at a time, and
+        the number of rows `write_from_reader` processes and writes at a time
+        """
         self.separator = separator
         self.headers = headers
         self.input_values = input_values
         self.output_values = output_values
+        self.workers = workers
+        self.chunk_size = chunk_size
 
     def header(self, engine: 'Engine') -> str:
+        return self.separator.join(self.names(engine))
+
+    def names(self, engine: 'Engine') -> List[str]:
         result: List[str] = []
         if self.input_values:
             result += [iv.name for iv in engine.input_variables]
         if self.output_values:
             result += [ov.name for ov in engine.output_variables]
-        return self.separator.join(result)
+        return result
 
     def to_string(self, instance: object) -> str:
         from .engine import Engine
@@ -452,7 +480,7 @@ class FldExporter(Exporter):
 
     def to_file_from_scope(
             self,
-            path: Path,
+            path: 'Path',
             engine: 'Engine',
             values: int = 1024,
             scope: ScopeOfValues = ScopeOfValues.AllVariables,
@@ -469,18 +497,33 @@ class FldExporter(Exporter):
             scope: ScopeOfValues,
             active_variables: Optional[Set['InputVariable']] = None
     ) -> None:
+        """
+        Writes the values of the engine processing the inputs sampled from the scope, where the
+        last input variable changes the fastest. When the exporter has multiple workers, the rows
+        are partitioned in chunks processed by a pool of processes, each with a pickled copy of
+        the engine, and written in the same order. Unlike processing the rows in the current
+        process, the state of the engine is not modified, and output variables locking previous
+        values do not carry them over from one chunk to the next.
+        :param engine: is the engine to process the inputs
+        :param writer: is the output where the values will be written
+        :param values: is the number of values to sample
+        :param scope: is the scope of the values to sample
+        :param active_variables: is the set of input variables to sample, such that the other
+        input variables keep their current values
+        :raises ValueError: if the exporter has multiple workers and the engine cannot be pickled
+        """
         if active_variables is None:
             active_variables = set(engine.input_variables)
 
         if self.headers:
             writer.writelines(self.header(engine) + "\n")
 
-        if scope == FldExporter.ScopeOfValues.AllVariables:
-            if len(engine.input_variables) == 0:
-                raise ValueError("expected input variables in engine, but got none")
-            resolution = -1 + max(1, int(pow(values, (1.0 / len(engine.input_variables)))))
-        else:
-            resolution = values - 1
+        resolution = self._resolution(engine, values, scope)
+
+        if self.workers > 1:
+            columns = self._columns(engine, resolution, active_variables)
+            self._write_in_parallel(engine, writer, columns)
+            return
 
         sample_values = [0] * len(engine.input_variables)
         min_values = [0] * len(engine.input_variables)
@@ -503,39 +546,301 @@ class FldExporter(Exporter):
 
             incremented = Op.increment(sample_values, min_values, max_values)
 
-    def to_string_from_reader(self, engine: 'Engine', reader: IO[str], skip_lines: int = 0) -> str:
+    def _resolution(self, engine: 'Engine', values: int, scope: ScopeOfValues) -> int:
+        # the number of divisions of the ranges of the input variables to sample the values
+        if scope == FldExporter.ScopeOfValues.AllVariables:
+            if len(engine.input_variables) == 0:
+                raise ValueError("expected input variables in engine, but got none")
+            return -1 + max(1, int(pow(values, (1.0 / len(engine.input_variables)))))
+        return values - 1
+
+    def _columns(self, engine: 'Engine', resolution: int,
+                 active_variables: Set['InputVariable']) -> List[List[float]]:
+        # the values sampled per input variable, whose cartesian product are the rows of inputs
+        return [[iv.minimum + sample * iv.drange / max(1.0, resolution)
+                 for sample in range(resolution + 1)]
+                if iv in active_variables else [iv.value]
+                for iv in engine.input_variables]
+
+    def _write_in_parallel(self, engine: 'Engine', writer: IO[str],
+                           columns: List[List[float]]) -> None:
+        # the rows are the cartesian product of the columns of input values
+        import multiprocessing
+        import pickle
+        from collections import deque
+        from . import lib
+
+        # the engine is pickled (rather than exported to FLL) to keep the state of its components
+        try:
+            data = pickle.dumps(engine, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(f"expected an engine that can be pickled to write the values "
+                             f"in parallel, but found: {error}") from error
+
+        rows = 1
+        for column in columns:
+            rows *= len(column)
+        chunk_size = max(1, self.chunk_size)
+
+        with multiprocessing.Pool(self.workers, initializer=_initialize_fld_worker,
+                                  initargs=(data, self, columns, lib.decimals,
+                                            lib.abs_tolerance,
+                                            lib.floating_point_type)) as pool:
+            # results are written in order, keeping a bounded number of chunks in progress
+            pending: typing.Deque['multiprocessing.pool.AsyncResult[str]'] = deque()
+            for start in range(0, rows, chunk_size):
+                pending.append(pool.apply_async(_write_fld_chunk,
+                                                (start, min(start + chunk_size, rows))))
+                if len(pending) > 2 * self.workers:
+                    writer.write(pending.popleft().get())
+            while pending:
+                writer.write(pending.popleft().get())
+
+    def to_string_from_reader(self, engine: 'Engine', reader: IO[str], skip_lines: int = 0,
+                              batch: bool = False,
+                              progress: Optional[Callable[[int, float], None]] = None) -> str:
         writer = io.StringIO()
-        self.write_from_reader(engine, writer, reader, skip_lines)
+        self.write_from_reader(engine, writer, reader, skip_lines, batch, progress)
         return writer.getvalue()
 
     def to_file_from_reader(
             self,
-            path: Path,
+            path: 'Path',
             engine: 'Engine',
             reader: IO[str],
-            skip_lines: int = 0
+            skip_lines: int = 0,
+            batch: bool = False,
+            progress: Optional[Callable[[int, float], None]] = None
     ) -> None:
         with path.open('w') as writer:
-            self.write_from_reader(engine, writer, reader, skip_lines)
+            self.write_from_reader(engine, writer, reader, skip_lines, batch, progress)
 
     def write_from_reader(
             self,
             engine: 'Engine',
             writer: IO[str],
             reader: IO[str],
-            skip_lines: int = 0
+            skip_lines: int = 0,
+            batch: bool = False,
+            progress: Optional[Callable[[int, float], None]] = None
     ) -> None:
+        """
+        Writes the values of the engine processing the rows of input values read from the reader.
+        The reader is read line by line, and the rows are processed in chunks of `chunk_size`
+        rows whose values are written at once, such that the memory used does not depend on the
+        number of rows.
+        :param engine: is the engine to process the inputs
+        :param writer: is the output where the values will be written
+        :param reader: is the input with the rows of input values separated by whitespace, where
+        empty lines and lines starting with `#` are ignored
+        :param skip_lines: is the number of lines to skip at the start of the reader
+        :param batch: whether to process each chunk at once with `Engine.process_batch`
+        (requires numpy), which is faster, but the state of the engine is not modified, output
+        variables locking previous values do not carry them over from one row to the next, and
+        arithmetic errors result in nan values instead of raising exceptions
+        :param progress: is the function called after writing each chunk with the number of rows
+        written so far and the number of rows written per second
+        """
         if self.headers:
-            writer.writelines(self.header(engine) + "\n")
+            writer.write(self.header(engine) + "\n")
+        chunk_size = max(1, self.chunk_size)
         active_variables = set(engine.input_variables)
-        for i, line in enumerate(reader.readlines()):
-            if i < skip_lines:
-                continue
+
+        rows = 0
+        start = time.perf_counter()
+        chunk: List[List[str]] = []
+        for line in itertools.islice(reader, skip_lines, None):
             line = line.strip()
             if not line or line[0] == '#':
                 continue
-            input_values = [Op.scalar(x) for x in line.split()]
-            self.write(engine, writer, input_values, active_variables)
+            chunk.append(line.split())
+            if len(chunk) == chunk_size:
+                rows += self._write_chunk(engine, writer, chunk, batch, active_variables)
+                chunk = []
+                if progress:
+                    progress(rows, rows / max(time.perf_counter() - start, 1e-9))
+        if chunk:
+            rows += self._write_chunk(engine, writer, chunk, batch, active_variables)
+            if progress:
+                progress(rows, rows / max(time.perf_counter() - start, 1e-9))
+
+    def _write_chunk(self, engine: 'Engine', writer: IO[str], chunk: List[List[str]],
+                     batch: bool, active_variables: Set['InputVariable']) -> int:
+        # writes the values of the rows of the chunk at once, and returns the number of rows
+        if not batch:
+            # the rows processed before a row that raises an error are written anyway, like
+            # writing the rows one at a time
+            lines: List[str] = []
+            try:
+                for row in chunk:
+                    lines.append(
+                        self._values(engine, [Op.scalar(x) for x in row], active_variables))
+            finally:
+                writer.write("".join(lines))
+            return len(chunk)
+
+        from . import lib
+        for row in chunk:
+            if len(row) < len(engine.input_variables):
+                raise ValueError(f"not enough input values ({len(row)}) "
+                                 f"for the input variables ({len(engine.input_variables)})")
+        values = self._process_batch(
+            engine, [row[:len(engine.input_variables)] for row in chunk])
+        row_format = self.separator.join([f"{{:.{lib.decimals}f}}"] * values.shape[1]) + "\n"
+        writer.write("".join(row_format.format(*row) for row in values.tolist()))
+        return len(chunk)
+
+    def _process_batch(self, engine: 'Engine',
+                       inputs: Union['np.ndarray', List[List[str]]]) -> 'np.ndarray':
+        # processes the rows of inputs at once, and returns the matrix of values to export
+        import numpy as np
+        inputs = np.array(inputs, dtype=float).reshape(len(inputs), len(engine.input_variables))
+        for index, input_variable in enumerate(engine.input_variables):
+            if input_variable.lock_range:
+                inputs[:, index] = np.clip(inputs[:, index], input_variable.minimum,
+                                           input_variable.maximum)
+        columns = []
+        if self.input_values:
+            columns.append(inputs)
+        if self.output_values:
+            columns.append(engine.process_batch(inputs))
+        return np.hstack(columns) if columns else np.empty((len(inputs), 0))
+
+    def to_array_from_scope(
+            self,
+            engine: 'Engine',
+            values: int = 1024,
+            scope: ScopeOfValues = ScopeOfValues.AllVariables,
+            active_variables: Optional[Set['InputVariable']] = None
+    ) -> 'np.ndarray':
+        """
+        Computes the values of the engine processing the inputs sampled from the scope (see
+        `write_from_scope`) in batches of `chunk_size` rows (requires numpy). The batches are
+        processed with `Engine.process_batch`, which leaves the state of the engine unchanged.
+        :param engine: is the engine to process the inputs
+        :param values: is the number of values to sample
+        :param scope: is the scope of the values to sample
+        :param active_variables: is the set of input variables to sample, such that the other
+        input variables keep their current values
+        :return: the matrix of values with a row per input sampled and the columns in `names`
+        """
+        import numpy as np
+        if active_variables is None:
+            active_variables = set(engine.input_variables)
+        columns = [np.array(column) for column in
+                   self._columns(engine, self._resolution(engine, values, scope),
+                                 active_variables)]
+        shape = tuple(len(column) for column in columns)
+        rows = int(np.prod(shape))
+        chunk_size = max(1, self.chunk_size)
+        result = np.empty((rows, len(self.names(engine))))
+        for start in range(0, rows, chunk_size):
+            batch = np.arange(start, min(start + chunk_size, rows))
+            inputs = np.empty((len(batch), 0))
+            if columns:
+                indexes = np.unravel_index(batch, shape)
+                inputs = np.column_stack([column[index]
+                                          for column, index in zip(columns, indexes)])
+            result[start:start + chunk_size] = self._process_batch(engine, inputs)
+        return result
+
+    def to_array_from_inputs(self, engine: 'Engine', inputs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the values of the engine processing the rows of inputs in batches of
+        `chunk_size` rows (requires numpy), such that inputs mapped into memory (eg, read with
+        `read_values`) are read one batch at a time. The batches are processed with
+        `Engine.process_batch`, which leaves the state of the engine unchanged.
+        :param engine: is the engine to process the inputs
+        :param inputs: is the matrix of inputs, whose first columns are the values of the input
+        variables
+        :return: the matrix of values with a row per row of inputs and the columns in `names`
+        """
+        import numpy as np
+        if np.ndim(inputs) != 2 or np.shape(inputs)[1] < len(engine.input_variables):
+            raise ValueError(f"expected a matrix of inputs with at least "
+                             f"{len(engine.input_variables)} columns, but got shape "
+                             f"{np.shape(inputs)}")
+        rows = len(inputs)
+        chunk_size = max(1, self.chunk_size)
+        result = np.empty((rows, len(self.names(engine))))
+        for start in range(0, rows, chunk_size):
+            result[start:start + chunk_size] = self._process_batch(
+                engine, inputs[start:start + chunk_size, :len(engine.input_variables)])
+        return result
+
+    def to_npy(self, path: Union[str, 'Path'], engine: 'Engine', values: 'np.ndarray') -> None:
+        """
+        Writes the matrix of values in NumPy format (`.npy`) as a structured array whose fields
+        are the names of the columns (see `names`), which `read_values` maps into memory.
+        :param path: is the path of the file
+        :param engine: is the engine whose variables name the columns
+        :param values: is the matrix of values (eg, from `to_array_from_scope`)
+        """
+        import numpy as np
+        names = self.names(engine)
+        values = self._matrix(values, names)
+        np.save(path, values.view(np.dtype([(name, '<f8') for name in names])).reshape(-1),
+                allow_pickle=False)
+
+    def to_raw(self, path: Union[str, 'Path'], engine: 'Engine', values: 'np.ndarray') -> None:
+        """
+        Writes the matrix of values as raw little-endian doubles in row-major order, after the
+        magic line and a line with the names of the columns (see `names`) and the number of rows
+        in JSON, which is padded such that the values are aligned to 8 bytes.
+        :param path: is the path of the file
+        :param engine: is the engine whose variables name the columns
+        :param values: is the matrix of values (eg, from `to_array_from_scope`)
+        """
+        import json
+        names = self.names(engine)
+        values = self._matrix(values, names)
+        header = json.dumps({"names": names, "rows": len(values)}).encode()
+        header += b" " * (-(len(FldExporter.MAGIC) + len(header) + 1) % 8) + b"\n"
+        with open(path, "wb") as file:
+            file.write(FldExporter.MAGIC)
+            file.write(header)
+            values.tofile(file)
+
+    def _matrix(self, values: 'np.ndarray', names: List[str]) -> 'np.ndarray':
+        # the values as a contiguous matrix of little-endian doubles with a column per name
+        import numpy as np
+        values = np.ascontiguousarray(values, dtype='<f8')
+        if values.ndim != 2 or values.shape[1] != len(names):
+            raise ValueError(f"expected a matrix of values with {len(names)} columns, "
+                             f"but got shape {values.shape}")
+        return values
+
+    @staticmethod
+    def read_values(path: Union[str, 'Path'],
+                    memory_map: bool = True) -> Tuple[List[str], 'np.ndarray']:
+        """
+        Reads the names of the columns and the matrix of values from a file written with
+        `to_npy` or `to_raw` (requires numpy).
+        :param path: is the path of the file
+        :param memory_map: whether to map the values into memory (read-only) instead of reading
+        them, such that large files are neither copied nor read in full
+        :return: the names of the columns and the matrix of values
+        """
+        import json
+
+        import numpy as np
+        with open(path, "rb") as file:
+            magic = file.readline()
+            if magic == FldExporter.MAGIC:
+                header = json.loads(file.readline())
+                offset = file.tell()
+        if magic.startswith(b"\x93NUMPY"):
+            data = np.load(path, mmap_mode='r' if memory_map else None, allow_pickle=False)
+            if not data.dtype.names or data.ndim != 1:
+                raise ValueError(f"expected a structured array of values in file '{path}'")
+            names = list(data.dtype.names)
+            return names, data.view('<f8').reshape(len(data), len(names))
+        if magic != FldExporter.MAGIC:
+            raise ValueError(f"expected values in NumPy or raw format in file '{path}'")
+        names, shape = header["names"], (header["rows"], len(header["names"]))
+        if memory_map and header["rows"] and names:
+            return names, np.memmap(path, dtype='<f8', mode='r', offset=offset, shape=shape)
+        return names, np.fromfile(path, dtype='<f8', offset=offset).reshape(shape)
 
     def write(
             self,
@@ -544,8 +849,15 @@ class FldExporter(Exporter):
             input_values: List[float],
             active_variables: Set['InputVariable']
     ) -> None:
-        # if not input_values:
-        #     writer.writelines("\n")
+        writer.write(self._values(engine, input_values, active_variables))
+
+    def _values(
+            self,
+            engine: 'Engine',
+            input_values: List[float],
+            active_variables: Set['InputVariable']
+    ) -> str:
+        # processes the input values and returns the line with the values to write
         if len(input_values) < len(engine.input_variables):
             raise ValueError(f"not enough input values ({len(input_values)}) "
                              f"for the input variables ({len(engine.input_variables)})")
@@ -562,4 +874,261 @@ class FldExporter(Exporter):
         if self.output_values:
             values.extend(Op.str(ov.value) for ov in engine.output_variables)
 
-        writer.writelines(self.separator.join(values) + "\n")
+        return self.separator.join(values) + "\n"
+
+
+class BinaryExporter(Exporter):
+    """
+      The BinaryExporter class is an Exporter that translates an Engine into a compact binary
+      format that the BinaryImporter loads without tokenizing or parsing any text. The format
+      consists of a header, followed by a structure section with the variables, terms, rule
+      blocks and rules, and a section with the parameters of the terms packed as floats.
+
+      The header contains the magic bytes and version of the format, the size (in bytes) of the
+      structure section, and the number of parameters. The structure section stores strings
+      prefixed with their length, integers, and booleans, all of them in little-endian. The
+      terms, norms, activation methods, defuzzifiers and hedges are stored by their keys in the
+      factories, and the antecedents and consequents of the rules are stored as expression trees
+      whose propositions refer to the variables, terms and hedges by their indexes and keys.
+      The parameter section starts at the first offset multiple of 8 after the structure section
+      and stores the floats (little-endian doubles) in the order the structure section uses them,
+      where the values of x and y of the discrete terms are contiguous to share them with the
+      files mapped into memory (see `BinaryImporter.from_file`).
+
+      @see BinaryImporter
+      @see FllExporter
+      @since 7.0
+    """
+
+    MAGIC = b"FLLB"
+    VERSION = 2
+    HEADER = "<4sHHQQ"
+
+    # kinds of terms
+    ATTRIBUTES, DISCRETE, LINEAR, FUNCTION, PARAMETERS = range(5)
+    # kinds of nodes in expression trees
+    PROPOSITION, AND, OR = range(3)
+    # index of the term in propositions without terms
+    NO_TERM = 0xFFFFFFFF
+
+    # attributes of the terms whose parameters are fixed lists of floats
+    TERMS: Dict[str, Tuple[str, ...]] = {
+        "Bell": ("center", "width", "slope", "height"),
+        "Binary": ("start", "direction", "height"),
+        "Concave": ("inflection", "end", "height"),
+        "Constant": ("value", "height"),
+        "Cosine": ("center", "width", "height"),
+        "Gaussian": ("mean", "standard_deviation", "height"),
+        "GaussianProduct": ("mean_a", "standard_deviation_a", "mean_b", "standard_deviation_b",
+                            "height"),
+        "PiShape": ("bottom_left", "top_left", "top_right", "bottom_right", "height"),
+        "Ramp": ("start", "end", "height"),
+        "Rectangle": ("start", "end", "height"),
+        "Sigmoid": ("inflection", "slope", "height"),
+        "SigmoidDifference": ("left", "rising", "falling", "right", "height"),
+        "SigmoidProduct": ("left", "rising", "falling", "right", "height"),
+        "Spike": ("center", "width", "height"),
+        "SShape": ("start", "end", "height"),
+        "Trapezoid": ("vertex_a", "vertex_b", "vertex_c", "vertex_d", "height"),
+        "Triangle": ("vertex_a", "vertex_b", "vertex_c", "height"),
+        "ZShape": ("start", "end", "height"),
+    }
+
+    def to_string(self, instance: object) -> str:
+        raise ValueError("the binary format cannot be exported to a string, "
+                         "use `to_bytes` or `to_file` instead")
+
+    def to_file(self, path: Union[str, 'Path'], instance: object) -> None:
+        from pathlib import Path
+        if isinstance(path, str):
+            path = Path(path)
+        path.write_bytes(self.to_bytes(instance))
+
+    def to_bytes(self, instance: object) -> bytes:
+        """
+        Exports the engine into the binary format.
+        :param instance: is the engine to export
+        :return: the engine in the binary format
+        """
+        from .engine import Engine
+        if not isinstance(instance, Engine):
+            raise ValueError(f"expected an Engine, but got {type(instance).__name__}")
+
+        structure = bytearray()
+        parameters = array('d')
+        self.engine(instance, structure, parameters)
+
+        if sys.byteorder != "little":
+            parameters.byteswap()
+        header = struct.pack(BinaryExporter.HEADER, BinaryExporter.MAGIC,
+                             BinaryExporter.VERSION, 0, len(structure), len(parameters))
+        padding = -(len(header) + len(structure)) % 8
+        return b"".join([header, structure, bytes(padding), parameters.tobytes()])
+
+    def engine(self, engine: 'Engine', structure: bytearray, parameters: 'array[float]') -> None:
+        self.string(structure, engine.name)
+        self.string(structure, engine.description)
+
+        structure += struct.pack("<I", len(engine.input_variables))
+        for input_variable in engine.input_variables:
+            self.variable(input_variable, structure, parameters)
+
+        structure += struct.pack("<I", len(engine.output_variables))
+        for output_variable in engine.output_variables:
+            self.variable(output_variable, structure, parameters)
+            parameters.append(output_variable.default_value)
+            structure += struct.pack("<?", output_variable.lock_previous)
+            self.component("snorm", output_variable.aggregation, structure)
+            self.component("defuzzifier", output_variable.defuzzifier, structure)
+
+        # indexes of the variables referred to by the propositions of the rules
+        variables = {id(variable): index for index, variable in enumerate(engine.variables)}
+        structure += struct.pack("<I", len(engine.rule_blocks))
+        for rule_block in engine.rule_blocks:
+            self.string(structure, rule_block.name)
+            self.string(structure, rule_block.description)
+            structure += struct.pack("<?", rule_block.enabled)
+            self.component("tnorm", rule_block.conjunction, structure)
+            self.component("snorm", rule_block.disjunction, structure)
+            self.component("tnorm", rule_block.implication, structure)
+            self.component("activation", rule_block.activation, structure)
+
+            structure += struct.pack("<I", len(rule_block.rules))
+            for rule in rule_block.rules:
+                parameters.append(rule.weight)
+                loaded = rule.is_loaded()
+                structure += struct.pack("<??", rule.enabled, loaded)
+                self.string(structure, rule.antecedent.text)
+                self.string(structure, rule.consequent.text)
+                if loaded:
+                    self.expression(rule.antecedent.expression,  # type: ignore
+                                    variables, structure)
+                    structure += struct.pack("<I", len(rule.consequent.conclusions))
+                    for proposition in rule.consequent.conclusions:
+                        self.proposition(proposition, variables, structure)
+
+    def variable(self, variable: 'Variable', structure: bytearray,
+                 parameters: 'array[float]') -> None:
+        self.string(structure, variable.name)
+        self.string(structure, variable.description)
+        structure += struct.pack("<??I", variable.enabled, variable.lock_range,
+                                 len(variable.terms))
+        parameters.extend((variable.minimum, variable.maximum))
+        for term in variable.terms:
+            self.term(term, structure, parameters)
+
+    def term(self, term: 'Term', structure: bytearray, parameters: 'array[float]') -> None:
+        from . import lib
+        from .term import Discrete, Function, Linear
+
+        key = term.class_name
+        if key not in lib.factory_manager.term.constructors:
+            raise ValueError(f"expected a term registered in the factory, but got '{key}'")
+        self.string(structure, term.name)
+        self.string(structure, key)
+
+        if type(term) is Discrete:
+            structure += struct.pack("<BI", BinaryExporter.DISCRETE, len(term.x()))
+            parameters.extend(term.x())
+            parameters.extend(term.y())
+            parameters.append(term.height)
+        elif type(term) is Linear:
+            structure += struct.pack("<BI", BinaryExporter.LINEAR, len(term.coefficients))
+            parameters.extend(term.coefficients)
+        elif type(term) is Function:
+            structure += struct.pack("<B", BinaryExporter.FUNCTION)
+            self.string(structure, term.formula)
+        elif type(term).__name__ in BinaryExporter.TERMS:
+            attributes = BinaryExporter.TERMS[type(term).__name__]
+            structure += struct.pack("<BI", BinaryExporter.ATTRIBUTES, len(attributes))
+            parameters.extend(getattr(term, attribute) for attribute in attributes)
+        else:
+            structure += struct.pack("<B", BinaryExporter.PARAMETERS)
+            self.string(structure, term.parameters())
+
+    def component(self, factory: str,
+                  component: Optional[Union['Norm', 'Activation', 'Defuzzifier']],
+                  structure: bytearray) -> None:
+        # stores the key of the component in the factory followed by its parameters, if any
+        from . import lib
+        if not component:
+            self.string(structure, "")
+            self.string(structure, "")
+            return
+        key = component.class_name
+        if key not in getattr(lib.factory_manager, factory).constructors:
+            raise ValueError(f"expected a component registered in the {factory} factory, "
+                             f"but got '{key}'")
+        self.string(structure, key)
+        self.string(structure, component.parameters() if hasattr(component, "parameters")
+                    else "")
+
+    def expression(self, node: 'Expression', variables: Dict[int, int],
+                   structure: bytearray) -> None:
+        from .rule import Operator, Proposition, Rule
+        if isinstance(node, Proposition):
+            structure += struct.pack("<B", BinaryExporter.PROPOSITION)
+            self.proposition(node, variables, structure)
+        elif isinstance(node, Operator) and node.name in {Rule.AND, Rule.OR}:
+            kind = BinaryExporter.AND if node.name == Rule.AND else BinaryExporter.OR
+            structure += struct.pack("<B", kind)
+            self.expression(node.left, variables, structure)  # type: ignore
+            self.expression(node.right, variables, structure)  # type: ignore
+        else:
+            raise ValueError(f"expected a proposition or an operator, but got '{node}'")
+
+    def proposition(self, proposition: 'Proposition', variables: Dict[int, int],
+                    structure: bytearray) -> None:
+        from . import lib
+        if id(proposition.variable) not in variables:
+            raise ValueError(f"expected a variable of the engine in proposition '{proposition}'")
+        structure += struct.pack("<IB", variables[id(proposition.variable)],
+                                 len(proposition.hedges))
+        for hedge in proposition.hedges:
+            if hedge.name not in lib.factory_manager.hedge.constructors:
+                raise ValueError(
+                    f"expected a hedge registered in the factory, but got '{hedge.name}'")
+            self.string(structure, hedge.name)
+        term = BinaryExporter.NO_TERM
+        if proposition.term:
+            term = next((index for index, candidate in enumerate(proposition.variable.terms)
+                         if candidate is proposition.term), -1)  # type: ignore
+            if term < 0:
+                raise ValueError(f"expected a term of the variable in proposition '{proposition}'")
+        structure += struct.pack("<I", term)
+
+    @staticmethod
+    def string(structure: bytearray, value: str) -> None:
+        encoded = value.encode()
+        structure += struct.pack("<I", len(encoded))
+        structure += encoded
+
+
+# engine, exporter, and columns of input values of the worker processes of the FldExporter
+_fld_worker: Optional[Tuple['Engine', FldExporter, List[List[float]]]] = None
+
+
+def _initialize_fld_worker(data: bytes, exporter: FldExporter, columns: List[List[float]],
+                           decimals: int, abs_tolerance: float,
+                           floating_point_type: Type[float]) -> None:
+    global _fld_worker
+    import pickle
+    from . import lib
+    lib.decimals = decimals
+    lib.abs_tolerance = abs_tolerance
+    lib.floating_point_type = floating_point_type
+    _fld_worker = (pickle.loads(data), exporter, columns)
+
+
+def _write_fld_chunk(start: int, end: int) -> str:
+    engine, exporter, columns = _fld_worker  # type: ignore
+    writer = io.StringIO()
+    active_variables = set(engine.input_variables)
+    input_values = [math.nan] * len(columns)
+    for row in range(start, end):
+        # the row is decomposed into the indexes of the columns, the last one changing the fastest
+        for i in reversed(range(len(columns))):
+            row, index = divmod(row, len(columns[i]))
+            input_values[i] = columns[i][index]
+        exporter.write(engine, writer, input_values, active_variables)
+    return writer.getvalue()
@@ -21,7 +21,7 @@ __all__ = ["ConstructionFactory", "CloningFactory", "ActivationFactory", "Defuzz
 
 import copy
 import math
-from typing import Callable, Dict, Generic, Iterator, Optional, TypeVar
+from typing import Callable, Dict, Generic, Iterator, Optional, Tuple, TypeVar
 
 from .activation import Activation, First, General, Highest, Last, Lowest, Proportional, Threshold
 from .defuzzifier import (Bisector, Centroid, Defuzzifier, LargestOfMaximum, MeanOfMaximum,
@@ -154,9 +154,30 @@ class FunctionFactory(CloningFactory[Function.Element]):
 
     def __init__(self) -> None:
         super().__init__()
+        self._shared: Dict[str, Tuple[Tuple[object, ...], Function.Element]] = {}
         self._register_operators()
         self._register_functions()
 
+    def share(self, key: str) -> Function.Element:
+        """
+        Gets the shared copy of the element registered with the key, which is copied from the
+        registered element the first time and again only after the registered element is replaced
+        or modified (ie, copy-on-write), such that the nodes of parsed functions share the
+        elements instead of copying them, and are unaffected by later changes to the factory.
+        :param key: is the name of the element
+        :return: the shared copy of the element, which must not be modified
+        """
+        if key not in self.objects:
+            raise ValueError(f"object with key '{key}' not found in {self.class_name}")
+        element = self.objects[key]
+        state = (element.name, element.description, element.type, element.method,
+                 element.arity, element.precedence, element.associativity)
+        shared = self._shared.get(key)
+        if not (shared and shared[0] == state):
+            shared = (state, copy.deepcopy(element))
+            self._shared[key] = shared
+        return shared[1]
+
     def _precedence(self, importance: int) -> int:
         maximum = 100
         step = 10
@@ -23,6 +23,8 @@ import typing
 from typing import Callable
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # noqa: F401
+
     from .term import Function
 
 
@@ -35,42 +37,77 @@ class Hedge:
     def hedge(self, x: float) -> float:
         raise NotImplementedError()
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the hedge element-wise on an array. By default, the scalar hedge is applied to
+        each element (eg, for the Python functions of HedgeLambda), so derived classes should
+        override this method with vectorized operations.
+        """
+        import numpy as np
+        # the scalar hedge compares nan values without warnings
+        with np.errstate(invalid='ignore'):
+            return np.vectorize(self.hedge, otypes=[float])(x)  # type: ignore
+
 
 class Any(Hedge):
 
     def hedge(self, x: float) -> float:
         return 1.0
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        return np.full_like(x, 1.0, dtype=float)  # type: ignore
+
 
 class Extremely(Hedge):
 
     def hedge(self, x: float) -> float:
         return 2.0 * x * x if x <= 0.5 else (1.0 - 2.0 * (1.0 - x) * (1.0 - x))
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        return np.where(x <= 0.5, 2.0 * x * x, 1.0 - 2.0 * (1.0 - x) * (1.0 - x))  # type: ignore
+
 
 class Not(Hedge):
 
     def hedge(self, x: float) -> float:
         return 1.0 - x
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return 1.0 - x
+
 
 class Seldom(Hedge):
 
     def hedge(self, x: float) -> float:
         return math.sqrt(0.5 * x) if x <= 0.5 else (1.0 - math.sqrt(0.5 * (1.0 - x)))
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        with np.errstate(invalid='ignore'):
+            return np.where(x <= 0.5,  # type: ignore
+                            np.sqrt(0.5 * x), 1.0 - np.sqrt(0.5 * (1.0 - x)))
+
 
 class Somewhat(Hedge):
 
     def hedge(self, x: float) -> float:
         return math.sqrt(x)
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        return np.sqrt(x)  # type: ignore
+
 
 class Very(Hedge):
 
     def hedge(self, x: float) -> float:
         return x * x
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return x * x
+
 
 class HedgeLambda(Hedge):
 
@@ -97,3 +134,6 @@ class HedgeFunction(Hedge):
 
     def hedge(self, x: float) -> float:
         return self.function.membership(x)
+
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return self.function.membership_array(x)
@@ -15,21 +15,34 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
-__all__ = ["Importer", "FllImporter"]
+__all__ = ["Importer", "FllImporter", "EngineCache", "BinaryImporter"]
 
-from pathlib import Path
-from typing import List, Optional, Tuple, Type, TypeVar, Union
+import struct
+import sys
+import typing
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from .activation import Activation
 from .defuzzifier import Defuzzifier
 from .engine import Engine
+from .exporter import BinaryExporter
 from .factory import ConstructionFactory
 from .norm import SNorm, TNorm
 from .operation import Op
-from .rule import Rule, RuleBlock
+from .rule import Operator, Proposition, Rule, RuleBlock
 from .term import Term
 from .variable import InputVariable, OutputVariable
 
+if typing.TYPE_CHECKING:
+    from mmap import mmap
+    from pathlib import Path
+
+    from .hedge import Hedge
+    from .rule import Expression
+    from .variable import Variable
+
 
 class Importer:
 
@@ -40,7 +53,8 @@ class Importer:
     def from_string(self, fll: str) -> 'Engine':
         raise NotImplementedError()
 
-    def from_file(self, path: Union[Path, str]) -> 'Engine':
+    def from_file(self, path: Union['Path', str]) -> 'Engine':
+        from pathlib import Path
         if isinstance(path, str):
             path = Path(path)
         with path.open() as fll:
@@ -49,81 +63,113 @@ class Importer:
 
 class FllImporter(Importer):
 
-    def __init__(self, separator: str = '\n') -> None:
+    def __init__(self, separator: str = '\n', cache: Optional['EngineCache'] = None) -> None:
+        """
+        Creates the importer of FuzzyLite Language.
+        :param separator: is the separator of the lines
+        :param cache: is the cache of the engines parsed, if any
+        """
         self.separator = separator
-
-    def _process(self, component: str, block: List[str], engine: 'Engine') -> None:
-        if component == "Engine":
-            for line in block:
-                line = Op.strip_comments(line)
-
-                key, value = self.extract_key_value(line)
-                if key == "Engine":
-                    engine.name = value
-                elif key == "description":
-                    engine.description = value
-                else:
-                    raise SyntaxError(f"'{key}' is not a valid component of '{component}'")
-        elif component == "InputVariable":
-            input_variable = self.input_variable(self.separator.join(block), engine)
-            engine.input_variables.append(input_variable)
-        elif component == "OutputVariable":
-            output_variable = self.output_variable(self.separator.join(block), engine)
-            engine.output_variables.append(output_variable)
-        elif component == "RuleBlock":
-            rule_block = self.rule_block(self.separator.join(block), engine)
-            engine.rule_blocks.append(rule_block)
+        self.cache = cache
 
     def from_string(self, fll: str) -> 'Engine':
         return self.engine(fll)
 
     def engine(self, fll: str) -> 'Engine':
+        """
+        Parses the engine in a single pass over the lines, where each line is parsed once into
+        the component being built (ie, the engine, an input variable, an output variable, or a
+        rule block), which is added to the engine when the next component starts. The single
+        pass covers the lines of the engine, the variables and their terms, and the settings of
+        the rule blocks, whereas the text of each rule is parsed afterwards by `Rule.create`.
+        When created with a cache, the engine is loaded from the cache if found, and otherwise
+        it is parsed and stored in the cache.
+        :param fll: is the engine in FuzzyLite Language
+        :return: the engine
+        """
+        if self.cache:
+            key = self.cache.key(fll + self.separator)
+            engine = self.cache.load(key)
+            if not engine:
+                engine = self._engine(fll)
+                self.cache.save(key, engine)
+            return engine
+        return self._engine(fll)
+
+    def _engine(self, fll: str) -> 'Engine':
         engine = Engine()
-        component = ""
-        block: List[str] = []
-
+        component: Optional[Union[Engine, InputVariable, OutputVariable, RuleBlock]] = None
         for line in fll.split(self.separator):
             line = Op.strip_comments(line)
             if not line:
                 continue
             key, value = self.extract_key_value(line)
             if key in {"Engine", "InputVariable", "OutputVariable", "RuleBlock"}:
-                if component:
-                    # Process previous block
-                    self._process(component, block, engine)
-                component = key
-                block = [line]
-            else:
-                block.append(line)
-        if component and block:
-            self._process(component, block, engine)
+                self._complete(component, engine)
+                component = engine if key == "Engine" else None
+            if key == "Engine" or component is engine:
+                self._engine_line(engine, key, value)
+            elif key == "InputVariable" or isinstance(component, InputVariable):
+                component = self._input_variable_line(component, key, value, engine)
+            elif key == "OutputVariable" or isinstance(component, OutputVariable):
+                component = self._output_variable_line(component, key, value, engine)
+            elif key == "RuleBlock" or isinstance(component, RuleBlock):
+                component = self._rule_block_line(component, key, value, engine)
+        self._complete(component, engine)
         return engine
 
-    def input_variable(self, fll: str, engine: Optional['Engine'] = None) -> 'InputVariable':
+    def _complete(self, component: Optional[Union['Engine', 'InputVariable', 'OutputVariable',
+                                                  'RuleBlock']],
+                  engine: 'Engine') -> None:
+        # adds the component to the engine after parsing all of its lines
+        if isinstance(component, InputVariable):
+            component.name = Op.as_identifier(component.name)
+            engine.input_variables.append(component)
+        elif isinstance(component, OutputVariable):
+            component.name = Op.as_identifier(component.name)
+            engine.output_variables.append(component)
+        elif isinstance(component, RuleBlock):
+            engine.rule_blocks.append(component)
+
+    def _engine_line(self, engine: 'Engine', key: str, value: str) -> None:
+        if key == "Engine":
+            engine.name = value
+        elif key == "description":
+            engine.description = value
+        else:
+            raise SyntaxError(f"'{key}' is not a valid component of 'Engine'")
 
+    def input_variable(self, fll: str, engine: Optional['Engine'] = None) -> 'InputVariable':
         iv = InputVariable()
         for line in fll.split(self.separator):
             line = Op.strip_comments(line)
             if not line:
                 continue
             key, value = self.extract_key_value(line)
-            if key == "InputVariable":
-                iv.name = value
-            elif key == "description":
-                iv.description = value
-            elif key == "enabled":
-                iv.enabled = self.boolean(value)
-            elif key == "range":
-                iv.range = self.range(value)
-            elif key == "lock-range":
-                iv.lock_range = self.boolean(value)
-            elif key == "term":
-                iv.terms.append(self.term(line, engine))
-            else:
-                raise SyntaxError(f"'{key}' is not a valid component of '{iv.__class__.__name__}'")
+            self._input_variable_line(iv, key, value, engine)
         iv.name = Op.as_identifier(iv.name)
         return iv
 
+    def _input_variable_line(self, iv: Optional['InputVariable'], key: str, value: str,
+                             engine: Optional['Engine'] = None) -> 'InputVariable':
+        if not iv:
+            iv = InputVariable()
+        if key == "InputVariable":
+            iv.name = value
+        elif key == "description":
+            iv.description = value
+        elif key == "enabled":
+            iv.enabled = self.boolean(value)
+        elif key == "range":
+            iv.range = self.range(value)
+        elif key == "lock-range":
+            iv.lock_range = self.boolean(value)
+        elif key == "term":
+            iv.terms.append(self._term(value, engine))
+        else:
+            raise SyntaxError(f"'{key}' is not a valid component of '{iv.__class__.__name__}'")
+        return iv
+
     def output_variable(self, fll: str, engine: Optional['Engine'] = None) -> 'OutputVariable':
         ov = OutputVariable()
         for line in fll.split(self.separator):
@@ -131,31 +177,38 @@ class FllImporter(Importer):
             if not line:
                 continue
             key, value = self.extract_key_value(line)
-            if key == "OutputVariable":
-                ov.name = value
-            elif key == "description":
-                ov.description = value
-            elif key == "enabled":
-                ov.enabled = self.boolean(value)
-            elif key == "range":
-                ov.range = self.range(value)
-            elif key == "default":
-                ov.default_value = Op.scalar(value)
-            elif key == "lock-previous":
-                ov.lock_previous = self.boolean(value)
-            elif key == "lock-range":
-                ov.lock_range = self.boolean(value)
-            elif key == "defuzzifier":
-                ov.defuzzifier = self.defuzzifier(value)
-            elif key == "aggregation":
-                ov.aggregation = self.snorm(value)
-            elif key == "term":
-                ov.terms.append(self.term(line, engine))
-            else:
-                raise SyntaxError(f"'{key}' is not a valid component of '{ov.__class__.__name__}'")
+            self._output_variable_line(ov, key, value, engine)
         ov.name = Op.as_identifier(ov.name)
         return ov
 
+    def _output_variable_line(self, ov: Optional['OutputVariable'], key: str, value: str,
+                              engine: Optional['Engine'] = None) -> 'OutputVariable':
+        if not ov:
+            ov = OutputVariable()
+        if key == "OutputVariable":
+            ov.name = value
+        elif key == "description":
+            ov.description = value
+        elif key == "enabled":
+            ov.enabled = self.boolean(value)
+        elif key == "range":
+            ov.range = self.range(value)
+        elif key == "default":
+            ov.default_value = Op.scalar(value)
+        elif key == "lock-previous":
+            ov.lock_previous = self.boolean(value)
+        elif key == "lock-range":
+            ov.lock_range = self.boolean(value)
+        elif key == "defuzzifier":
+            ov.defuzzifier = self.defuzzifier(value)
+        elif key == "aggregation":
+            ov.aggregation = self.snorm(value)
+        elif key == "term":
+            ov.terms.append(self._term(value, engine))
+        else:
+            raise SyntaxError(f"'{key}' is not a valid component of '{ov.__class__.__name__}'")
+        return ov
+
     def rule_block(self, fll: str, engine: Optional['Engine'] = None) -> 'RuleBlock':
         rb = RuleBlock()
         for line in fll.split(self.separator):
@@ -163,34 +216,45 @@ class FllImporter(Importer):
             if not line:
                 continue
             key, value = self.extract_key_value(line)
-            if key == "RuleBlock":
-                rb.name = value
-            elif key == "description":
-                rb.description = value
-            elif key == "enabled":
-                rb.enabled = self.boolean(value)
-            elif key == "conjunction":
-                rb.conjunction = self.tnorm(value)
-            elif key == "disjunction":
-                rb.disjunction = self.snorm(value)
-            elif key == "implication":
-                rb.implication = self.tnorm(value)
-            elif key == "activation":
-                rb.activation = self.activation(value)
-            elif key == "rule":
-                rule = self.rule(line, engine)
-                if rule:
-                    rb.rules.append(rule)
-            else:
-                raise SyntaxError(f"'{key}' is not a valid component of '{rb.__class__.__name__}'")
+            self._rule_block_line(rb, key, value, engine)
+        return rb
+
+    def _rule_block_line(self, rb: Optional['RuleBlock'], key: str, value: str,
+                         engine: Optional['Engine'] = None) -> 'RuleBlock':
+        if not rb:
+            rb = RuleBlock()
+        if key == "RuleBlock":
+            rb.name = value
+        elif key == "description":
+            rb.description = value
+        elif key == "enabled":
+            rb.enabled = self.boolean(value)
+        elif key == "conjunction":
+            rb.conjunction = self.tnorm(value)
+        elif key == "disjunction":
+            rb.disjunction = self.snorm(value)
+        elif key == "implication":
+            rb.implication = self.tnorm(value)
+        elif key == "activation":
+            rb.activation = self.activation(value)
+        elif key == "rule":
+            rule = Rule.create(value, engine)
+            if rule:
+                rb.rules.append(rule)
+        else:
+            raise SyntaxError(f"'{key}' is not a valid component of '{rb.__class__.__name__}'")
         return rb
 
     def term(self, fll: str, engine: Optional['Engine'] = None) -> 'Term':
+        return self._term(self.extract_value(fll, "term"), engine)
+
+    def _term(self, value: str, engine: Optional['Engine'] = None) -> 'Term':
         from . import lib
 
-        values = self.extract_value(fll, "term").split(maxsplit=2)
+        values = value.split(maxsplit=2)
         if len(values) < 2:
-            raise SyntaxError(f"expected format 'term: name Term [parameters]', but got '{fll}'")
+            raise SyntaxError(f"expected format 'term: name Term [parameters]', "
+                              f"but got 'term: {value}'")
 
         term = lib.factory_manager.term.construct(values[1])
         term.name = Op.as_identifier(values[0])
@@ -265,3 +329,397 @@ class FllImporter(Importer):
 
     def extract_value(self, fll: str, component: Optional[str] = None) -> str:
         return self.extract_key_value(fll, component)[1]
+
+
+class EngineCache:
+    """
+      The EngineCache class stores the engines imported by the FllImporter keyed by the hash of
+      their FuzzyLite Language, such that importing the same engine again unpickles a copy of
+      the cached engine instead of parsing it. The engines are stored in memory, and optionally
+      in a directory shared by processes (eg, across restarts or deployments). The engines that
+      cannot be pickled (eg, those with lambdas) are not cached, and the entries that cannot be
+      unpickled are parsed again. The key of the entries includes the version of the library
+      and the format of the pickled engines, but not the factories, hence the cache must not be
+      shared by importers that use different factories. Unpickling can execute arbitrary code,
+      hence the entries in the directory are authenticated with an HMAC of a secret key before
+      they are unpickled, and the entries that fail the authentication are parsed again.
+
+      @see FllImporter
+      @since 7.0
+    """
+
+    # version of the pickled engines, which changes with the attributes of the components
+    FORMAT = 1
+
+    def __init__(self, directory: Optional[Union[str, 'Path']] = None,
+                 capacity: int = 32, secret: Optional[bytes] = None) -> None:
+        """
+        Creates the cache of engines.
+        :param directory: is the directory in which to store the engines, if any
+        :param capacity: is the number of engines to keep in memory, discarding the least
+        recently used
+        :param secret: is the key that authenticates the engines in the directory, which the
+        caches sharing the directory must share, or None to generate a random key that
+        authenticates only the engines saved by this cache
+        """
+        import os
+        self.directory = directory
+        self.capacity = capacity
+        self.secret = os.urandom(32) if secret is None else secret
+        self.engines: 'OrderedDict[str, bytes]' = OrderedDict()
+
+    def key(self, fll: str) -> str:
+        """
+        Computes the key of the engine.
+        :param fll: is the engine in FuzzyLite Language
+        :return: the SHA-256 hash of the engine, the version of the library and the format
+        """
+        import hashlib
+
+        from . import __version__
+        return hashlib.sha256(
+            f"{__version__}\n{EngineCache.FORMAT}\n{fll}".encode()).hexdigest()
+
+    def _path(self, key: str) -> 'Path':
+        from pathlib import Path
+        return Path(self.directory) / f"{key}.pickle"  # type: ignore
+
+    def _digest(self, data: bytes) -> bytes:
+        import hashlib
+        import hmac
+        return hmac.new(self.secret, data, hashlib.sha256).digest()
+
+    def _keep(self, key: str, data: bytes) -> None:
+        self.engines[key] = data
+        self.engines.move_to_end(key)
+        while len(self.engines) > max(0, self.capacity):
+            self.engines.popitem(last=False)
+
+    def load(self, key: str) -> Optional['Engine']:
+        """
+        Loads a copy of the engine from memory, or otherwise from the directory if the secret
+        key authenticates it.
+        :param key: is the key of the engine
+        :return: a copy of the engine, or None if not found or not authenticated
+        """
+        import hmac
+        import pickle
+        data = self.engines.get(key)
+        if data is None and self.directory:
+            try:
+                signed = self._path(key).read_bytes()
+            except OSError:
+                signed = b""
+            # the digest precedes the pickled engine
+            digest, signed = signed[:32], signed[32:]
+            if signed and hmac.compare_digest(digest, self._digest(signed)):
+                data = signed
+        if data is None:
+            return None
+        try:
+            engine: Engine = pickle.loads(data)
+        except Exception:
+            self.engines.pop(key, None)
+            return None
+        self._keep(key, data)
+        return engine
+
+    def save(self, key: str, engine: 'Engine') -> None:
+        """
+        Saves the engine in memory, and in the directory (if any) preceded by its digest.
+        :param key: is the key of the engine
+        :param engine: is the engine to save, which is pickled immediately
+        """
+        import os
+        import pickle
+        try:
+            data = pickle.dumps(engine, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+        self._keep(key, data)
+        if self.directory:
+            path = self._path(key)
+            # written to a temporary file first so that other processes never read partial files
+            temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temporary.write_bytes(self._digest(data) + data)
+                os.replace(temporary, path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Clears the engines in memory, leaving the directory unchanged.
+        """
+        self.engines.clear()
+
+
+class BinaryImporter(Importer):
+    """
+      The BinaryImporter class is an Importer that loads an Engine from the binary format of the
+      BinaryExporter, which stores the components by their keys in the factories, the parameters
+      of the terms as packed floats, and the rules as expression trees that refer to the
+      variables and terms by their indexes. Thus, the engines are loaded without tokenizing or
+      parsing any text other than the formulas of the Function terms.
+
+      @see BinaryExporter
+      @see FllImporter
+      @since 7.0
+    """
+
+    def from_string(self, fll: str) -> 'Engine':
+        raise ValueError("the binary format cannot be imported from a string, "
+                         "use `from_bytes` or `from_file` instead")
+
+    def from_file(self, path: Union['Path', str], memory_map: bool = False) -> 'Engine':
+        """
+        Imports the engine from the file in binary format.
+        :param path: is the path of the file
+        :param memory_map: whether to map the file into memory instead of reading it, in which
+        case the values of x and y of the discrete terms are views of the pages of the file
+        (on little-endian platforms), which the operating system shares among the processes that
+        map the same file, and the file remains mapped until those terms are garbage collected
+        :return: the engine
+        """
+        from pathlib import Path
+        if isinstance(path, str):
+            path = Path(path)
+        with path.open(mode='rb') as file:
+            if memory_map:
+                import mmap
+                return self._from_data(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ),
+                                       shared=True)
+            return self.from_bytes(file.read())
+
+    def from_bytes(self, data: Union[bytes, bytearray, memoryview, 'mmap']) -> 'Engine':
+        """
+        Imports the engine from the binary format.
+        :param data: is the engine in binary format, whose values are copied into the engine
+        :return: the engine
+        """
+        return self._from_data(data, shared=False)
+
+    def _from_data(self, data: Union[bytes, bytearray, memoryview, 'mmap'],
+                   shared: bool) -> 'Engine':
+        # the discrete terms keep views of the data if shared
+        reader = _BinaryReader(data, shared)
+        try:
+            return self.engine(reader)
+        except (IndexError, struct.error, UnicodeDecodeError) as error:
+            raise ValueError(f"expected an engine in binary format, but got corrupted data: "
+                             f"{error}") from error
+        finally:
+            reader.release()
+
+    def engine(self, reader: '_BinaryReader') -> 'Engine':
+        engine = Engine(reader.string(), reader.string())
+
+        for _ in range(reader.integer()):
+            input_variable = InputVariable()
+            self.variable(input_variable, reader, engine)
+            engine.input_variables.append(input_variable)
+
+        for _ in range(reader.integer()):
+            output_variable = OutputVariable()
+            self.variable(output_variable, reader, engine)
+            output_variable.default_value = reader.float()
+            output_variable.lock_previous = reader.boolean()
+            output_variable.aggregation = self.component("snorm", reader)
+            output_variable.defuzzifier = self.component("defuzzifier", reader)
+            engine.output_variables.append(output_variable)
+
+        variables = engine.variables
+        hedges: Dict[str, 'Hedge'] = {}
+        for _ in range(reader.integer()):
+            rule_block = RuleBlock(reader.string(), reader.string(), reader.boolean())
+            rule_block.conjunction = self.component("tnorm", reader)
+            rule_block.disjunction = self.component("snorm", reader)
+            rule_block.implication = self.component("tnorm", reader)
+            rule_block.activation = self.component("activation", reader)
+            for _ in range(reader.integer()):
+                rule = Rule()
+                rule.weight = reader.float()
+                rule.enabled = reader.boolean()
+                loaded = reader.boolean()
+                rule.antecedent.text = reader.string()
+                rule.consequent.text = reader.string()
+                if loaded:
+                    rule.antecedent.expression = self.expression(reader, variables, hedges)
+                    rule.antecedent.compile()
+                    rule.consequent.conclusions = [
+                        self.proposition(reader, variables, hedges)
+                        for _ in range(reader.integer())]
+                rule_block.rules.append(rule)
+            engine.rule_blocks.append(rule_block)
+        return engine
+
+    def variable(self, variable: Union['InputVariable', 'OutputVariable'],
+                 reader: '_BinaryReader', engine: 'Engine') -> None:
+        variable.name = reader.string()
+        variable.description = reader.string()
+        variable.enabled = reader.boolean()
+        variable.lock_range = reader.boolean()
+        terms = reader.integer()
+        variable.range = (reader.float(), reader.float())
+        variable.terms.extend(self.term(reader, engine) for _ in range(terms))
+
+    def term(self, reader: '_BinaryReader', engine: 'Engine') -> 'Term':
+        from . import lib
+
+        name = reader.string()
+        term = lib.factory_manager.term.construct(reader.string())
+        term.name = name
+        kind = reader.byte()
+        if kind == BinaryExporter.ATTRIBUTES:
+            attributes = BinaryExporter.TERMS[term.class_name]
+            values = reader.floats(reader.integer())
+            if len(values) != len(attributes):
+                raise ValueError(f"expected {len(attributes)} parameters for term "
+                                 f"'{term.class_name}', but got {len(values)}")
+            for attribute, value in zip(attributes, values):
+                setattr(term, attribute, value)
+        elif kind == BinaryExporter.DISCRETE:
+            count = reader.integer()
+            term.set_arrays(reader.values(count), reader.values(count))  # type: ignore
+            term.height = reader.float()
+        elif kind == BinaryExporter.LINEAR:
+            term.coefficients = reader.floats(reader.integer())  # type: ignore
+        elif kind == BinaryExporter.FUNCTION:
+            term.update_reference(engine)
+            term.configure(reader.string())
+        elif kind == BinaryExporter.PARAMETERS:
+            term.update_reference(engine)
+            parameters = reader.string()
+            if parameters:
+                term.configure(parameters)
+        else:
+            raise ValueError(f"unexpected kind of term '{kind}' in binary format")
+        term.update_reference(engine)
+        return term
+
+    def component(self, factory: str, reader: '_BinaryReader') -> Optional[Any]:
+        from . import lib
+        key, parameters = reader.string(), reader.string()
+        if not key:
+            return None
+        result = getattr(lib.factory_manager, factory).construct(key)
+        if parameters and hasattr(result, "configure"):
+            result.configure(parameters)
+        return result
+
+    def expression(self, reader: '_BinaryReader', variables: List['Variable'],
+                   hedges: Dict[str, 'Hedge']) -> 'Expression':
+        kind = reader.byte()
+        if kind == BinaryExporter.PROPOSITION:
+            return self.proposition(reader, variables, hedges)
+        if kind in {BinaryExporter.AND, BinaryExporter.OR}:
+            operator = Operator(Rule.AND if kind == BinaryExporter.AND else Rule.OR)
+            operator.left = self.expression(reader, variables, hedges)
+            operator.right = self.expression(reader, variables, hedges)
+            return operator
+        raise ValueError(f"unexpected kind of expression '{kind}' in binary format")
+
+    def proposition(self, reader: '_BinaryReader', variables: List['Variable'],
+                    hedges: Dict[str, 'Hedge']) -> 'Proposition':
+        index, count = reader.unpack(_BinaryReader.proposition)
+        variable = variables[index]
+        proposition = Proposition(variable)
+        for _ in range(count):
+            key = reader.string()
+            if key not in hedges:
+                from . import lib
+                if key not in lib.factory_manager.hedge.constructors:
+                    raise ValueError(f"expected a hedge registered in the factory, but got '{key}'")
+                hedges[key] = lib.factory_manager.hedge.construct(key)
+            proposition.hedges.append(hedges[key])
+        term = reader.integer()
+        if term != BinaryExporter.NO_TERM:
+            proposition.term = variable.terms[term]
+        return proposition
+
+
+class _BinaryReader:
+    # reads the sections of the binary format sequentially
+
+    _integer = struct.Struct("<I")
+    proposition = struct.Struct("<IB")
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, 'mmap'],
+                 shared: bool = False) -> None:
+        view = memoryview(data)
+        try:
+            header = struct.calcsize(BinaryExporter.HEADER)
+            if len(view) < header or view[:4] != BinaryExporter.MAGIC:
+                raise ValueError("expected an engine in binary format, but got other data")
+            magic, version, _, size, count = struct.unpack_from(BinaryExporter.HEADER, view)
+            if version != BinaryExporter.VERSION:
+                raise ValueError(f"expected version {BinaryExporter.VERSION} of the binary "
+                                 f"format, but got version {version}")
+            start = header + size + -(header + size) % 8
+            if len(view) < start + 8 * count:
+                raise ValueError("expected an engine in binary format, but got truncated data")
+            self.structure = bytes(view[header:header + size])
+            self.offset = 0
+            self.parameters: Union[memoryview, 'array[float]']
+            if sys.byteorder == "little":
+                # the parameters are read from the data without copying them
+                self.parameters = view[start:start + 8 * count].cast('d')
+            else:
+                self.parameters = array('d', view[start:start + 8 * count].tobytes())
+                self.parameters.byteswap()
+            self.cursor = 0
+            self.shared = shared
+        finally:
+            view.release()
+
+    def release(self) -> None:
+        # releases the view of the data, which must be released before closing a memory map
+        if isinstance(self.parameters, memoryview):
+            self.parameters.release()
+
+    def integer(self) -> int:
+        result: int = _BinaryReader._integer.unpack_from(self.structure, self.offset)[0]
+        self.offset += 4
+        return result
+
+    def unpack(self, format: struct.Struct) -> Tuple[Any, ...]:
+        result = format.unpack_from(self.structure, self.offset)
+        self.offset += format.size
+        return result
+
+    def byte(self) -> int:
+        result = self.structure[self.offset]
+        self.offset += 1
+        return result
+
+    def boolean(self) -> bool:
+        return bool(self.byte())
+
+    def string(self) -> str:
+        size = self.integer()
+        start, self.offset = self.offset, self.offset + size
+        if self.offset > len(self.structure):
+            raise IndexError("string out of range")
+        return self.structure[start:self.offset].decode()
+
+    def float(self) -> float:
+        result: float = self.parameters[self.cursor]
+        self.cursor += 1
+        return result
+
+    def floats(self, count: int) -> List[float]:
+        if self.cursor + count > len(self.parameters):
+            raise IndexError("parameters out of range")
+        start, self.cursor = self.cursor, self.cursor + count
+        return self.parameters[start:self.cursor].tolist()  # type: ignore
+
+    def values(self, count: int) -> Sequence[float]:
+        # views of the parameters if shared (and not swapped), otherwise copies of them
+        if self.cursor + count > len(self.parameters):
+            raise IndexError("parameters out of range")
+        start, self.cursor = self.cursor, self.cursor + count
+        result = self.parameters[start:self.cursor]
+        if isinstance(result, memoryview) and not self.shared:
+            return array('d', result.tobytes())
+        return result
@@ -16,9 +16,11 @@
 """
 
 import logging
+import typing
 from typing import Optional, SupportsFloat, Type, Union
 
-from .factory import FactoryManager
+if typing.TYPE_CHECKING:
+    from .factory import FactoryManager
 
 __all__ = ["Library"]
 
@@ -31,9 +33,24 @@ class Library:
         self.decimals = decimals
         self.abs_tolerance: float = abs_tolerance
         self.floating_point_type = floating_point_type
-        self.factory_manager = factory_manager if factory_manager else FactoryManager()
+        self._factory_manager = factory_manager
         self.logger = logging.getLogger("fuzzylite")
 
+    @property
+    def factory_manager(self) -> 'FactoryManager':
+        """
+        Gets the factory manager, which is created on first use unless given in the constructor
+        :return: the factory manager
+        """
+        if not self._factory_manager:
+            from .factory import FactoryManager
+            self._factory_manager = FactoryManager()
+        return self._factory_manager
+
+    @factory_manager.setter
+    def factory_manager(self, value: 'FactoryManager') -> None:
+        self._factory_manager = value
+
     def floating_point(self, value: Union[SupportsFloat, str, bytes]) -> float:
         return self.floating_point_type(value)
 
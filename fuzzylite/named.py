@@ -0,0 +1,201 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Named", "NamedList"]
+
+import typing
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+if typing.TYPE_CHECKING:
+    from typing import SupportsIndex  # Python 3.8+
+
+
+class _Owners(List['weakref.ref[NamedList[Any]]']):
+    """
+      The _Owners class is the list of (weak references to) the named lists whose indexes contain
+      a component, which is not copied with the component because the copy is in none of them.
+    """
+
+    def __reduce__(self) -> Tuple[type, Tuple[()]]:
+        return _Owners, ()
+
+
+class Named:
+    """
+      The Named class is the base class of the components that are found by name (ie, variables,
+      terms, and rule blocks), whose renames invalidate the indexes of the named lists that
+      contain them.
+
+      @see NamedList
+      @since 7.0
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        if name != getattr(self, "_name", name):
+            self._renamed()
+        self._name = name
+
+    def _renamed(self) -> None:
+        # discards the indexes of the named lists that contain the component
+        for owner in getattr(self, "_owners", ()):
+            named_list = owner()
+            if named_list is not None:
+                named_list._modified()
+
+
+T = TypeVar("T", bound=Named)
+E = TypeVar("E")
+
+
+class _IndexedList(List[E]):
+    """
+      The _IndexedList class is a list that discards its index (if any) whenever it is modified,
+      such that subclasses rebuild the index on first use after the list is modified.
+    """
+
+    _index: Any = None
+
+    def _modified(self) -> None:
+        # called after (or right before) every modification of the list
+        self._index = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the index is not copied
+        return {}
+
+    def __setitem__(self, key: Union['SupportsIndex', slice], value: Any) -> None:
+        super().__setitem__(key, value)
+        self._modified()
+
+    def __delitem__(self, key: Union['SupportsIndex', slice]) -> None:
+        super().__delitem__(key)
+        self._modified()
+
+    def __iadd__(self, items: Iterable[E]) -> '_IndexedList[E]':  # type: ignore
+        self._modified()
+        return super().__iadd__(items)
+
+    def __imul__(self, times: 'SupportsIndex') -> '_IndexedList[E]':
+        self._modified()
+        return super().__imul__(times)
+
+    def append(self, item: E) -> None:
+        super().append(item)
+        self._modified()
+
+    def extend(self, items: Iterable[E]) -> None:
+        super().extend(items)
+        self._modified()
+
+    def insert(self, index: 'SupportsIndex', item: E) -> None:
+        super().insert(index, item)
+        self._modified()
+
+    def remove(self, item: E) -> None:
+        super().remove(item)
+        self._modified()
+
+    def pop(self, index: 'SupportsIndex' = -1) -> E:
+        self._modified()
+        return super().pop(index)
+
+    def clear(self) -> None:
+        super().clear()
+        self._modified()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._modified()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._modified()
+
+
+class NamedList(_IndexedList[T]):
+    """
+      The NamedList class is a list of named components that finds them by name in constant
+      time using an index, which is rebuilt on the first search after the list is modified or any
+      of its components is renamed. The index contains the first and the last component of each
+      name, like searching the list from the start or from the end.
+
+      @see Named
+      @since 7.0
+    """
+
+    _index: Optional[Dict[str, Tuple[T, T]]] = None
+
+    def find(self, name: str, last: bool = False) -> Optional[T]:
+        """
+        Finds the first (or last) component with the given name.
+        :param name: is the name of the component
+        :param last: whether to find the last component with the name instead of the first
+        :return: the component, or None if not found
+        """
+        index = self._index
+        if index is None:
+            index = {}
+            owner = weakref.ref(self)
+            for item in self:
+                found = index.get(item.name)
+                index[item.name] = (item, item) if found is None else (found[0], item)
+                self._own(item, owner)
+            self._index = index
+        found = index.get(name)
+        return None if found is None else found[last]
+
+    @staticmethod
+    def _own(item: T, owner: 'weakref.ref[NamedList[T]]') -> None:
+        # registers the list in the component, such that renaming the component discards the index
+        try:
+            owners = item._owners  # type: ignore
+        except AttributeError:
+            try:
+                owners = item._owners = _Owners()  # type: ignore
+            except AttributeError:
+                return
+        if not any(ref is owner for ref in owners):
+            owners[:] = [ref for ref in owners if ref() is not None]
+            owners.append(owner)
+
+    @staticmethod
+    def search(items: Iterable[T], name: str, last: bool = False) -> Optional[T]:
+        """
+        Finds the first (or last) component with the given name, using the index of named lists
+        and iterating over other iterables.
+        :param items: are the components
+        :param name: is the name of the component
+        :param last: whether to find the last component with the name instead of the first
+        :return: the component, or None if not found
+        """
+        if isinstance(items, NamedList):
+            return items.find(name, last)
+        result = None
+        for item in items:
+            if item.name == name:
+                if not last:
+                    return item
+                result = item
+        return result
@@ -17,10 +17,13 @@
 
 __all__ = ["Operation", "Op"]
 
-import inspect
 import math
+import typing
 from typing import Callable, List, Optional, SupportsFloat, Text, Union
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # noqa: F401
+
 
 class Operation:
     """
@@ -85,6 +88,37 @@ class Operation:
                     or (a != a and b != b)
                     ) and a < b
 
+    @staticmethod
+    def eq_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        """Element-wise equivalent of Operation.eq on arrays"""
+        import numpy as np
+        if abs_tolerance is None:
+            from . import lib
+            abs_tolerance = lib.abs_tolerance
+        with np.errstate(invalid='ignore'):
+            return ((a == b)  # type: ignore
+                    | (np.abs(a - b) < abs_tolerance)
+                    | (np.isnan(a) & np.isnan(b)))
+
+    @staticmethod
+    def gt_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        """Element-wise equivalent of Operation.gt on arrays"""
+        return ~Operation.eq_array(a, b, abs_tolerance) & (a > b)  # type: ignore
+
+    @staticmethod
+    def ge_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        """Element-wise equivalent of Operation.ge on arrays"""
+        return Operation.eq_array(a, b, abs_tolerance) | (a > b)  # type: ignore
+
+    @staticmethod
+    def lt_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        """Element-wise equivalent of Operation.lt on arrays"""
+        return ~Operation.eq_array(a, b, abs_tolerance) & (a < b)  # type: ignore
+
     @staticmethod
     def logical_and(a: float, b: float) -> bool:
         return Operation.eq(a, 1.0) and Operation.eq(b, 1.0)
@@ -114,6 +148,7 @@ class Operation:
 
     @staticmethod
     def arity_of(method: Callable) -> int:  # type: ignore
+        import inspect
         signature = inspect.signature(method)
         required_parameters = [parameter for parameter in signature.parameters.values()
                                if parameter.default == inspect.Parameter.empty]
@@ -141,7 +176,7 @@ class Operation:
             if class_hierarchy:
                 key_values["__hierarchy__"] = ", ".join(
                     f"{cls.__module__}.{cls.__name__}"
-                    for cls in inspect.getmro(instance.__class__))
+                    for cls in instance.__class__.__mro__)
 
         class_name = instance.__class__.__name__
         sorted_dict = {key: key_values[key] for key in sorted(key_values.keys())}
@@ -0,0 +1,133 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Profiler"]
+
+import time
+import typing
+from typing import Callable, Dict, List, Tuple
+
+if typing.TYPE_CHECKING:
+    from .engine import Engine  # noqa: F401
+    from .rule import RuleBlock  # noqa: F401
+    from .variable import OutputVariable  # noqa: F401
+
+
+class Profiler:
+    """
+      The Profiler class records the time spent by `Engine.process` in each of its stages, namely
+      fuzzifying the input variables, activating each rule block, and defuzzifying each output
+      variable, together with the number of rules fired by each rule block. The engine calls the
+      hooks of its profiler (if any) after each stage, whose default implementations accumulate
+      the records in dictionaries, and which can be overridden to publish them elsewhere.
+
+      The engine does not measure time when it has no profiler. The records of a profiler shared
+      by engines processing in multiple threads at the same time may lose updates.
+
+      @see Engine
+      @since 7.0
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Creates the profiler.
+        :param clock: is the clock that measures the time in seconds
+        """
+        self.clock = clock
+        self.processes = 0
+        self.seconds = 0.0
+        self.fuzzification = 0.0
+        self.rule_blocks: Dict['RuleBlock', float] = {}
+        self.activations: Dict[str, float] = {}
+        self.fired: Dict['RuleBlock', int] = {}
+        self.output_variables: Dict['OutputVariable', float] = {}
+        self.defuzzifiers: Dict[str, float] = {}
+
+    def __str__(self) -> str:
+        """
+        Gets the report of the seconds spent in each stage, from the slowest to the fastest.
+        :return: the report of the seconds spent in each stage
+        """
+        rows: List[Tuple[str, float]] = [("fuzzification", self.fuzzification)]
+        rows.extend((f"rule block '{block.name}' ({self.fired.get(block, 0)} rules fired)",
+                     seconds) for block, seconds in self.rule_blocks.items())
+        rows.extend((f"activation {name}", seconds)
+                    for name, seconds in self.activations.items())
+        rows.extend((f"output variable '{variable.name}'", seconds)
+                    for variable, seconds in self.output_variables.items())
+        rows.extend((f"defuzzifier {name}", seconds)
+                    for name, seconds in self.defuzzifiers.items())
+        rows.sort(key=lambda row: -row[1])
+
+        processes = max(1, self.processes)
+        result = [f"{self.processes} processes in {self.seconds:.6f} seconds "
+                  f"({1e6 * self.seconds / processes:.1f} us per process)"]
+        result.extend(f"{name:<56} {seconds:>12.6f} s {1e6 * seconds / processes:>10.1f} us"
+                      for name, seconds in rows)
+        return "\n".join(result)
+
+    def reset(self) -> None:
+        """
+        Discards the records.
+        """
+        self.processes = 0
+        self.seconds = 0.0
+        self.fuzzification = 0.0
+        self.rule_blocks.clear()
+        self.activations.clear()
+        self.fired.clear()
+        self.output_variables.clear()
+        self.defuzzifiers.clear()
+
+    def fuzzified(self, engine: 'Engine', seconds: float) -> None:
+        """
+        Records the time spent fuzzifying the input variables of the engine.
+        :param engine: is the engine
+        :param seconds: is the time spent
+        """
+        self.fuzzification += seconds
+
+    def activated(self, block: 'RuleBlock', seconds: float, fired: int) -> None:
+        """
+        Records the time spent activating the rule block and the number of rules fired.
+        :param block: is the rule block
+        :param seconds: is the time spent
+        :param fired: is the number of rules fired (ie, triggered)
+        """
+        self.rule_blocks[block] = self.rule_blocks.get(block, 0.0) + seconds
+        self.fired[block] = self.fired.get(block, 0) + fired
+        name = type(block.activation).__name__ if block.activation else "none"
+        self.activations[name] = self.activations.get(name, 0.0) + seconds
+
+    def defuzzified(self, variable: 'OutputVariable', seconds: float) -> None:
+        """
+        Records the time spent defuzzifying the output variable.
+        :param variable: is the output variable
+        :param seconds: is the time spent
+        """
+        self.output_variables[variable] = self.output_variables.get(variable, 0.0) + seconds
+        name = type(variable.defuzzifier).__name__ if variable.defuzzifier else "none"
+        self.defuzzifiers[name] = self.defuzzifiers.get(name, 0.0) + seconds
+
+    def processed(self, engine: 'Engine', seconds: float) -> None:
+        """
+        Records the time spent processing the engine.
+        :param engine: is the engine
+        :param seconds: is the time spent
+        """
+        self.processes += 1
+        self.seconds += seconds
@@ -17,38 +17,129 @@
 
 __all__ = ["Expression", "Proposition", "Operator", "Antecedent", "Consequent", "Rule", "RuleBlock"]
 
+import functools
 import typing
+import weakref
 from math import nan
-from typing import Deque, Iterable, List, Optional
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
+from . import context as _context
+from .context import Context
 from .exporter import FllExporter
-from .hedge import Any
-from .norm import SNorm, TNorm
+from .hedge import Any, Extremely, Not, Seldom, Somewhat, Very
+from .named import Named, NamedList, _IndexedList, _Owners
+from .norm import (AlgebraicProduct, AlgebraicSum, BoundedDifference, BoundedSum, DrasticProduct,
+                   DrasticSum, EinsteinProduct, EinsteinSum, HamacherProduct, HamacherSum, Maximum,
+                   Minimum, NilpotentMaximum, NilpotentMinimum, NormalizedSum, SNorm, TNorm)
 from .operation import Op
 from .variable import InputVariable, OutputVariable
 
 if typing.TYPE_CHECKING:
+    from types import CodeType
+
+    import numpy as np  # noqa: F401
+
     from .activation import Activation  # noqa: F401
     from .engine import Engine
     from .hedge import Hedge
-    from .term import Term  # noqa: F401
+    from .term import Activated, Term  # noqa: F401
     from .variable import Variable  # noqa: F401
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_program(source: str) -> 'CodeType':
+    # the names bound in the programs depend only on the structure of the antecedents, hence
+    # the antecedents with the same structure (eg, most rules of a rule block) share the code
+    return compile(source, "<antecedent>", "exec")
+
+
 class Expression:
-    pass
+    # the antecedent whose compiled function binds the expression (if any)
+    __slots__ = ("_antecedent",)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_antecedent":
+            self._changed()
+
+    def __setstate__(self, state: Tuple[Optional[Dict[str, object]],
+                                        Optional[Dict[str, object]]]) -> None:
+        # the attributes are restored without discarding the compiled function of the antecedent
+        for attributes in state:
+            for name, value in (attributes or {}).items():
+                object.__setattr__(self, name, value)
+
+    def _changed(self) -> None:
+        # changes to the expression discard the compiled function of its antecedent and the
+        # indexes of the rule blocks that contain it
+        antecedent = getattr(self, "_antecedent", None)  # unset while the expression is copied
+        if antecedent is not None:
+            antecedent._program = None
+            antecedent._changed()
+
+
+class _Hedges(_IndexedList['Hedge']):
+    """
+      The _Hedges class is the list of hedges of a proposition, whose modifications in place
+      are changes to the proposition.
+    """
+
+    _proposition: Optional['Proposition'] = None
+
+    def __init__(self, proposition: 'Proposition', hedges: Iterable['Hedge'] = ()) -> None:
+        list.__init__(self, hedges)
+        self._proposition = proposition
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {'_proposition': self._proposition}
+
+    def _modified(self) -> None:
+        if self._proposition is not None:
+            self._proposition._changed()
+
+
+class _Rules(_IndexedList['Rule']):
+    """
+      The _Rules class is the list of rules of a rule block, whose modifications in place
+      discard the indexes of the rule block.
+    """
+
+    _rule_block: Optional['RuleBlock'] = None
+
+    def __init__(self, rule_block: 'RuleBlock', rules: Iterable['Rule'] = ()) -> None:
+        list.__init__(self, rules)
+        self._rule_block = rule_block
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {'_rule_block': self._rule_block}
+
+    def _modified(self) -> None:
+        if self._rule_block is not None:
+            self._rule_block._discard_indexes()
 
 
 class Proposition(Expression):
 
+    __slots__ = ("variable", "hedges", "term")
+
     def __init__(self, variable: Optional['Variable'] = None,
                  hedges: Optional[Iterable['Hedge']] = None,
                  term: Optional['Term'] = None) -> None:
-        self.variable = variable
-        self.hedges: List[Hedge] = []
-        if hedges:
-            self.hedges.extend(hedges)
-        self.term = term
+        # new propositions have no changes to notify
+        object.__setattr__(self, "_antecedent", None)
+        object.__setattr__(self, "variable", variable)
+        object.__setattr__(self, "hedges", _Hedges(self, hedges or ()))
+        object.__setattr__(self, "term", term)
+        self.variable: Optional[Variable]
+        self.hedges: List[Hedge]
+        self.term: Optional[Term]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "hedges" and not (isinstance(value, _Hedges) and value._proposition is self):
+            value = _Hedges(self, value)  # type: ignore
+        object.__setattr__(self, name, value)
+        if name != "_antecedent":
+            self._changed()
 
     def __str__(self) -> str:
         result = []
@@ -70,12 +161,19 @@ class Proposition(Expression):
 
 class Operator(Expression):
 
+    __slots__ = ("name", "right", "left")
+
     def __init__(self, name: str = "",
                  right: Optional[Expression] = None,
                  left: Optional[Expression] = None) -> None:
-        self.name = name
-        self.right = right
-        self.left = left
+        # new operators have no changes to notify
+        object.__setattr__(self, "_antecedent", None)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "right", right)
+        object.__setattr__(self, "left", left)
+        self.name: str
+        self.right: Optional[Expression]
+        self.left: Optional[Expression]
 
     def __str__(self) -> str:
         return self.name
@@ -85,25 +183,155 @@ class Antecedent(object):
 
     def __init__(self, text: str = "") -> None:
         self.text: str = text
-        self.expression: Optional[Expression] = None
+        self._expression: Optional[Expression] = None
+        # the expression compiled, its operators, and its function and source code (or None if
+        # the expression cannot be compiled)
+        self._program: Optional[Tuple[Expression, Set[str],
+                                      Optional[Callable[..., float]], str]] = None
+        # the rule blocks whose indexes contain the antecedent
+        self._owners: _Owners = _Owners()
 
     def __str__(self) -> str:
         return self.text
 
+    @property
+    def expression(self) -> Optional[Expression]:
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression: Optional[Expression]) -> None:
+        self._expression = expression
+        self._changed()
+
+    def _changed(self) -> None:
+        # discards the indexes of the rule blocks that contain the antecedent, which register
+        # again when they rebuild their indexes
+        owners = getattr(self, "_owners", ())  # unset while the antecedent is copied
+        for owner in owners:
+            rule_block = owner()
+            if rule_block is not None:
+                rule_block._discard_indexes()
+        if owners:
+            owners.clear()
+
+    def _own(self, rule_block: 'RuleBlock') -> None:
+        # registers the rule block whose indexes contain the antecedent
+        owners = self.__dict__.get("_owners")
+        if owners is None:
+            owners = self._owners = _Owners()
+        if not any(owner() is rule_block for owner in owners):
+            owners.append(weakref.ref(rule_block))  # type: ignore
+
     def is_loaded(self) -> bool:
         return bool(self.expression)
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the compiled function cannot be pickled, so its source code and the objects bound in
+        # its namespace are pickled instead to create the function again when unpickled
+        state = self.__dict__.copy()
+        if self._program and self._program[2]:
+            expression, operators, program, source = self._program
+            namespace = {key: value for key, value in program.__globals__.items()
+                         if key not in {'__builtins__', 'program'}}
+            state['_program'] = (expression, operators, namespace, source)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        if state.get('_program') and state['_program'][2]:  # type: ignore
+            expression, operators, namespace, source = state['_program']  # type: ignore
+            exec(_compile_program(source), namespace)
+            state['_program'] = (expression, operators, namespace['program'], source)
+        self.__dict__.update(state)
+
     def unload(self) -> None:
         self.expression = None
+        self._program = None
+
+    def compile(self) -> None:
+        """
+        Compiles the expression into a single Python function with the variables, terms and
+        hedges bound up front, such that computing the activation degree does not walk the
+        expression tree. The compiled function is discarded if the expression changes, and
+        compiled again when the activation degree is computed next. The expression tree is
+        walked if it cannot be compiled.
+        """
+        self._program = None
+        if not self.expression:
+            return
+        namespace: Dict[str, object] = {'nan': nan}
+        operators: Set[str] = set()
+        expression = self._compile(self.expression, namespace, operators)
+        program, source = None, ""
+        if expression:
+            source = f"def program(conjunction, disjunction):\n    return {expression}\n"
+            try:
+                exec(_compile_program(source), namespace)
+                program = namespace['program']
+            except (MemoryError, RecursionError, SyntaxError):
+                source = ""
+        # the expressions that cannot be compiled are not compiled again until they change
+        self._program = (self.expression, operators, program, source)  # type: ignore
+
+    def _compile(self, node: Expression, namespace: Dict[str, object],
+                 operators: Set[str]) -> Optional[str]:
+        def bind(prefix: str, value: object) -> str:
+            name = f"{prefix}{len(namespace)}"
+            namespace[name] = value
+            return name
+
+        if isinstance(node, Proposition):
+            if not node.variable:
+                return None
+            node._antecedent = self
+            variable = bind("variable", node.variable)
+
+            if node.hedges and isinstance(node.hedges[-1], Any):
+                result = "nan"
+            elif not node.term:
+                return None
+            elif isinstance(node.variable, InputVariable):
+                result = f"{variable}.membership({bind('term', node.term)})"
+            elif isinstance(node.variable, OutputVariable):
+                result = f"{variable}.fuzzy.activation_degree({bind('term', node.term)})"
+            else:
+                result = "nan"
+
+            for hedge in reversed(node.hedges):
+                result = f"{bind('hedge', hedge.hedge)}({result})"
+            return f"({result} if {variable}.enabled else 0.0)"
+
+        if isinstance(node, Operator) and node.name in {Rule.AND, Rule.OR}:
+            left = self._compile(node.left, namespace, operators) if node.left else None
+            right = self._compile(node.right, namespace, operators) if node.right else None
+            if not (left and right):
+                return None
+            node._antecedent = self
+            operators.add(node.name)
+            norm = "conjunction" if node.name == Rule.AND else "disjunction"
+            return f"{norm}({left}, {right})"
+
+        return None
 
     def activation_degree(self,  # noqa C901 'Antecedent.activation_degree' is too complex (20)
                           conjunction: Optional[TNorm] = None,
                           disjunction: Optional[SNorm] = None,
                           node: Optional[Expression] = None) -> float:
         if not node:
-            if self.expression:
-                return self.activation_degree(conjunction, disjunction, self.expression)
-            raise RuntimeError(f"antecedent '{self.text}' is not loaded")
+            if not self.expression:
+                raise RuntimeError(f"antecedent '{self.text}' is not loaded")
+            if not (self._program and self._program[0] is self.expression):
+                self.compile()
+            _, operators, program, _ = self._program  # type: ignore
+            if program:
+                if Rule.AND in operators and not conjunction:
+                    raise ValueError(f"expected a conjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                if Rule.OR in operators and not disjunction:
+                    raise ValueError(f"expected a disjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                return program(conjunction.compute if conjunction else None,
+                               disjunction.compute if disjunction else None)
+            return self.activation_degree(conjunction, disjunction, self.expression)
 
         # PROPOSITION
         if isinstance(node, Proposition):
@@ -127,7 +355,7 @@ class Antecedent(object):
 
             result = nan
             if isinstance(node.variable, InputVariable):
-                result = node.term.membership(node.variable.value)
+                result = node.variable.membership(node.term)
             elif isinstance(node.variable, OutputVariable):
                 result = node.variable.fuzzy.activation_degree(node.term)
 
@@ -162,6 +390,81 @@ class Antecedent(object):
 
         raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
 
+    def activation_degree_array(self,  # noqa C901 too complex (20)
+                                conjunction: Optional[TNorm] = None,
+                                disjunction: Optional[SNorm] = None,
+                                node: Optional[Expression] = None) -> 'np.ndarray':
+        """
+        Computes the activation degrees of the antecedent when the values of the input variables
+        are arrays
+        :param conjunction: is the conjunction operator
+        :param disjunction: is the disjunction operator
+        :param node: is the node of the expression to evaluate (the root if None)
+        :return: the array of activation degrees
+        """
+        import numpy as np
+        if not node:
+            if self.expression:
+                return self.activation_degree_array(conjunction, disjunction, self.expression)
+            raise RuntimeError(f"antecedent '{self.text}' is not loaded")
+
+        # PROPOSITION
+        if isinstance(node, Proposition):
+            if not node.variable:
+                raise ValueError(f"expected a variable in proposition '{node}', "
+                                 f"but found none in antecedent: '{self.text}'")
+            if not node.variable.enabled:
+                return np.zeros(())
+
+            if node.hedges:
+                # if last hedge is "Any", apply hedges in reverse order and return degree
+                if isinstance(node.hedges[-1], Any):
+                    result = np.full((), nan)
+                    for hedge in reversed(node.hedges):
+                        result = hedge.hedge_array(result)
+                    return result
+
+            if not node.term:
+                raise ValueError(f"expected a term in proposition '{node}', "
+                                 f"but found none for antecedent: '{self.text}'")
+
+            result = np.full((), nan)
+            if isinstance(node.variable, InputVariable):
+                result = node.term.membership_array(node.variable.value)  # type: ignore
+            elif isinstance(node.variable, OutputVariable):
+                result = node.variable.fuzzy.activation_degree_array(node.term)
+
+            for hedge in reversed(node.hedges):
+                result = hedge.hedge_array(result)
+
+            return result
+
+        # OPERATOR
+        if isinstance(node, Operator):
+            if not (node.left and node.right):
+                raise ValueError(f"expected left and right operands for operator '{node}' "
+                                 f"in antecedent: '{self.text}'")
+
+            if node.name == Rule.AND:
+                if not conjunction:
+                    raise ValueError(f"expected a conjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                return conjunction.compute_array(
+                    self.activation_degree_array(conjunction, disjunction, node.left),
+                    self.activation_degree_array(conjunction, disjunction, node.right))
+
+            if node.name == Rule.OR:
+                if not disjunction:
+                    raise ValueError(f"expected a disjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                return disjunction.compute_array(
+                    self.activation_degree_array(conjunction, disjunction, node.left),
+                    self.activation_degree_array(conjunction, disjunction, node.right))
+
+            raise ValueError(f"operator '{node}' not recognized in antecedent: '{self.text}'")
+
+        raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
+
     def load(self, engine: 'Engine') -> None:  # noqa: C901 'Antecedent.load' is too complex (23)
         from collections import deque
         from . import lib
@@ -172,7 +475,8 @@ class Antecedent(object):
             raise SyntaxError("expected the antecedent of a rule, but found none")
 
         postfix = Function().infix_to_postfix(self.text)
-        if lib.debugging:
+        debugging = lib.debugging
+        if debugging:
             lib.logger.debug(f"antecedent={self.text}\npostfix={postfix}")
 
         # Build a proposition tree from the antecedent of a fuzzy rule. The rules are:
@@ -187,42 +491,49 @@ class Antecedent(object):
         stack: Deque[Expression] = deque()
 
         proposition: Optional[Proposition] = None
-        variables = {v.name: v for v in engine.variables}
+        hedges = lib.factory_manager.hedge
         for token in postfix.split():
             if state & s_variable:
-                variable = variables.get(token, None)
+                # the last variable with the name is used, so output variables take precedence
+                variable = NamedList.search(engine.output_variables, token, last=True)
+                if variable is None:
+                    variable = NamedList.search(engine.input_variables, token, last=True)
                 if variable:
                     proposition = Proposition(variable)
                     stack.append(proposition)
                     state = s_is
-                    lib.logger.debug(f"token '{token}' is a variable")
+                    if debugging:
+                        lib.logger.debug(f"token '{token}' is a variable")
                     continue
 
             if state & s_is:
                 if Rule.IS == token:
                     state = s_hedge | s_term
-                    lib.logger.debug(f"token '{token}' is a keyword")
+                    if debugging:
+                        lib.logger.debug(f"token '{token}' is a keyword")
                     continue
 
             if state & s_hedge:
-                factory = lib.factory_manager.hedge
-                if token in factory:
-                    hedge = factory.construct(token)
+                if token in hedges.constructors:
+                    hedge = hedges.construct(token)
                     proposition.hedges.append(hedge)  # type: ignore
                     if isinstance(hedge, Any):
                         state = s_variable | s_and_or
                     else:
                         state = s_hedge | s_term
-                    lib.logger.debug(f"token '{token} is hedge")
+                    if debugging:
+                        lib.logger.debug(f"token '{token} is hedge")
                     continue
 
             if state & s_term:
-                terms = {t.name: t for t in proposition.variable.terms}  # type: ignore
-                term = terms.get(token, None)
+                # the last term with the name is used
+                term = NamedList.search(proposition.variable.terms,  # type: ignore
+                                        token, last=True)
                 if term:
                     proposition.term = term  # type: ignore
                     state = s_variable | s_and_or
-                    lib.logger.debug(f"token '{token} is term")
+                    if debugging:
+                        lib.logger.debug(f"token '{token} is term")
                     continue
 
             if state & s_and_or:
@@ -235,7 +546,8 @@ class Antecedent(object):
                     operator.left = stack.pop()
                     stack.append(operator)
                     state = s_variable | s_and_or
-                    lib.logger.debug(f"token '{token} is logical operator '{operator}'")
+                    if debugging:
+                        lib.logger.debug(f"token '{token} is logical operator '{operator}'")
                     continue
 
             # if reached this point, there was an error in the current state
@@ -262,6 +574,24 @@ class Antecedent(object):
             raise SyntaxError(f"unable to parse the following expressions: {errors}")
 
         self.expression = stack.pop()
+        self.compile()
+
+    def variables(self) -> List['Variable']:
+        """
+        Gets the variables referenced by the propositions of the expression, walking the
+        expression tree without recursion to support expressions of any depth.
+        :return: the list of unique variables in the order they appear in the expression
+        """
+        result: Dict['Variable', None] = {}
+        nodes: List[Expression] = [self.expression] if self.expression else []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Proposition):
+                if node.variable:
+                    result[node.variable] = None
+            elif isinstance(node, Operator):
+                nodes.extend(child for child in (node.right, node.left) if child)
+        return list(result)
 
     def prefix(self, node: Optional[Expression] = None) -> str:
         if not node:
@@ -328,6 +658,8 @@ class Consequent:
     def __init__(self, text: str = "") -> None:
         self.text: str = text
         self.conclusions: List[Proposition] = []
+        # the terms activated by the conclusions, which are reused once cleared from the outputs
+        self._activated: Dict[Proposition, 'Activated'] = {}
 
     def __str__(self) -> str:
         return self.text
@@ -337,13 +669,24 @@ class Consequent:
 
     def unload(self) -> None:
         self.conclusions.clear()
+        self._activated.clear()
 
     def modify(self, activation_degree: float, implication: Optional[TNorm]) -> None:
+        """
+        Modifies the fuzzy outputs with the terms of the conclusions activated with the degree.
+        The activated terms are reused once cleared from the outputs, unless a Context is active,
+        in which case new terms are created because other contexts may be using them. Hence, the
+        activated terms are valid only until the outputs are cleared (eg, by the next
+        `Engine.process`), and must be copied to keep them.
+        :param activation_degree: is the activation degree
+        :param implication: is the implication operator
+        """
         from .term import Activated
 
         if not self.conclusions:
             raise RuntimeError(f"consequent is not loaded")
 
+        context = Context.current() if _context._active else None
         for proposition in self.conclusions:
             if not proposition.variable:
                 raise ValueError(f"expected a variable in '{proposition}', "
@@ -357,7 +700,53 @@ class Consequent:
                 if not proposition.term:
                     raise ValueError(f"expected a term in proposition '{proposition}', "
                                      f"but found none")
-                activated_term = Activated(proposition.term, activation_degree, implication)
+                activated_term = self._activated.get(proposition) if context is None else None
+                if activated_term is not None and activated_term._cleared:
+                    activated_term.term = proposition.term
+                    activated_term.degree = activation_degree
+                    activated_term.implication = implication
+                    activated_term._cleared = False
+                else:
+                    activated_term = Activated(proposition.term, activation_degree, implication)
+                    if context is None:
+                        self._activated[proposition] = activated_term
+                if isinstance(proposition.variable, OutputVariable):
+                    fuzzy = (proposition.variable._fuzzy if context is None
+                             else proposition.variable.fuzzy)
+                    fuzzy.terms.append(activated_term)
+                else:
+                    raise RuntimeError(f"expected an output variable, but found "
+                                       f"'{type(proposition.variable)}'")
+
+    def modify_array(self, activation_degree: 'np.ndarray', implication: Optional[TNorm]) -> None:
+        """
+        Modifies the fuzzy outputs with the array of activation degrees, where the zero degrees
+        indicate the rule was not triggered
+        :param activation_degree: is the array of activation degrees
+        :param implication: is the implication operator
+        """
+        import numpy as np
+        from .term import Activated
+
+        if not self.conclusions:
+            raise RuntimeError("consequent is not loaded")
+
+        activation_degree = np.asarray(activation_degree, dtype=float)
+        triggered = activation_degree != 0.0
+        for proposition in self.conclusions:
+            if not proposition.variable:
+                raise ValueError(f"expected a variable in '{proposition}', "
+                                 f"but found none in consequent")
+            if proposition.variable.enabled:
+                for hedge in reversed(proposition.hedges):
+                    activation_degree = hedge.hedge_array(activation_degree)
+
+                if not proposition.term:
+                    raise ValueError(f"expected a term in proposition '{proposition}', "
+                                     f"but found none")
+                activated_term = Activated(proposition.term,
+                                           np.where(triggered, activation_degree, 0.0),
+                                           implication)
                 if isinstance(proposition.variable, OutputVariable):
                     proposition.variable.fuzzy.terms.append(activated_term)
                 else:
@@ -388,10 +777,10 @@ class Consequent:
 
         proposition: Optional[Proposition] = None
         conclusions: List[Proposition] = []
-        output_variables = {v.name: v for v in engine.output_variables}
+        hedges = lib.factory_manager.hedge
         for token in self.text.split():
             if state & s_variable:
-                variable = output_variables.get(token, None)
+                variable = NamedList.search(engine.output_variables, token, last=True)
                 if variable:
                     proposition = Proposition(variable)
                     conclusions.append(proposition)
@@ -404,16 +793,16 @@ class Consequent:
                     continue
 
             if state & s_hedge:
-                factory = lib.factory_manager.hedge
-                if token in factory:
-                    hedge = factory.construct(token)
+                if token in hedges.constructors:
+                    hedge = hedges.construct(token)
                     proposition.hedges.append(hedge)  # type: ignore
                     state = s_hedge | s_term
                     continue
 
             if state & s_term:
-                terms = {t.name: t for t in proposition.variable.terms}  # type: ignore
-                term = terms.get(token, None)
+                # the last term with the name is used
+                term = NamedList.search(proposition.variable.terms,  # type: ignore
+                                        token, last=True)
                 if term:
                     proposition.term = term  # type: ignore
                     state = s_and | s_with
@@ -460,14 +849,51 @@ class Rule(object):
     def __init__(self) -> None:
         self.enabled: bool = True
         self.weight: float = 1.0
-        self.activation_degree: float = 0.0
-        self.triggered: bool = False
-        self.antecedent: Antecedent = Antecedent()
+        self._activation_degree: float = 0.0
+        self._triggered: bool = False
+        self._antecedent: Antecedent = Antecedent()
         self.consequent: Consequent = Consequent()
 
     def __str__(self) -> str:
         return FllExporter().rule(self)
 
+    @property
+    def antecedent(self) -> 'Antecedent':
+        return self._antecedent
+
+    @antecedent.setter
+    def antecedent(self, antecedent: 'Antecedent') -> None:
+        # replacing the antecedent discards the indexes of the rule blocks that contain it
+        self._antecedent._changed()
+        self._antecedent = antecedent
+
+    @property
+    def activation_degree(self) -> float:
+        context = Context.current() if _context._active else None
+        return (self._activation_degree if context is None
+                else context.activation_degrees.get(self, 0.0))
+
+    @activation_degree.setter
+    def activation_degree(self, value: float) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._activation_degree = value
+        else:
+            context.activation_degrees[self] = value
+
+    @property
+    def triggered(self) -> bool:
+        context = Context.current() if _context._active else None
+        return self._triggered if context is None else context.triggered.get(self, False)
+
+    @triggered.setter
+    def triggered(self, value: bool) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._triggered = value
+        else:
+            context.triggered[self] = value
+
     @property
     def text(self) -> str:
         result = [Rule.IF,
@@ -536,23 +962,67 @@ class Rule(object):
         self.weight = weight
 
     def deactivate(self) -> None:
-        self.activation_degree = 0.0
-        self.triggered = False
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._activation_degree = 0.0
+            self._triggered = False
+        else:
+            context.activation_degrees.pop(self, None)
+            context.triggered.pop(self, None)
 
     def activate_with(self, conjunction: Optional[TNorm], disjunction: Optional[SNorm]) -> float:
         if not self.is_loaded():
             raise RuntimeError(f"rule is not loaded: '{self.text}'")
-        self.activation_degree = (self.weight
-                                  * self.antecedent.activation_degree(conjunction, disjunction))
-        return self.activation_degree
+        activation_degree = self.weight * self.antecedent.activation_degree(conjunction,
+                                                                            disjunction)
+        if _context._active:
+            self.activation_degree = activation_degree
+        else:
+            self._activation_degree = activation_degree
+        return activation_degree
+
+    def activate_with_array(self, conjunction: Optional[TNorm],
+                            disjunction: Optional[SNorm]) -> 'np.ndarray':
+        """
+        Computes the array of activation degrees of the rule when the values of the input
+        variables are arrays. Unlike `activate_with`, the activation degree of the rule is not
+        modified.
+        """
+        if not self.is_loaded():
+            raise RuntimeError(f"rule is not loaded: '{self.text}'")
+        return self.weight * self.antecedent.activation_degree_array(conjunction, disjunction)
+
+    def trigger_array(self, activation_degree: 'np.ndarray', implication: Optional[TNorm]) -> None:
+        """
+        Triggers the rule where the array of activation degrees is greater than zero. Unlike
+        `trigger`, the triggered state of the rule is not modified.
+        """
+        import numpy as np
+        if not self.is_loaded():
+            raise RuntimeError(f"rule is not loaded: '{self.text}'")
+        if self.enabled:
+            activation_degree = np.asarray(activation_degree, dtype=float)
+            triggered = Op.gt_array(activation_degree, 0.0)
+            if triggered.any():
+                self.consequent.modify_array(np.where(triggered, activation_degree, 0.0),
+                                             implication)
 
     def trigger(self, implication: Optional[TNorm]) -> None:
-        self.triggered = False
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._triggered = False
+        else:
+            context.triggered[self] = False
         if not self.is_loaded():
             raise RuntimeError(f"rule is not loaded: '{self.text}'")
-        if self.enabled and Op.gt(self.activation_degree, 0.0):
-            self.consequent.modify(self.activation_degree, implication)
-            self.triggered = True
+        activation_degree = (self._activation_degree if context is None
+                             else context.activation_degrees.get(self, 0.0))
+        if self.enabled and Op.gt(activation_degree, 0.0):
+            self.consequent.modify(activation_degree, implication)
+            if context is None:
+                self._triggered = True
+            else:
+                context.triggered[self] = True
 
     def is_loaded(self) -> bool:
         return self.antecedent.is_loaded() and self.consequent.is_loaded()
@@ -576,7 +1046,28 @@ class Rule(object):
         return rule
 
 
-class RuleBlock:
+class _Conjunction:
+    """
+      The _Conjunction class is a node of the index of the rules by the propositions that their
+      antecedents require to be non-zero, where each path from the root follows the propositions
+      of the rules, and each rule is indexed at the node of its last required proposition.
+    """
+
+    __slots__ = ("rules", "children")
+
+    def __init__(self) -> None:
+        self.rules: List[int] = []
+        self.children: Dict[Tuple[InputVariable, 'Term'], _Conjunction] = {}
+
+
+class RuleBlock(Named):
+    # t-norms whose result is zero when either operand is zero, provided the operands are in [0,1]
+    ABSORBING_CONJUNCTIONS = (AlgebraicProduct, BoundedDifference, DrasticProduct,
+                              EinsteinProduct, HamacherProduct, Minimum, NilpotentMinimum)
+    # hedges and s-norms whose results are in [0,1] when their operands are in [0,1]
+    BOUNDED_HEDGES = (Any, Extremely, Not, Seldom, Somewhat, Very)
+    BOUNDED_DISJUNCTIONS = (AlgebraicSum, BoundedSum, DrasticSum, EinsteinSum, HamacherSum,
+                            Maximum, NilpotentMaximum, NormalizedSum)
 
     def __init__(self,
                  name: str = "",
@@ -594,22 +1085,237 @@ class RuleBlock:
         self.disjunction = disjunction
         self.implication = implication
         self.activation = activation
-        self.rules: List[Rule] = []
-        if rules:
-            self.rules.extend(rules)
+        self._dependencies: Optional[Dict['Variable', List[Rule]]] = None
+        self._conjunctions: Optional[Tuple[Tuple[object, ...], _Conjunction,
+                                           List[Tuple[InputVariable, 'Term']]]] = None
+        self._fired_rules: Optional[List[Rule]] = None
+        self.rules = _Rules(self, rules or ())
+
+    def __getstate__(self) -> Dict[str, object]:
+        # the indexes are built again when needed after unpickling
+        state = self.__dict__.copy()
+        state['_dependencies'] = state['_conjunctions'] = state['_fired_rules'] = None
+        return state
 
     def __str__(self) -> str:
         return FllExporter().rule_block(self)
 
+    @property
+    def rules(self) -> List[Rule]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: List[Rule]) -> None:
+        # the rules are kept in a list whose modifications discard the indexes
+        if not (isinstance(rules, _Rules) and rules._rule_block is self):
+            rules = _Rules(self, rules)
+        self._rules = rules
+        self._discard_indexes()
+
+    def _discard_indexes(self) -> None:
+        # the indexes are built again on first use after the rules or their antecedents change
+        self._dependencies = None
+        self._conjunctions = None
+
     def activate(self) -> None:
         if not self.activation:
             raise ValueError(f"expected an activation method, "
                              f"but found none in rule block:\n{str(self)}")
         return self.activation.activate(self)
 
+    def activate_batch(self) -> None:
+        """
+        Activates the rule block when the values of the input variables are arrays
+        """
+        if not self.activation:
+            raise ValueError(f"expected an activation method, "
+                             f"but found none in rule block:\n{str(self)}")
+        return self.activation.activate_batch(self)
+
+    @property
+    def _fired(self) -> Optional[List[Rule]]:
+        # the rules activated by the previous General activation, or None if unknown
+        context = Context.current() if _context._active else None
+        return self._fired_rules if context is None else context.fired.get(self)
+
+    @_fired.setter
+    def _fired(self, rules: Optional[List[Rule]]) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._fired_rules = rules
+        elif rules is None:
+            context.fired.pop(self, None)
+        else:
+            context.fired[self] = rules
+
+    def deactivate_rules(self) -> None:
+        """
+        Deactivates the rules of the rule block, after which the activation methods other than
+        General activate the rules that they trigger.
+        """
+        for rule in self.rules:
+            rule.deactivate()
+        self._fired = None
+
+    def dependencies(self) -> Dict['Variable', List[Rule]]:
+        """
+        Gets the index from each variable to the rules whose antecedents reference it, which is
+        built when the rules are loaded and built again if the rules or their antecedents have
+        changed since.
+        :return: the index from each variable to the list of rules that depend on its value
+        """
+        if self._dependencies is None:
+            index: Dict['Variable', List[Rule]] = {}
+            for rule in self.rules:
+                rule.antecedent._own(self)
+                for variable in rule.antecedent.variables():
+                    index.setdefault(variable, []).append(rule)
+            self._dependencies = index
+        return self._dependencies
+
+    def firing_rules(self) -> List[Rule]:
+        """
+        Gets the rules that can fire given the memberships of the values of the input variables,
+        that is, the rules whose antecedents do not require a proposition with zero membership,
+        found in an index of the propositions required by the antecedents. Every rule can fire
+        if a membership of a proposition joined by a conjunction is not in [0,1] (eg, nan).
+        :return: the rules that can fire in the order of the rules in the rule block
+        """
+        _, root, operands = self._index_conjunctions()
+        if not all(RuleBlock._bounded_membership(*operand) for operand in operands):
+            return list(self.rules)
+        fires: Dict[Tuple[InputVariable, 'Term'], bool] = {}
+        result: List[int] = []
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            result.extend(node.rules)
+            for key, child in node.children.items():
+                fired = fires.get(key)
+                if fired is None:
+                    fired = fires[key] = RuleBlock._fires(*key)
+                if fired:
+                    nodes.append(child)
+        result.sort()
+        return [self.rules[index] for index in result]
+
+    @staticmethod
+    def _bounded_membership(variable: InputVariable, term: 'Term') -> bool:
+        if not variable.enabled:
+            return True  # the activation degree of the proposition is zero
+        try:
+            return 0.0 <= variable.membership(term) <= 1.0
+        except Exception:
+            # every rule is activated to raise the exception
+            return False
+
+    @staticmethod
+    def _fires(variable: InputVariable, term: 'Term') -> bool:
+        if not variable.enabled:
+            return False
+        try:
+            return not variable.membership(term) == 0.0
+        except Exception:
+            # the rules requiring the term are activated to raise the exception
+            return True
+
+    def _index_conjunctions(self) -> Tuple[Tuple[object, ...], _Conjunction,
+                                           List[Tuple[InputVariable, 'Term']]]:
+        # the index of the required propositions, and the operands of the conjunctions of the
+        # antecedents whose propositions are required only if the operands are in [0,1]
+        key = (type(self.conjunction), type(self.disjunction))
+        if self._conjunctions is None or self._conjunctions[0] != key:
+            root = _Conjunction()
+            operands: Dict[Tuple[InputVariable, 'Term'], None] = {}
+            ordinals: Dict[object, int] = {}
+            for index, rule in enumerate(self.rules):
+                rule.antecedent._own(self)
+                expression = rule.antecedent.expression
+                required = self._required_propositions(expression)
+                if required and not isinstance(expression, Proposition):
+                    operands.update(dict.fromkeys(RuleBlock._operands(expression)))
+                node = root
+                for variable, term in sorted(required, key=lambda pair: (
+                        ordinals.setdefault(pair[0], len(ordinals)),
+                        ordinals.setdefault(pair[1], len(ordinals)))):
+                    child = node.children.get((variable, term))
+                    if child is None:
+                        child = node.children[(variable, term)] = _Conjunction()
+                    node = child
+                node.rules.append(index)
+            self._conjunctions = (key, root, list(operands))
+        return self._conjunctions
+
+    @staticmethod
+    def _operands(expression: Optional[Expression]) -> List[Tuple[InputVariable, 'Term']]:
+        # the propositions of the antecedent whose memberships are not ignored
+        result: List[Tuple[InputVariable, 'Term']] = []
+        nodes: List[Expression] = [expression] if expression else []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Proposition):
+                if node.hedges and isinstance(node.hedges[-1], Any):
+                    continue
+                if isinstance(node.variable, InputVariable) and node.term:
+                    result.append((node.variable, node.term))
+            elif isinstance(node, Operator):
+                nodes.extend(child for child in (node.right, node.left) if child)
+        return result
+
+    def _required_propositions(self, expression: Optional[Expression]
+                               ) -> List[Tuple[InputVariable, 'Term']]:
+        # the proposition of an antecedent without operators is required regardless of the norms,
+        # and the propositions joined by conjunctions are required if their operands are bounded
+        absorbing = type(self.conjunction) in RuleBlock.ABSORBING_CONJUNCTIONS
+        if not (isinstance(expression, Proposition)
+                or (absorbing and self._bounded(expression))):
+            return []
+        result: Dict[Tuple[InputVariable, 'Term'], None] = {}
+        nodes: List[Expression] = [expression] if expression else []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Proposition):
+                if not (isinstance(node.variable, InputVariable) and node.term):
+                    continue
+                degree = 0.0
+                try:
+                    for hedge in reversed(node.hedges):
+                        degree = hedge.hedge(degree)
+                except Exception:
+                    continue
+                if degree == 0.0:
+                    result[(node.variable, node.term)] = None
+            elif isinstance(node, Operator) and node.name == Rule.AND:
+                nodes.extend(child for child in (node.right, node.left) if child)
+        return list(result)
+
+    def _bounded(self, expression: Optional[Expression]) -> bool:
+        # whether every operand of the antecedent is in [0,1] when the memberships of its
+        # propositions are in [0,1], which are checked by `firing_rules` on every call
+        bounded_disjunction = type(self.disjunction) in RuleBlock.BOUNDED_DISJUNCTIONS
+        nodes: List[Expression] = [expression] if expression else []
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, Proposition):
+                if not all(type(hedge) in RuleBlock.BOUNDED_HEDGES for hedge in node.hedges):
+                    return False
+                if node.hedges and isinstance(node.hedges[-1], Any):
+                    continue  # the membership is ignored
+                if not (isinstance(node.variable, InputVariable) and node.term):
+                    return False
+            elif isinstance(node, Operator) and (
+                    node.name == Rule.AND or (node.name == Rule.OR and bounded_disjunction)):
+                nodes.extend(child for child in (node.right, node.left) if child)
+            else:
+                return False
+        return True
+
     def unload_rules(self) -> None:
         for rule in self.rules:
             rule.unload()
+        self._dependencies = None
+        self._conjunctions = None
+        self._fired = None
 
     def load_rules(self, engine: 'Engine') -> None:
         exceptions: List[str] = []  # noqa E701 (False Positive)
@@ -619,6 +1325,10 @@ class RuleBlock:
                 rule.load(engine)
             except Exception as ex:
                 exceptions.append(f"['{str(rule)}']: {str(ex)}")
+        self._fired = None
+        self._conjunctions = None
+        self.dependencies()
+        self._index_conjunctions()
         if exceptions:
             raise RuntimeError("failed to load the following rules:\n"
                                + "\n".join(exceptions))
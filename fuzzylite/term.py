@@ -22,22 +22,68 @@ __all__ = ["Activated", "Aggregated", "Bell", "Binary", "Concave", "Constant", "
 
 import bisect
 import enum
+import functools
 import logging
+import operator
 import re
 import typing
-from math import cos, exp, fabs, inf, isnan, nan, pi
-from typing import (Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set,
+from array import array
+from math import cos, exp, fabs, inf, isnan, log, nan, pi, sqrt
+from typing import (Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence,
                     SupportsFloat, Tuple, TypeVar, Union)
 
 from .exporter import FllExporter
+from .named import Named, NamedList, _IndexedList
 from .norm import SNorm, TNorm
 from .operation import Op
 
 if typing.TYPE_CHECKING:
+    from re import Pattern
+    from types import CodeType
+
+    import numpy as np  # noqa: F401
+
     from .engine import Engine  # noqa F401
+    from .variable import Variable  # noqa F401
+
+# the logger of the library (see `Library.logger`), whose level is checked as in `Library.debugging`
+# before logging from the membership functions of Activated and Aggregated, which are called once
+# per defuzzifier sample
+_logger = logging.getLogger("fuzzylite")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_program(source: str) -> 'CodeType':
+    # the names bound in the programs depend only on the structure of the formulas, hence
+    # the functions with the same structure share the code
+    return compile(source, "<function>", "exec")
+
 
+@functools.lru_cache(maxsize=16)
+def _infix_regex(elements: Tuple[Tuple[str, 'Function.Element'], ...]) -> 'Pattern[str]':
+    # the regular expression that separates the operators in formulas, which is built once per
+    # set of elements registered in the function factory
+    from .rule import Rule
+    operators = {name for name, element in elements if element.is_operator()}
+    operators |= {'(', ')', ','}
+    operators -= {Rule.AND, Rule.OR}
 
-class Term:
+    # sorted to have multi-char operators separated first (eg., ** and *)
+    regex = "|".join(re.escape(o) for o in sorted(operators, reverse=True))
+    return re.compile(fr"({regex})")
+
+
+def _batch_aligned(value: 'np.ndarray', x: 'np.ndarray') -> 'np.ndarray':
+    # the values of engine variables are arrays along the leading (batch) axes when processing
+    # batches of inputs, which are aligned to x by appending the missing trailing axes
+    import numpy as np
+    value = np.asarray(value)
+    if 0 < value.ndim < np.ndim(x):
+        value = np.reshape(value, value.shape + (1,) * (np.ndim(x) - value.ndim))
+    return value
+
+
+class Term(Named):
     """
       The Term class is the abstract class for linguistic terms. The linguistic
       terms in this library can be divided in four groups as: `basic`,
@@ -66,6 +112,8 @@ class Term:
           height is the height of the term
     """
 
+    __slots__ = ("_name", "height", "_owners")
+
     def __init__(self, name: str = "", height: float = 1.0) -> None:
         self.name = name
         self.height = height
@@ -123,6 +171,19 @@ class Term:
         """
         raise NotImplementedError()
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        r"""
+          Computes the membership function values of an array of values. By default, the
+          membership function is computed for each element, so derived classes should override
+          this method with vectorized operations.
+          :param x is an array of values
+          :return the array of membership function values @f$\mu(x)@f$
+        """
+        import numpy as np
+        # the scalar membership function compares nan values without warnings
+        with np.errstate(invalid='ignore'):
+            return np.vectorize(self.membership, otypes=[float])(x)  # type: ignore
+
     def update_reference(self, engine: Optional['Engine']) -> None:
         """
           Updates the references (if any) to point to the current engine (useful
@@ -147,6 +208,26 @@ class Term:
         """
         return self.membership(activation_degree)
 
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        """
+          Computes the tsukamoto values of the term for an array of activation degrees. By
+          default, the tsukamoto value is computed for each element (or the membership function
+          is computed if the term does not override `tsukamoto`), so derived classes should
+          override this method with vectorized operations.
+          :param activation_degree: is the array of activation degrees
+          :param minimum is the minimum value of the range of the term
+          :param maximum is the maximum value of the range of the term
+          :return the array of tsukamoto values of the term for the activation degrees
+        """
+        import numpy as np
+        if type(self).tsukamoto is Term.tsukamoto:
+            return self.membership_array(activation_degree)
+        with np.errstate(invalid='ignore'):
+            return np.vectorize(  # type: ignore
+                lambda degree: self.tsukamoto(degree, minimum, maximum),
+                otypes=[float])(activation_degree)
+
     def is_monotonic(self) -> bool:
         """
         Indicates whether the term is monotonic.
@@ -158,23 +239,35 @@ class Term:
                    bounded_mf: bool = True) -> 'Discrete':
         result = Discrete(self.name)
         dx = (end - start) / resolution
-        for i in range(0, resolution + 1):
-            x = start + i * dx
-            y = self.membership(x)
+        try:
+            import numpy as np
+        except ImportError:  # numpy is optional
+            xs = array('d', [start + i * dx for i in range(resolution + 1)])
+            ys = array('d', [self.membership(x) for x in xs])
             if bounded_mf:
-                y = Op.bound(y, 0.0, 1.0)
-            result.xy.append(Discrete.Pair(x, y))
+                ys = array('d', [Op.bound(y, 0.0, 1.0) for y in ys])
+            result.set_arrays(xs, ys)
+            return result
+        x = start + np.arange(resolution + 1) * dx
+        y = self.membership_array(x)
+        if bounded_mf:
+            y = np.clip(y, 0.0, 1.0)
+        result.set_arrays(x, y)
         return result
 
 
 class Activated(Term):
 
+    __slots__ = ("term", "degree", "implication", "_cleared")
+
     def __init__(self, term: Term, degree: float = 1.0,
                  implication: Optional[TNorm] = None) -> None:
         super().__init__("_")
         self.term = term
         self.degree = degree
         self.implication = implication
+        # whether the term was cleared from the Aggregated, such that it can be reused
+        self._cleared = False
 
     def parameters(self) -> str:
         name = self.term.name if self.term else "none"
@@ -194,12 +287,61 @@ class Activated(Term):
         if not self.implication:
             raise ValueError("expected an implication operator, but none found")
         result = self.implication.compute(self.term.membership(x), self.degree)
-        logging.debug(f"{Op.str(result)}: {str(self)}")
+        if _logger.level == logging.DEBUG:
+            _logger.debug(f"{Op.str(result)}: {str(self)}")
         return result
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the activated membership function values of an array of values. If the degree
+        is an array of activation degrees, the result has the shape of the degrees with an
+        additional last axis for the values of x.
+        """
+        import numpy as np
+        if not self.term:
+            raise ValueError("expected a term to activate, but none found")
+        if not self.implication:
+            raise ValueError("expected an implication operator, but none found")
+        degree = np.asarray(self.degree, dtype=float)
+        # the term is evaluated with the batch axes leading the axis of the values of x
+        x = np.reshape(x, (1,) * degree.ndim + np.shape(x))
+        return self.implication.compute_array(self.term.membership_array(x),
+                                              np.expand_dims(degree, -1))
+
+
+class _ActivatedTerms(_IndexedList[Activated]):
+    """
+      The _ActivatedTerms class is the list of activated terms of an Aggregated term, which
+      indexes the activation degree of each term, rebuilt on the first search after the list is
+      modified or the aggregation operator is changed. Hence, the activated terms must not be
+      modified while in the list.
+    """
+
+    _index: Optional[Tuple[Optional[SNorm], Dict[Term, float]]] = None
+
+    def degrees(self, aggregation: Optional[SNorm]) -> Dict[Term, float]:
+        """
+        Gets the activation degree of each term, aggregated or summed if no aggregation.
+        :param aggregation: is the aggregation operator
+        :return: the activation degree of each term activated
+        """
+        index = self._index
+        if index is None or index[0] is not aggregation:
+            degrees: Dict[Term, float] = {}
+            for activation in self:
+                degree = degrees.get(activation.term, 0.0)
+                if aggregation:
+                    degrees[activation.term] = aggregation.compute(degree, activation.degree)
+                else:
+                    degrees[activation.term] = degree + activation.degree
+            index = self._index = (aggregation, degrees)
+        return index[1]
+
 
 class Aggregated(Term):
 
+    __slots__ = ("minimum", "maximum", "aggregation", "terms")
+
     def __init__(self, name: str = "", minimum: float = nan, maximum: float = nan,
                  aggregation: Optional[SNorm] = None,
                  terms: Optional[Iterable[Activated]] = None) -> None:
@@ -207,7 +349,7 @@ class Aggregated(Term):
         self.minimum = minimum
         self.maximum = maximum
         self.aggregation = aggregation
-        self.terms: List[Activated] = []
+        self.terms: List[Activated] = _ActivatedTerms()
         if terms:
             self.terms.extend(terms)
 
@@ -234,10 +376,27 @@ class Aggregated(Term):
         result = 0.0
         for term in self.terms:
             result = self.aggregation.compute(result, term.membership(x))  # type: ignore
-        logging.debug(f"{Op.str(result)}: {str(self)}")
+        if _logger.level == logging.DEBUG:
+            _logger.debug(f"{Op.str(result)}: {str(self)}")
         return result
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        if self.terms and not self.aggregation:
+            raise ValueError("expected an aggregation operator, but none found")
+
+        x = np.asarray(x, dtype=float)
+        result = np.zeros(x.shape)
+        for term in self.terms:
+            result = self.aggregation.compute_array(  # type: ignore
+                result, term.membership_array(x))
+        return np.where(np.isnan(x), nan, result)  # type: ignore
+
     def activation_degree(self, term: Term) -> float:
+        # the degrees are indexed unless the list of terms was replaced by another list
+        if isinstance(self.terms, _ActivatedTerms):
+            return self.terms.degrees(self.aggregation).get(term, 0.0)
+
         result = 0.0
 
         for activation in self.terms:
@@ -249,6 +408,22 @@ class Aggregated(Term):
 
         return result
 
+    def activation_degree_array(self, term: Term) -> 'np.ndarray':
+        """
+        Computes the activation degree of the term when the degrees of the activated terms are
+        arrays of activation degrees
+        """
+        import numpy as np
+        result = np.zeros(())
+        for activation in self.terms:
+            if activation.term == term:
+                degree = np.asarray(activation.degree, dtype=float)
+                if self.aggregation:
+                    result = self.aggregation.compute_array(result, degree)
+                else:
+                    result = result + degree
+        return result
+
     def highest_activated_term(self) -> Optional[Activated]:
         result = None
         maximum_activation = -inf
@@ -259,11 +434,18 @@ class Aggregated(Term):
         return result
 
     def clear(self) -> None:
+        # the cleared terms are reused by the consequents that activated them, which modifies
+        # them in place (see `Consequent.modify`)
+        for term in self.terms:
+            if isinstance(term, Activated):
+                term._cleared = True
         self.terms.clear()
 
 
 class Bell(Term):
 
+    __slots__ = ("center", "width", "slope")
+
     def __init__(self, name: str = "", center: float = nan, width: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -277,6 +459,14 @@ class Bell(Term):
         return self.height * (1.0 / (1.0 + (fabs((x - self.center) / self.width)
                                             ** (2.0 * self.slope))))
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = self.height * (1.0 / (1.0 + (np.abs((x - self.center) / self.width)
+                                             ** (2.0 * self.slope))))
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width, self.slope)
 
@@ -288,6 +478,8 @@ class Bell(Term):
 
 class Binary(Term):
 
+    __slots__ = ("start", "direction")
+
     def __init__(self, name: str = "", start: float = nan, direction: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -306,6 +498,17 @@ class Binary(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        if self.direction > self.start:
+            y = np.where(x >= self.start, self.height * 1.0, self.height * 0.0)
+        elif self.direction < self.start:
+            y = np.where(x <= self.start, self.height * 1.0, self.height * 0.0)
+        else:
+            y = np.full(x.shape, self.height * 0.0)
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.direction)
 
@@ -317,6 +520,8 @@ class Binary(Term):
 
 class Concave(Term):
 
+    __slots__ = ("inflection", "end")
+
     def __init__(self, name: str = "", inflection: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -339,6 +544,22 @@ class Concave(Term):
 
         return self.height * 1.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            if self.inflection <= self.end:  # Concave increasing
+                y = np.where(x < self.end,
+                             (self.height * (self.end - self.inflection)
+                              / (2.0 * self.end - self.inflection - x)),
+                             self.height * 1.0)
+            else:  # Concave decreasing
+                y = np.where(x > self.end,
+                             (self.height * (self.inflection - self.end)
+                              / (self.inflection - 2.0 * self.end + x)),
+                             self.height * 1.0)
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -347,6 +568,14 @@ class Concave(Term):
         e = self.end
         return (i - e) / self.membership(activation_degree) + 2 * e - i
 
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        i = self.inflection
+        e = self.end
+        with np.errstate(all='ignore'):
+            return (i - e) / self.membership_array(activation_degree) + 2 * e - i  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.inflection, self.end)
 
@@ -358,6 +587,8 @@ class Concave(Term):
 
 class Constant(Term):
 
+    __slots__ = ("value",)
+
     def __init__(self, name: str = "", value: float = nan) -> None:
         super().__init__(name)
         self.value = value
@@ -365,6 +596,10 @@ class Constant(Term):
     def membership(self, x: float) -> float:
         return self.value
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        return np.full(np.shape(x), self.value, dtype=float)
+
     def parameters(self) -> str:
         return super()._parameters(self.value)
 
@@ -378,6 +613,8 @@ class Constant(Term):
 
 class Cosine(Term):
 
+    __slots__ = ("center", "width")
+
     def __init__(self, name: str = "", center: float = nan, width: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -393,6 +630,17 @@ class Cosine(Term):
 
         return self.height * 0.5 * (1.0 + cos(2.0 / self.width * pi * (x - self.center)))
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = np.where((x < self.center - 0.5 * self.width)
+                         | (x > self.center + 0.5 * self.width),
+                         self.height * 0.0,
+                         self.height * 0.5 * (1.0 + np.cos(np.divide(2.0, self.width) * pi
+                                                           * (x - self.center))))
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width)
 
@@ -405,12 +653,26 @@ class Cosine(Term):
 class Discrete(Term):
     Floatable = TypeVar("Floatable", SupportsFloat, str, bytes)
 
+    __slots__ = ("_x", "_y", "_direction", "_pairs", "_synced")
+
     class Pair:
 
         def __init__(self, x: float = nan, y: float = nan) -> None:
             self.x = x
             self.y = y
 
+        def __setattr__(self, name: str, value: object) -> None:
+            # the pairs count their changes in the (x,y)-pairs of the terms (see `Discrete.xy`)
+            for changes in self.__dict__.get("_changes", ()):
+                changes[0] += 1
+            object.__setattr__(self, name, value)
+
+        def __getstate__(self) -> Dict[str, object]:
+            # the copies are not in the (x,y)-pairs of the terms
+            state = self.__dict__.copy()
+            state.pop("_changes", None)
+            return state
+
         def __str__(self) -> str:
             return f"({self.x}, {self.y})"
 
@@ -464,47 +726,255 @@ class Discrete(Term):
         def values(self, xy: Tuple[float, float]) -> None:
             self.x, self.y = xy
 
+    class _Pairs(_IndexedList['Discrete.Pair']):
+        """
+          The _Pairs class is the list of (x,y)-pairs of a Discrete term, which counts the
+          modifications to the list and to its pairs, such that the term updates its arrays of
+          values on first use after the (x,y)-pairs are modified.
+        """
+
+        def __init__(self, pairs: Iterable['Discrete.Pair'] = ()) -> None:
+            super().__init__(pairs)
+            self._changes = [0]
+
+        def __reduce__(self) -> Tuple[type, Tuple[List['Discrete.Pair']]]:
+            # the copies are lists of (x,y)-pairs not in any term
+            return list, (list(self),)
+
+        def _modified(self) -> None:
+            self._changes[0] += 1
+
+        def _count_changes(self) -> None:
+            # the pairs count their changes in the list
+            changes = self._changes
+            for pair in self:
+                counters = pair.__dict__.setdefault("_changes", [])
+                if not any(counter is changes for counter in counters):
+                    counters.append(changes)
+
     def __init__(self,
                  name: str = "",
                  xy: Optional[Sequence[Floatable]] = None,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
-        self.xy: List[Discrete.Pair] = []
+        self._x: Sequence[float] = array('d')
+        self._y: Sequence[float] = array('d')
+        self._direction: Optional[int] = None
+        # the (x,y)-pairs handed out by `xy`, and their number of changes when last synced
+        self._pairs: Optional[Discrete._Pairs] = None
+        self._synced = 0
         if xy:
             self.xy = Discrete.pairs_from(xy)
 
     def __iter__(self) -> Iterator['Discrete.Pair']:
         return iter(self.xy)
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the views of files mapped into memory (see `BinaryImporter`) cannot be pickled, so
+        # they are copied into arrays
+        self._sync()
+        state = dict(getattr(self, "__dict__", {}))
+        for name in ("_name", "height", "_x", "_y", "_direction"):
+            value = getattr(self, name)
+            state[name] = array('d', value.tobytes()) if isinstance(value, memoryview) else value
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self._pairs = None
+        self._synced = 0
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def xy(self) -> List['Discrete.Pair']:
+        """
+        Gets the list of (x,y)-pairs, which is created from the arrays of values on first use.
+        The list and its pairs can be modified (eg, appending pairs or changing their values),
+        in which case the arrays of values are updated on the next use of the term.
+        :return: the list of (x,y)-pairs
+        """
+        if self._pairs is None:
+            self._pairs = Discrete._Pairs(
+                map(Discrete.Pair, self._x.tolist(), self._y.tolist()))  # type: ignore
+            self._pairs._count_changes()
+            self._synced = self._pairs._changes[0]
+        return self._pairs
+
+    @xy.setter
+    def xy(self, pairs: Iterable['Discrete.Pair']) -> None:
+        pairs = Discrete._Pairs(pairs)
+        self.set_arrays(array('d', [pair.x for pair in pairs]),
+                        array('d', [pair.y for pair in pairs]))
+        pairs._count_changes()
+        self._pairs, self._synced = pairs, pairs._changes[0]
+
+    def _sync(self) -> None:
+        # updates the arrays of values after the (x,y)-pairs handed out by `xy` are modified
+        pairs = self._pairs
+        if pairs is not None and pairs._changes[0] != self._synced:
+            self._x = array('d', [pair.x for pair in pairs])
+            self._y = array('d', [pair.y for pair in pairs])
+            self._direction = None
+            pairs._count_changes()
+            self._synced = pairs._changes[0]
+
+    def set_arrays(self, x: Sequence[float], y: Sequence[float]) -> None:
+        """
+        Sets the values of the (x,y)-pairs, keeping the arrays of floats (ie, `array('d')`,
+        memoryviews of doubles, and contiguous NumPy arrays of float64) without copying them,
+        hence they must not be modified afterwards. The (x,y)-pairs handed out by `xy` (if any)
+        are no longer those of the term.
+        :param x: are the values of x in ascending order
+        :param y: are the values of y
+        """
+        x, y = Discrete._floats(x), Discrete._floats(y)
+        if len(x) != len(y):
+            raise ValueError(f"expected the same number of values of x and y, "
+                             f"but got {len(x)} and {len(y)}")
+        self._x, self._y = x, y
+        self._direction = None
+        self._pairs = None
+
+    @staticmethod
+    def _floats(values: Sequence[float]) -> Sequence[float]:
+        if isinstance(values, array) and values.typecode == 'd':
+            return values
+        if isinstance(values, memoryview) and values.format == 'd' and values.ndim == 1:
+            return values
+        if hasattr(values, "__array__"):
+            import numpy as np
+            result = np.ascontiguousarray(values, dtype=float)
+            if result.ndim != 1:
+                raise ValueError(f"expected a one-dimensional array, "
+                                 f"but got shape {result.shape}")
+            return result  # type: ignore
+        return array('d', [Op.scalar(value) for value in values])
+
     def membership(self, x: float) -> float:
         if isnan(x):
             return nan
 
-        if not self.xy:
+        if self._pairs is not None:
+            self._sync()
+        xs, ys = self._x, self._y
+        if not len(xs):
             raise ValueError("expected a list of (x,y)-pairs, but found none")
 
-        if x <= self.xy[0].x:
-            return self.height * self.xy[0].y
+        if x <= xs[0]:
+            return self.height * float(ys[0])
 
-        if x >= self.xy[-1].x:
-            return self.height * self.xy[-1].y
+        if x >= xs[-1]:
+            return self.height * float(ys[-1])
 
-        index = bisect.bisect(self.xy, (x, -inf))
+        index = bisect.bisect_left(xs, x)
 
-        upper_bound = self.xy[index]
-        if Op.eq(x, upper_bound.x):
-            return self.height * upper_bound.y
+        if Op.eq(x, xs[index]):
+            return self.height * float(ys[index])
 
-        lower_bound = self.xy[index - 1]
+        return self.height * Op.scale(x, float(xs[index - 1]), float(xs[index]),
+                                      float(ys[index - 1]), float(ys[index]))
 
-        return self.height * Op.scale(x, lower_bound.x, upper_bound.x, lower_bound.y, upper_bound.y)
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        self._sync()
+        if not len(self._x):
+            raise ValueError("expected a list of (x,y)-pairs, but found none")
+
+        xs, ys = self.arrays()
+        if len(xs) == 1:
+            return np.where(np.isnan(x), nan, self.height * ys[0])  # type: ignore
+
+        upper = np.clip(np.searchsorted(xs, x, side='left'), 1, len(xs) - 1)
+        lower = upper - 1
+        with np.errstate(all='ignore'):
+            y = self.height * ((ys[upper] - ys[lower]) / (xs[upper] - xs[lower])
+                               * (x - xs[lower]) + ys[lower])
+        return np.select([np.isnan(x), x <= xs[0], x >= xs[-1], Op.eq_array(x, xs[upper])],
+                         [nan, self.height * ys[0], self.height * ys[-1], self.height * ys[upper]],
+                         y)
+
+    def is_monotonic(self) -> bool:
+        self._sync()
+        return self._monotonic() != 0
+
+    def _monotonic(self) -> int:
+        # 1 if the values of y never decrease, -1 if they never increase, or 0 otherwise
+        if self._direction is None:
+            ys = self._y
+            pairs = range(len(ys) - 1)
+            if len(ys) < 2:
+                self._direction = 0
+            elif all(ys[i] <= ys[i + 1] for i in pairs):
+                self._direction = 1
+            elif all(ys[i] >= ys[i + 1] for i in pairs):
+                self._direction = -1
+            else:
+                self._direction = 0
+        return self._direction
 
     def tsukamoto(self, activation_degree: float, minimum: float, maximum: float) -> float:
-        # todo: approximate tsukamoto
-        pass
+        """
+        Computes the first x (from the left) at which the membership function equals the
+        activation degree, using a binary search if the term is monotonic, or the first x at which
+        the membership function is the closest to the activation degree if none equals it.
+        """
+        if isnan(activation_degree):
+            return nan
+        self._sync()
+        xs, ys = self._x, self._y
+        if not len(xs):
+            raise ValueError("expected a list of (x,y)-pairs, but found none")
+        if self.height == 0.0:
+            return nan
+        y = activation_degree / self.height
+
+        direction = self._monotonic()
+        if direction:
+            low, high = 0, len(ys)
+            while low < high:
+                middle = (low + high) // 2
+                if (ys[middle] >= y) if direction > 0 else (ys[middle] <= y):
+                    high = middle
+                else:
+                    low = middle + 1
+            index = low
+            if index == len(ys):
+                return float(xs[-1])
+        else:
+            index = next((i for i in range(len(ys)) if ys[i] == y
+                          or (i and (ys[i - 1] < y) != (ys[i] < y))), len(ys))
+            if index == len(ys):
+                return float(xs[min(range(len(ys)), key=lambda i: abs(ys[i] - y))])
+
+        if index == 0 or ys[index] == y:
+            return float(xs[index])
+        return Op.scale(y, float(ys[index - 1]), float(ys[index]),
+                        float(xs[index - 1]), float(xs[index]))
+
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        self._sync()
+        if not (len(self._x) and self.height and self._monotonic()):
+            return super().tsukamoto_array(activation_degree, minimum, maximum)
+
+        xs, ys = self.arrays()
+        y = np.asarray(activation_degree, dtype=float) / self.height
+        # the index of the first value of y that reaches the degree
+        if self._monotonic() > 0:
+            index = np.searchsorted(ys, y, side='left')
+        else:
+            index = np.searchsorted(-ys, -y, side='left')
+        upper = np.clip(index, 1, len(ys) - 1)
+        lower = upper - 1
+        with np.errstate(all='ignore'):
+            z = xs[lower] + (y - ys[lower]) * (xs[upper] - xs[lower]) / (ys[upper] - ys[lower])
+        return np.select([np.isnan(y), index == 0, index == len(ys), ys[upper] == y],
+                         [nan, xs[0], xs[-1], xs[upper]], z)
 
     def parameters(self) -> str:
-        return super()._parameters(*Discrete.values_from(self.xy))
+        return super()._parameters(*self.values())
 
     def configure(self, parameters: str) -> None:
         values = [Op.scalar(x) for x in parameters.split()]
@@ -514,16 +984,52 @@ class Discrete(Term):
             self.height = values[-1]
             del values[-1]
 
-        self.xy = Discrete.pairs_from(values)
+        self.set_arrays(array('d', values[0::2]), array('d', values[1::2]))
 
-    def x(self) -> Iterable[float]:
-        return (pair.x for pair in self.xy)
+    def x(self) -> Sequence[float]:
+        """
+        Gets the values of x, which must not be modified.
+        :return: the array of values of x
+        """
+        self._sync()
+        return self._x
 
-    def y(self) -> Iterable[float]:
-        return (pair.y for pair in self.xy)
+    def y(self) -> Sequence[float]:
+        """
+        Gets the values of y, which must not be modified.
+        :return: the array of values of y
+        """
+        self._sync()
+        return self._y
+
+    def arrays(self) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Gets the values of x and y as NumPy arrays, which share the memory of the term if
+        possible, and hence must not be modified.
+        :return: the NumPy arrays of the values of x and y
+        """
+        import numpy as np
+        self._sync()
+        return np.asarray(self._x, dtype=float), np.asarray(self._y, dtype=float)
+
+    def values(self) -> List[float]:
+        """
+        Gets the values of the (x,y)-pairs interleaved (ie, x0, y0, x1, y1, ...).
+        :return: the values of the (x,y)-pairs interleaved
+        """
+        self._sync()
+        result = [nan] * (2 * len(self._x))
+        result[0::2] = self._x.tolist()  # type: ignore
+        result[1::2] = self._y.tolist()  # type: ignore
+        return result
 
     def sort(self) -> None:
-        self.xy.sort()
+        if self._pairs is not None:
+            # the arrays are updated on first use after sorting the (x,y)-pairs
+            self._pairs.sort()
+            return
+        pairs = sorted(zip(self._x.tolist(), self._y.tolist()))  # type: ignore
+        self.set_arrays(array('d', [x for x, _ in pairs]), array('d', [y for _, y in pairs]))
 
     @staticmethod
     def pairs_from(values: Union[Sequence[Floatable],
@@ -541,19 +1047,21 @@ class Discrete(Term):
 
     # TODO: More pythonic?
     @staticmethod
-    def values_from(pairs: List['Discrete.Pair']) -> List[float]:
+    def values_from(pairs: Iterable['Discrete.Pair']) -> List[float]:
         result: List[float] = []
         for xy in pairs:
             result.extend([xy.x, xy.y])
         return result
 
     @staticmethod
-    def dict_from(pairs: List['Discrete.Pair']) -> Dict[float, float]:
+    def dict_from(pairs: Iterable['Discrete.Pair']) -> Dict[float, float]:
         return {pair.x: pair.y for pair in pairs}
 
 
 class Gaussian(Term):
 
+    __slots__ = ("mean", "standard_deviation")
+
     def __init__(self, name: str = "", mean: float = nan, standard_deviation: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -566,6 +1074,15 @@ class Gaussian(Term):
         return self.height * exp((-(x - self.mean) * (x - self.mean))
                                  / (2.0 * self.standard_deviation * self.standard_deviation))
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = self.height * np.exp((-(x - self.mean) * (x - self.mean))
+                                     / (2.0 * self.standard_deviation
+                                        * self.standard_deviation))
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.mean, self.standard_deviation)
 
@@ -577,6 +1094,8 @@ class Gaussian(Term):
 
 class GaussianProduct(Term):
 
+    __slots__ = ("mean_a", "standard_deviation_a", "mean_b", "standard_deviation_b")
+
     def __init__(self, name: str = "", mean_a: float = nan, standard_deviation_a: float = nan,
                  mean_b: float = nan, standard_deviation_b: float = nan,
                  height: float = 1.0) -> None:
@@ -602,6 +1121,20 @@ class GaussianProduct(Term):
 
         return self.height * a * b
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            a = np.where(x < self.mean_a,
+                         np.exp((-(x - self.mean_a) * (x - self.mean_a))
+                                / (2.0 * self.standard_deviation_a * self.standard_deviation_a)),
+                         1.0)
+            b = np.where(x > self.mean_b,
+                         np.exp((-(x - self.mean_b) * (x - self.mean_b))
+                                / (2.0 * self.standard_deviation_b * self.standard_deviation_b)),
+                         1.0)
+        return np.where(np.isnan(x), nan, self.height * a * b)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.mean_a, self.standard_deviation_a,
                                    self.mean_b, self.standard_deviation_b)
@@ -614,6 +1147,8 @@ class GaussianProduct(Term):
 
 class Linear(Term):
 
+    __slots__ = ("coefficients", "engine")
+
     def __init__(self, name: str = "", coefficients: Optional[Iterable[float]] = None,
                  engine: Optional['Engine'] = None) -> None:
         super().__init__(name)
@@ -637,6 +1172,10 @@ class Linear(Term):
 
         return result
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        return np.zeros(np.shape(x)) + _batch_aligned(self.membership(nan), x)  # type: ignore
+
     def configure(self, parameters: str) -> None:
         self.coefficients = [Op.scalar(p) for p in parameters.split()]
 
@@ -649,6 +1188,8 @@ class Linear(Term):
 
 class PiShape(Term):
 
+    __slots__ = ("bottom_left", "top_left", "top_right", "bottom_right")
+
     def __init__(self, name: str = "", bottom_left: float = nan, top_left: float = nan,
                  top_right: float = nan, bottom_right: float = nan, height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -681,6 +1222,28 @@ class PiShape(Term):
 
         return self.height * s_shape * z_shape
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            s_shape = np.select(
+                [x <= self.bottom_left,
+                 x <= 0.5 * (self.bottom_left + self.top_left),
+                 x < self.top_left],
+                [0.0,
+                 2.0 * ((x - self.bottom_left) / (self.top_left - self.bottom_left)) ** 2,
+                 1.0 - 2.0 * ((x - self.top_left) / (self.top_left - self.bottom_left)) ** 2],
+                1.0)
+            z_shape = np.select(
+                [x <= self.top_right,
+                 x <= 0.5 * (self.top_right + self.bottom_right),
+                 x < self.bottom_right],
+                [1.0,
+                 1.0 - 2.0 * ((x - self.top_right) / (self.bottom_right - self.top_right)) ** 2,
+                 2.0 * ((x - self.bottom_right) / (self.bottom_right - self.top_right)) ** 2],
+                0.0)
+        return np.where(np.isnan(x), nan, self.height * s_shape * z_shape)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.bottom_left, self.top_left,
                                    self.top_right, self.bottom_right)
@@ -693,6 +1256,8 @@ class PiShape(Term):
 
 class Ramp(Term):
 
+    __slots__ = ("start", "end")
+
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -720,6 +1285,24 @@ class Ramp(Term):
                 return self.height * 1.0
             return self.height * (self.start - x) / (self.start - self.end)
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        if self.start == self.end:
+            return np.where(np.isnan(x), nan, self.height * 0.0)  # type: ignore
+
+        with np.errstate(all='ignore'):
+            if self.start < self.end:
+                return np.select(  # type: ignore
+                    [np.isnan(x), x <= self.start, x >= self.end],
+                    [nan, self.height * 0.0, self.height * 1.0],
+                    self.height * (x - self.start) / (self.end - self.start))
+
+            return np.select(  # type: ignore
+                [np.isnan(x), x >= self.start, x <= self.end],
+                [nan, self.height * 0.0, self.height * 1.0],
+                self.height * (self.start - x) / (self.start - self.end))
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -728,6 +1311,13 @@ class Ramp(Term):
             return nan
         return Op.scale(activation_degree, 0.0, self.height * 1.0, self.start, self.end)
 
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        with np.errstate(all='ignore'):
+            return Op.scale(np.asarray(activation_degree, dtype=float),  # type: ignore
+                            0.0, self.height * 1.0, self.start, self.end)
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.end)
 
@@ -739,6 +1329,8 @@ class Ramp(Term):
 
 class Rectangle(Term):
 
+    __slots__ = ("start", "end")
+
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -754,6 +1346,12 @@ class Rectangle(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        y = np.where((self.start <= x) & (x <= self.end), self.height * 1.0, self.height * 0.0)
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.end)
 
@@ -766,6 +1364,8 @@ class Rectangle(Term):
 # TODO: Tsukamoto
 class Sigmoid(Term):
 
+    __slots__ = ("inflection", "slope")
+
     def __init__(self, name: str = "", inflection: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -777,9 +1377,43 @@ class Sigmoid(Term):
             return nan
         return self.height * 1.0 / (1.0 + exp(-self.slope * (x - self.inflection)))
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = self.height * 1.0 / (1.0 + np.exp(-self.slope * (x - self.inflection)))
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def is_monotonic(self) -> bool:
         return True
 
+    def tsukamoto(self, activation_degree: float, minimum: float, maximum: float) -> float:
+        if isnan(activation_degree) or self.height == 0.0 or self.slope == 0.0:
+            return nan
+        y = activation_degree / self.height
+        # the sigmoid approaches (but never reaches) zero and one, which saturate to the ends of
+        # the range, and the values beyond the range are bounded to it
+        if y >= 1.0:
+            return maximum if self.slope > 0.0 else minimum
+        if y <= 0.0:
+            return minimum if self.slope > 0.0 else maximum
+        return Op.bound(self.inflection - log(1.0 / y - 1.0) / self.slope, minimum, maximum)
+
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        if self.height == 0.0 or self.slope == 0.0:
+            return np.full(np.shape(activation_degree), nan)
+        y = np.asarray(activation_degree, dtype=float) / self.height
+        with np.errstate(all='ignore'):
+            z = np.clip(self.inflection - np.log(1.0 / y - 1.0) / self.slope, minimum, maximum)
+        return np.select(  # type: ignore
+            [np.isnan(y), y >= 1.0, y <= 0.0],
+            [nan,
+             maximum if self.slope > 0.0 else minimum,
+             minimum if self.slope > 0.0 else maximum],
+            z)
+
     def parameters(self) -> str:
         return super()._parameters(self.inflection, self.slope)
 
@@ -791,6 +1425,8 @@ class Sigmoid(Term):
 
 class SigmoidDifference(Term):
 
+    __slots__ = ("left", "rising", "falling", "right")
+
     def __init__(self, name: str = "", left: float = nan, rising: float = nan,
                  falling: float = nan, right: float = nan, height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -808,6 +1444,14 @@ class SigmoidDifference(Term):
 
         return self.height * fabs(a - b)
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            a = 1.0 / (1.0 + np.exp(-self.rising * (x - self.left)))
+            b = 1.0 / (1.0 + np.exp(-self.falling * (x - self.right)))
+        return np.where(np.isnan(x), nan, self.height * np.abs(a - b))  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.left, self.rising, self.falling, self.right)
 
@@ -819,6 +1463,8 @@ class SigmoidDifference(Term):
 
 class SigmoidProduct(Term):
 
+    __slots__ = ("left", "rising", "falling", "right")
+
     def __init__(self, name: str = "", left: float = nan, rising: float = nan,
                  falling: float = nan, right: float = nan, height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -836,6 +1482,15 @@ class SigmoidProduct(Term):
 
         return self.height * 1.0 / (a * b)
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            a = 1.0 + np.exp(-self.rising * (x - self.left))
+            b = 1.0 + np.exp(-self.falling * (x - self.right))
+            y = self.height * 1.0 / (a * b)
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.left, self.rising, self.falling, self.right)
 
@@ -847,6 +1502,8 @@ class SigmoidProduct(Term):
 
 class Spike(Term):
 
+    __slots__ = ("center", "width")
+
     def __init__(self, name: str = "", inflection: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -858,6 +1515,13 @@ class Spike(Term):
             return nan
         return self.height * exp(-fabs(10.0 / self.width * (x - self.center)))
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            y = self.height * np.exp(-np.abs(np.divide(10.0, self.width) * (x - self.center)))
+        return np.where(np.isnan(x), nan, y)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width)
 
@@ -870,6 +1534,8 @@ class Spike(Term):
 # TODO: Tsukamoto
 class SShape(Term):
 
+    __slots__ = ("start", "end")
+
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -891,9 +1557,51 @@ class SShape(Term):
 
         return self.height * 1.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(x),
+                 x <= self.start,
+                 x <= 0.5 * (self.start + self.end),
+                 x < self.end],
+                [nan,
+                 self.height * 0.0,
+                 self.height * 2.0 * ((x - self.start) / (self.end - self.start)) ** 2,
+                 self.height * (1.0 - 2.0 * ((x - self.end) / (self.end - self.start)) ** 2)],
+                self.height * 1.0)
+
     def is_monotonic(self) -> bool:
         return True
 
+    def tsukamoto(self, activation_degree: float, minimum: float, maximum: float) -> float:
+        if isnan(activation_degree) or self.height == 0.0:
+            return nan
+        y = activation_degree / self.height
+        if y <= 0.0:
+            return self.start
+        if y <= 0.5:
+            return self.start + (self.end - self.start) * sqrt(0.5 * y)
+        if y < 1.0:
+            return self.end - (self.end - self.start) * sqrt(0.5 * (1.0 - y))
+        return self.end
+
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        if self.height == 0.0:
+            return np.full(np.shape(activation_degree), nan)
+        y = np.asarray(activation_degree, dtype=float) / self.height
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(y), y <= 0.0, y <= 0.5, y < 1.0],
+                [nan,
+                 self.start,
+                 self.start + (self.end - self.start) * np.sqrt(0.5 * y),
+                 self.end - (self.end - self.start) * np.sqrt(0.5 * (1.0 - y))],
+                self.end)
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.end)
 
@@ -905,6 +1613,8 @@ class SShape(Term):
 
 class Trapezoid(Term):
 
+    __slots__ = ("vertex_a", "vertex_b", "vertex_c", "vertex_d")
+
     def __init__(self, name: str = "", vertex_a: float = nan, vertex_b: float = nan,
                  vertex_c: float = nan, vertex_d: float = nan, height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -940,6 +1650,25 @@ class Trapezoid(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(x),
+                 (x < self.vertex_a) | (x > self.vertex_d),
+                 x < self.vertex_b,
+                 (self.vertex_b <= x) & (x <= self.vertex_c),
+                 x > self.vertex_c],
+                [nan,
+                 self.height * 0.0,
+                 self.height * 1.0 if self.vertex_a == -inf else
+                 self.height * (x - self.vertex_a) / (self.vertex_b - self.vertex_a),
+                 self.height * 1.0,
+                 self.height * 1.0 if self.vertex_d == inf else
+                 self.height * (self.vertex_d - x) / (self.vertex_d - self.vertex_c)],
+                self.height * 0.0)
+
     def parameters(self) -> str:
         return super()._parameters(self.vertex_a, self.vertex_b, self.vertex_c, self.vertex_d)
 
@@ -951,6 +1680,8 @@ class Trapezoid(Term):
 
 class Triangle(Term):
 
+    __slots__ = ("vertex_a", "vertex_b", "vertex_c")
+
     def __init__(self, name: str = "", vertex_a: float = nan, vertex_b: float = nan,
                  vertex_c: float = nan, height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -983,6 +1714,25 @@ class Triangle(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(x),
+                 (x < self.vertex_a) | (x > self.vertex_c),
+                 x < self.vertex_b,
+                 x == self.vertex_b,
+                 x > self.vertex_b],
+                [nan,
+                 self.height * 0.0,
+                 self.height * 1.0 if self.vertex_a == -inf else
+                 self.height * (x - self.vertex_a) / (self.vertex_b - self.vertex_a),
+                 self.height * 1.0,
+                 self.height * 1.0 if self.vertex_c == inf else
+                 self.height * (self.vertex_c - x) / (self.vertex_c - self.vertex_b)],
+                self.height * 0.0)
+
     def parameters(self) -> str:
         return super()._parameters(self.vertex_a, self.vertex_b, self.vertex_c)
 
@@ -995,6 +1745,8 @@ class Triangle(Term):
 # TODO: Tsukamoto
 class ZShape(Term):
 
+    __slots__ = ("start", "end")
+
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
@@ -1016,9 +1768,51 @@ class ZShape(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(x),
+                 x <= self.start,
+                 x <= 0.5 * (self.start + self.end),
+                 x < self.end],
+                [nan,
+                 self.height * 1.0,
+                 self.height * (1.0 - 2.0 * ((x - self.start) / (self.end - self.start)) ** 2),
+                 self.height * 2.0 * ((x - self.end) / (self.end - self.start)) ** 2],
+                self.height * 0.0)
+
     def is_monotonic(self) -> bool:
         return True
 
+    def tsukamoto(self, activation_degree: float, minimum: float, maximum: float) -> float:
+        if isnan(activation_degree) or self.height == 0.0:
+            return nan
+        y = activation_degree / self.height
+        if y >= 1.0:
+            return self.start
+        if y >= 0.5:
+            return self.start + (self.end - self.start) * sqrt(0.5 * (1.0 - y))
+        if y > 0.0:
+            return self.end - (self.end - self.start) * sqrt(0.5 * y)
+        return self.end
+
+    def tsukamoto_array(self, activation_degree: 'np.ndarray',
+                        minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np
+        if self.height == 0.0:
+            return np.full(np.shape(activation_degree), nan)
+        y = np.asarray(activation_degree, dtype=float) / self.height
+        with np.errstate(all='ignore'):
+            return np.select(  # type: ignore
+                [np.isnan(y), y >= 1.0, y >= 0.5, y > 0.0],
+                [nan,
+                 self.start,
+                 self.start + (self.end - self.start) * np.sqrt(0.5 * (1.0 - y)),
+                 self.end - (self.end - self.start) * np.sqrt(0.5 * y)],
+                self.end)
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.end)
 
@@ -1068,11 +1862,26 @@ class Function(Term):
                      variable: str = "", constant: float = nan,
                      right: Optional['Function.Node'] = None,
                      left: Optional['Function.Node'] = None) -> None:
-            self.element = element
-            self.variable = variable
-            self.constant = constant
-            self.left = left
-            self.right = right
+            # new nodes have no changes to count, and they count their changes in the functions
+            # compiled from them (see `Function.compile`)
+            self.__dict__.update(element=element, variable=variable, constant=constant,
+                                 left=left, right=right)
+            self.element: Optional[Function.Element]
+            self.variable: str
+            self.constant: float
+            self.left: Optional[Function.Node]
+            self.right: Optional[Function.Node]
+
+        def __setattr__(self, name: str, value: object) -> None:
+            for changes in self.__dict__.get("_changes", ()):
+                changes[0] += 1
+            object.__setattr__(self, name, value)
+
+        def __getstate__(self) -> Dict[str, object]:
+            # the copies count their changes in the functions compiled from the copies
+            state = self.__dict__.copy()
+            state.pop("_changes", None)
+            return state
 
         def __str__(self) -> str:
             return self.postfix()
@@ -1178,6 +1987,8 @@ class Function(Term):
             result.append(node.value())
             return " ".join(result)
 
+    __slots__ = ("formula", "root", "variables", "engine", "_program", "_bindings", "_changes")
+
     def __init__(self, name: str = "", formula: str = "", engine: Optional['Engine'] = None,
                  variables: Optional[Dict[str, float]] = None, load: bool = False) -> None:
         super().__init__(name)
@@ -1187,9 +1998,29 @@ class Function(Term):
         self.variables: Dict[str, float] = {}
         if variables:
             self.variables.update(variables)
+        self._program: Optional[Tuple[Function.Node, Tuple[str, ...],
+                                      Callable[..., float], int]] = None
+        self._bindings: Optional[Tuple[Tuple[object, ...],
+                                       Tuple[Optional['Variable'], ...]]] = None
+        # the number of changes to the nodes of the expression tree, counted by the nodes
+        self._changes = [0]
         if load:
             self.load()
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the compiled function cannot be pickled, so it is compiled again when unpickled
+        state = dict(getattr(self, "__dict__", {}))
+        for name in ("_name", "height", "formula", "root", "variables", "engine"):
+            state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._program = self._bindings = None
+        self._changes = [0]
+        self.compile()
+
     def parameters(self) -> str:
         return self.formula
 
@@ -1209,6 +2040,85 @@ class Function(Term):
         return result
 
     def membership(self, x: float) -> float:
+        program = self._program
+        if program and program[3] != self._changes[0]:
+            self.compile()
+            program = self._program
+        if program and program[0] is self.root and not self.variables:
+            bindings = self._bindings
+            if not (bindings and bindings[0] == self._bindings_key()):
+                bindings = self._bind()
+            if bindings:
+                return program[2](*[x if variable is None else variable.value
+                                    for variable in bindings[1]])
+        return self.evaluate(self._membership_variables(x))
+
+    def _bindings_key(self) -> Tuple[object, ...]:
+        # the bindings are valid while the expression tree, the engine, the lists of variables of
+        # the engine and the names of the variables are the same, where the lists are the same
+        # while they keep their indexes by name (discarded when they are modified or their
+        # variables are renamed), or else (if they are not named lists) while they have the same
+        # names
+        engine = self.engine
+        if not engine:
+            return (self.root,)
+        key: List[object] = [self.root, engine]
+        for variables in (engine.input_variables, engine.output_variables):
+            key.append(variables)
+            if isinstance(variables, _IndexedList):
+                key.append(variables._index)
+            else:
+                key.append(tuple(variable.name for variable in variables))
+        return tuple(key)
+
+    def _bind(self) -> Optional[Tuple[Tuple[object, ...], Tuple[Optional['Variable'], ...]]]:
+        # binds the variables of the compiled function to x (None) or to the variables of the
+        # engine, which are bound again when the engine or the names change, unless the names are
+        # invalid or the function has its own variables, which are validated and looked up by name
+        self._bindings = None
+        if not (self._program and self.root):
+            return None
+        variables: Dict[str, 'Variable'] = {}
+        if self.engine:
+            for engine_variables in (self.engine.input_variables, self.engine.output_variables):
+                if isinstance(engine_variables, NamedList):
+                    engine_variables.find("")  # builds the index that identifies the list
+                variables.update((variable.name, variable) for variable in engine_variables)
+        if 'x' in variables:
+            return None
+        bound: List[Optional[Variable]] = []
+        for name in self._program[1]:
+            if name == 'x':
+                bound.append(None)
+            elif name in variables:
+                bound.append(variables[name])
+            else:
+                return None
+        self._bindings = (self._bindings_key(), tuple(bound))
+        return self._bindings
+
+    def membership_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        x = np.asarray(x, dtype=float)
+        variables = {name: _batch_aligned(value, x)
+                     for name, value in self._membership_variables(x).items()}  # type: ignore
+        try:
+            return np.zeros(x.shape) + self.evaluate(variables)  # type: ignore
+        except (TypeError, ValueError):
+            # some elements (eg, math functions) only operate on scalars
+            pass
+
+        arrays = np.broadcast_arrays(*variables.values())
+        result = np.empty(arrays[0].shape)
+        for index in np.ndindex(result.shape):
+            try:
+                result[index] = self.evaluate({name: float(array[index])
+                                               for name, array in zip(variables, arrays)})
+            except ArithmeticError:
+                result[index] = nan
+        return result
+
+    def _membership_variables(self, x: float) -> Dict[str, float]:
         if 'x' in self.variables:
             raise ValueError("variable 'x' is reserved for internal use of Function term, please "
                              f"remove it from the map of variables: {self.variables}")
@@ -1228,11 +2138,22 @@ class Function(Term):
             raise ValueError("function variables cannot override engine variables, please "
                              f"resolve the name ambiguity of the following variables: {overrides}")
         engine_variables.update(self.variables)
-        return self.evaluate(engine_variables)
+        return engine_variables
 
     def evaluate(self, variables: Optional[Dict[str, float]] = None) -> float:
         if not self.root:
             raise RuntimeError(f"function '{self.formula}' is not loaded")
+        program = self._program
+        if program and program[3] != self._changes[0]:
+            self.compile()
+            program = self._program
+        if program and program[0] is self.root:
+            try:
+                values = [variables[name] for name in program[1]]  # type: ignore
+            except (KeyError, TypeError):
+                pass  # the expression tree raises the error of the missing variable
+            else:
+                return program[2](*values)
         return self.root.evaluate(variables)
 
     def is_loaded(self) -> bool:
@@ -1240,24 +2161,89 @@ class Function(Term):
 
     def unload(self) -> None:
         self.root = None
+        self._program = None
+        self._bindings = None
         self.variables.clear()
 
     def load(self) -> None:
         self.root = self.parse(self.formula)
+        self.compile()
+
+    # the operators that are compiled into Python operators instead of calls to their methods
+    _binary_operators = {operator.add: "+", operator.sub: "-", operator.mul: "*",
+                         operator.truediv: "/", operator.mod: "%", operator.pow: "**"}
+    _unary_operators = {operator.neg: "-", operator.pos: "+"}
+
+    def compile(self) -> None:
+        """
+        Compiles the expression tree into a single Python function whose arguments are the values
+        of the variables in the order they first appear in the formula, such that evaluating the
+        function does not walk the expression tree. When computing memberships, the variables
+        are bound to the variables of the engine on the first call, and bound again after the
+        lists of variables of the engine are modified or their variables are renamed. The function
+        is compiled again after the nodes of its expression tree change in place, it is discarded if
+        the root of the expression tree is replaced, and the expression tree is walked if it cannot
+        be compiled.
+        """
+        self._program = None
+        self._bindings = None
+        if not self.root:
+            return
+        namespace: Dict[str, object] = {}
+        names: Dict[str, str] = {}
+        expression = self._compile(self.root, namespace, names)
+        if not expression:
+            return
+        source = f"def program({', '.join(names.values())}):\n    return {expression}\n"
+        try:
+            exec(_compile_program(source), namespace)
+        except (MemoryError, RecursionError, SyntaxError):
+            return
+        self._program = (self.root, tuple(names), namespace['program'],  # type: ignore
+                         self._changes[0])
+
+    def _compile(self, node: 'Function.Node', namespace: Dict[str, object],
+                 names: Dict[str, str]) -> Optional[str]:
+        # the node counts its changes in this function (and in others compiled from it, if any)
+        changes = node.__dict__.setdefault("_changes", [])
+        if not any(counter is self._changes for counter in changes):
+            changes.append(self._changes)
+        if node.element:
+            method = node.element.method
+            arity = node.element.arity
+            if not method or arity not in {0, 1, 2}:
+                return None
+            arguments = []
+            for child in ([node.left, node.right] if arity == 2 else [node.right][:arity]):
+                argument = self._compile(child, namespace, names) if child else None
+                if not argument:
+                    return None
+                arguments.append(argument)
+            if arity == 2 and method in Function._binary_operators:
+                return f"({arguments[0]} {Function._binary_operators[method]} {arguments[1]})"
+            if arity == 1 and method in Function._unary_operators:
+                return f"({Function._unary_operators[method]}{arguments[0]})"
+            name = f"element{len(namespace)}"
+            namespace[name] = method
+            return f"{name}({', '.join(arguments)})"
+
+        if node.variable:
+            if node.variable not in names:
+                names[node.variable] = f"variable{len(names)}"
+            return names[node.variable]
+
+        # constants are bound to keep their type (eg, `lib.floating_point_type`)
+        name = f"constant{len(namespace)}"
+        namespace[name] = node.constant
+        return name
 
     @classmethod
     def format_infix(cls, formula: str) -> str:
         from . import lib
         from .factory import FunctionFactory
-        from .rule import Rule
 
         factory: FunctionFactory = lib.factory_manager.function
-        operators: Set[str] = set(factory.operators().keys()).union({'(', ')', ','})
-        operators -= {Rule.AND, Rule.OR}
-
-        # sorted to have multi-char operators separated first (eg., ** and *)
-        regex = "|".join(re.escape(o) for o in sorted(operators, reverse=True))
-        spaced = re.sub(fr"({regex})", r' \1 ', formula)
+        spaced = _infix_regex(tuple(factory.objects.items())).sub(r' \1 ', formula)
         result = re.sub(r"\s+", " ", spaced).strip()
         return result
 
@@ -1274,8 +2260,9 @@ class Function(Term):
         queue: Deque[str] = deque()
         stack: List[str] = []
 
+        debugging = lib.debugging
         for token in formula.split():
-            if lib.debugging:
+            if debugging:
                 lib.logger.debug("=" * 20)
                 lib.logger.debug(f"formula: {formula}")
                 lib.logger.debug(f"queue: {queue}")
@@ -1332,7 +2319,7 @@ class Function(Term):
             queue.append(stack.pop())
 
         postfix = " ".join(queue)
-        if lib.debugging:
+        if debugging:
             lib.logger.debug(f"formula={formula}")
             lib.logger.debug(f"postfix={postfix}")
         return postfix
@@ -1354,12 +2341,9 @@ class Function(Term):
                 if element.arity > len(stack):
                     raise SyntaxError(f"function element {element.name} has arity {element.arity}, "
                                       f"but the size of the stack is {len(stack)}")
-                node = Function.Node(factory.copy(token))
-                if element.arity >= 1:
-                    node.right = stack.pop()
-                if element.arity == 2:
-                    node.left = stack.pop()
-                stack.append(node)
+                right = stack.pop() if element.arity >= 1 else None
+                left = stack.pop() if element.arity == 2 else None
+                stack.append(Function.Node(factory.share(token), right=right, left=left))
             elif is_operand:
                 try:
                     node = Function.Node(constant=Op.scalar(token))
@@ -20,19 +20,24 @@ __all__ = ["Variable", "InputVariable", "OutputVariable"]
 import math
 import typing
 from math import inf, isnan, nan
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from . import context as _context
+from .context import Context
 from .exporter import FllExporter
+from .named import Named, NamedList
 from .norm import SNorm
 from .operation import Op
-from .term import Aggregated
+from .term import Aggregated, Function, Linear
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # noqa: F401
+
     from .term import Term
     from .defuzzifier import Defuzzifier  # noqa: F401
 
 
-class Variable:
+class Variable(Named):
 
     def __init__(self,
                  name: str = "",
@@ -48,7 +53,7 @@ class Variable:
         self.minimum = minimum
         self.maximum = maximum
         self.lock_range = lock_range
-        self.terms: List[Term] = []
+        self.terms: List[Term] = NamedList()
         if terms:
             self.terms.extend(terms)
         self._value = nan
@@ -57,9 +62,9 @@ class Variable:
         return FllExporter().variable(self)
 
     def term(self, name: str) -> 'Term':
-        for term in self.terms:
-            if term.name == name:
-                return term
+        term = NamedList.search(self.terms, name)
+        if term is not None:
+            return term
         raise ValueError(f"term '{name}' not found in {t.name for t in self.terms}")
 
     @property
@@ -76,11 +81,19 @@ class Variable:
 
     @property
     def value(self) -> float:
-        return self._value
+        context = Context.current() if _context._active else None
+        return self._value if context is None else context.values.get(self, nan)
 
     @value.setter
     def value(self, value: float) -> None:
-        self._value = Op.bound(value, self.minimum, self.maximum) if self.lock_range else value
+        self._set_value(Op.bound(value, self.minimum, self.maximum) if self.lock_range else value)
+
+    def _set_value(self, value: float) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._value = value
+        else:
+            context.values[self] = value
 
     def fuzzify(self, x: float) -> str:
         result: List[str] = []
@@ -128,10 +141,68 @@ class InputVariable(Variable):
                          maximum=maximum,
                          lock_range=lock_range,
                          terms=terms)
+        self._memberships: Dict['Term', float] = {}
 
     def __str__(self) -> str:
         return FllExporter().input_variable(self)
 
+    def _set_value(self, value: float) -> None:
+        super()._set_value(value)
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._memberships.clear()
+        else:
+            context.memberships.pop(self, None)
+
+    def fuzzify_terms(self) -> Dict['Term', float]:
+        """
+        Computes the membership of the value to each term into a table that the antecedents
+        index into until the value changes. Terms whose membership raise an error are left out
+        of the table, such that the error is raised when (and only if) a rule requires them.
+        Terms whose membership depends on other values (see `InputVariable.is_dependent`) are
+        also left out of the table, such that their membership is computed whenever required.
+        :return: the table of memberships of the value to each term
+        """
+        memberships: Dict[Term, float] = {}
+        value = self.value
+        for term in self.terms:
+            if InputVariable.is_dependent(term):
+                continue
+            try:
+                memberships[term] = term.membership(value)
+            except Exception:
+                pass
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._memberships = memberships
+        else:
+            context.memberships[self] = memberships
+        return memberships
+
+    @staticmethod
+    def is_dependent(term: 'Term') -> bool:
+        """
+        Gets whether the membership of the term depends on values other than the value of the
+        variable, that is, the term is Linear or a Function with an engine or with variables.
+        :param term: is the term
+        :return: whether the membership of the term depends on other values
+        """
+        if isinstance(term, Function):
+            return bool(term.engine or term.variables)
+        return isinstance(term, Linear)
+
+    def membership(self, term: 'Term') -> float:
+        """
+        Gets the membership of the value to the term from the table computed in `fuzzify_terms`,
+        or computes the membership if the term is not in the table.
+        :param term: is the term
+        :return: the membership of the value to the term
+        """
+        context = Context.current() if _context._active else None
+        memberships = self._memberships if context is None else context.memberships.get(self)
+        result = memberships.get(term) if memberships else None
+        return term.membership(self.value) if result is None else result
+
     def fuzzy_value(self) -> str:
         return super().fuzzify(self.value)
 
@@ -153,7 +224,7 @@ class OutputVariable(Variable):
         # name, minimum, and maximum are properties in this class, replacing the inherited members
         # to point to the Aggregated object named fuzzy. Thus, first we need to set up the fuzzy
         # object such that initializing the parent object will use the respective replacements.
-        self.fuzzy = Aggregated(aggregation=aggregation)
+        self._fuzzy = Aggregated(aggregation=aggregation)
         # initialize parent members
         super().__init__(name=name,
                          description=description,
@@ -166,42 +237,73 @@ class OutputVariable(Variable):
         self.defuzzifier = defuzzifier
         self.lock_previous = lock_previous
         self.default_value = default_value
-        self.previous_value = nan
+        self._previous_value = nan
 
     def __str__(self) -> str:
         return FllExporter().output_variable(self)
 
+    @property
+    def fuzzy(self) -> Aggregated:
+        context = Context.current() if _context._active else None
+        if context is None:
+            return self._fuzzy
+        fuzzy = context.fuzzy.get(self)
+        if fuzzy is None:
+            fuzzy = context.fuzzy[self] = Aggregated(self._fuzzy.name, self._fuzzy.minimum,
+                                                     self._fuzzy.maximum, self._fuzzy.aggregation)
+        return fuzzy
+
+    @fuzzy.setter
+    def fuzzy(self, value: Aggregated) -> None:
+        self._fuzzy = value
+
+    @property
+    def previous_value(self) -> float:
+        context = Context.current() if _context._active else None
+        return (self._previous_value if context is None
+                else context.previous_values.get(self, nan))
+
+    @previous_value.setter
+    def previous_value(self, value: float) -> None:
+        context = Context.current() if _context._active else None
+        if context is None:
+            self._previous_value = value
+        else:
+            context.previous_values[self] = value
+
     @property  # type: ignore
     def name(self) -> str:  # type: ignore
-        return self.fuzzy.name
+        return self._fuzzy.name
 
     @name.setter
     def name(self, value: str) -> None:
-        self.fuzzy.name = value
+        if value != getattr(self._fuzzy, "_name", value):
+            self._renamed()
+        self._fuzzy.name = value
 
     @property  # type: ignore
     def minimum(self) -> float:  # type: ignore
-        return self.fuzzy.minimum
+        return self._fuzzy.minimum
 
     @minimum.setter
     def minimum(self, value: float) -> None:
-        self.fuzzy.minimum = value
+        self._fuzzy.minimum = value
 
     @property  # type: ignore
     def maximum(self) -> float:  # type: ignore
-        return self.fuzzy.maximum
+        return self._fuzzy.maximum
 
     @maximum.setter
     def maximum(self, value: float) -> None:
-        self.fuzzy.maximum = value
+        self._fuzzy.maximum = value
 
     @property
     def aggregation(self) -> Optional[SNorm]:
-        return self.fuzzy.aggregation
+        return self._fuzzy.aggregation
 
     @aggregation.setter
     def aggregation(self, value: SNorm) -> None:
-        self.fuzzy.aggregation = value
+        self._fuzzy.aggregation = value
 
     def defuzzify(self) -> None:
         if not self.enabled:
@@ -242,10 +344,57 @@ class OutputVariable(Variable):
         if exception:
             raise exception
 
+    def defuzzify_batch(self, rows: int) -> 'np.ndarray':
+        """
+        Defuzzifies the output variable when the activated terms have arrays of activation
+        degrees, and applies the logic of default and previous values row by row as if
+        `defuzzify` were called once per row.
+        :param rows: is the number of rows in the batch
+        :return: the array of output values, which is also set as the value of the variable
+        """
+        import numpy as np
+        if not self.enabled:
+            return np.full(rows, self.value)
+
+        previous_value = self.value if math.isfinite(self.value) else self.previous_value
+
+        is_valid = np.zeros(rows, dtype=bool)
+        for term in self.fuzzy.terms:
+            is_valid |= np.broadcast_to(np.asarray(term.degree) != 0.0, (rows,))
+
+        result = np.full(rows, nan)
+        if is_valid.any():
+            if not self.defuzzifier:
+                raise ValueError(f"expected a defuzzifier in output variable {self.name}, "
+                                 "but found none")
+            result = np.broadcast_to(
+                self.defuzzifier.defuzzify_array(self.fuzzy, self.minimum, self.maximum),
+                (rows,)).astype(float)
+        result[~is_valid] = nan
+
+        default_value = self.default_value
+        if self.lock_range:
+            result = np.clip(result, self.minimum, self.maximum)
+            default_value = Op.bound(default_value, self.minimum, self.maximum)
+
+        if not is_valid.all():
+            fallback = np.full(rows, default_value)
+            if self.lock_previous:
+                # the previous value of each row is the last finite value in the preceding rows
+                index = np.arange(rows)
+                last = np.maximum.accumulate(
+                    np.where(is_valid & np.isfinite(result), index, -1))
+                fallback = np.where(last >= 0, result[np.maximum(last, 0)],
+                                    default_value if isnan(previous_value) else previous_value)
+            result = np.where(is_valid, result, fallback)
+
+        self._set_value(result)  # type: ignore
+        return result
+
     def clear(self) -> None:
         self.fuzzy.clear()
         self.previous_value = nan
-        self._value = nan
+        self._set_value(nan)
 
     def fuzzy_value(self) -> str:
         result: List[str] = []
@@ -61,9 +61,9 @@ def setup_package() -> None:
         license=fl.lib.license,
         packages=setuptools.find_packages(),
         # package_dir={'fuzzylite': '.'},
-        # entry_points={
-        #     'console_scripts': ['fuzzylite=fuzzylite:console']
-        # },
+        entry_points={
+            'console_scripts': ['fuzzylite-benchmark=fuzzylite.benchmark:main']
+        },
         platforms=['OS Independent'],
         provides=[fl.lib.name],
         python_requires='>=3.6',
@@ -0,0 +1,63 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import List
+
+
+def import_times(statement: str, repeat: int) -> List[float]:
+    """
+    Computes the times (in seconds) to execute the statement in new Python interpreters, as
+    measured by the interpreters themselves to leave out their startup time.
+    :param statement: is the statement to execute (eg, `import fuzzylite`)
+    :param repeat: is the number of interpreters to start
+    :return: the list of times
+    """
+    program = ("import time; start = time.perf_counter(); "
+               f"{statement}; print(time.perf_counter() - start)")
+    return [float(subprocess.run([sys.executable, "-c", program], check=True,
+                                 stdout=subprocess.PIPE, universal_newlines=True).stdout)
+            for _ in range(repeat)]
+
+
+def main(repeat: int = 20) -> None:
+    """
+    Benchmarks the time to import the library in new Python interpreters, and lists the modules
+    that `import fuzzylite` imports in addition to those imported by the interpreter at startup.
+    Usage: python -m tests.benchmark_import [repeat]
+    :param repeat: is the number of interpreters to start per statement
+    """
+    print(f"{'statement':<40} {'min (ms)':>10} {'median (ms)':>12}")
+    for statement in ["import fuzzylite",
+                      "import fuzzylite; fuzzylite.lib.factory_manager",
+                      "import fuzzylite.examples.mamdani.SimpleDimmer"]:
+        times = import_times(statement, repeat)
+        print(f"{statement[:40]:<40} {min(times) * 1e3:>10.1f} "
+              f"{statistics.median(times) * 1e3:>12.1f}")
+
+    program = ("import sys; before = set(sys.modules); import fuzzylite; "
+               "print(' '.join(sorted(set(sys.modules) - before)))")
+    modules = subprocess.run([sys.executable, "-c", program], check=True,
+                             stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+    print(f"\n{len(modules)} modules imported by `import fuzzylite`:")
+    print(" ".join(modules))
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
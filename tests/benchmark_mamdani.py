@@ -0,0 +1,100 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import importlib
+import logging
+import pathlib
+import sys
+import timeit
+from typing import List
+
+import fuzzylite as fl
+
+
+def mamdani_engines() -> List[fl.Engine]:
+    import fuzzylite.examples.mamdani
+    root = pathlib.Path(next(iter(fuzzylite.examples.mamdani.__path__)))
+    engines = []
+    for path in sorted(root.glob("**/*.py")):
+        if path.stem == "__init__":
+            continue
+        parts = path.relative_to(root).with_suffix("").parts
+        module = ".".join(("fuzzylite.examples.mamdani",) + parts)
+        engines.append(importlib.import_module(module).engine)  # type: ignore
+    return engines
+
+
+def benchmark(engine: fl.Engine, rows: int, repeat: int) -> float:
+    """
+    Computes the best time (in seconds) to process the rows of inputs, which are evenly spaced
+    over the ranges of the input variables.
+    :param engine: is the engine to benchmark
+    :param rows: is the number of rows of inputs to process
+    :param repeat: is the number of times to repeat the benchmark
+    :return: the best time to process each row of inputs
+    """
+    inputs = [[variable.minimum + variable.drange * row / max(1, rows - 1)
+               for variable in engine.input_variables] for row in range(rows)]
+
+    def process() -> None:
+        for values in inputs:
+            for variable, value in zip(engine.input_variables, values):
+                variable.value = value
+            try:
+                engine.process()
+            except ArithmeticError:
+                pass
+
+    return min(timeit.repeat(process, number=1, repeat=repeat)) / rows
+
+
+def main(rows: int = 100, repeat: int = 5) -> None:
+    """
+    Benchmarks `Engine.process` on the Mamdani examples with debug logging disabled (default)
+    and enabled, the latter building the debug messages of every membership function evaluated
+    by the defuzzifiers, which was done regardless of the logging level in previous versions.
+    Usage: python -m tests.benchmark_mamdani [rows] [repeat]
+    :param rows: is the number of rows of inputs to process per engine
+    :param repeat: is the number of times to repeat each benchmark
+    """
+    logger = logging.getLogger("fuzzylite")
+    level, propagate = logger.level, logger.propagate
+    null_handler = logging.NullHandler()
+
+    print(f"{'engine':<32} {'debug off (ms)':>15} {'debug on (ms)':>15} {'speedup':>8}")
+    try:
+        for engine in mamdani_engines():
+            logger.setLevel(logging.WARNING)
+            disabled = benchmark(engine, rows, repeat)
+
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = False
+            logger.addHandler(null_handler)
+            enabled = benchmark(engine, rows, repeat)
+            logger.removeHandler(null_handler)
+            logger.propagate = propagate
+
+            print(f"{engine.name:<32} {disabled * 1e3:>15.3f} {enabled * 1e3:>15.3f} "
+                  f"{enabled / disabled:>7.1f}x")
+    finally:
+        logger.removeHandler(null_handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
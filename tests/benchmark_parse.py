@@ -0,0 +1,76 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import pathlib
+import sys
+import timeit
+from typing import List
+
+import fuzzylite as fl
+
+
+def example_files() -> List[pathlib.Path]:
+    import fuzzylite.examples
+    root = pathlib.Path(next(iter(fuzzylite.examples.__path__)))
+    return sorted(root.glob("**/*.fll"))
+
+
+def formulas(engines: List[fl.Engine]) -> List[str]:
+    return [term.formula for engine in engines for variable in engine.variables
+            for term in variable.terms if isinstance(term, fl.Function)]
+
+
+def main(repeat: int = 5) -> None:
+    """
+    Benchmarks loading the engines of the FLL examples, with and without an EngineCache, and
+    from the binary format, as well as parsing the formulas of their Function terms, whose
+    elements were deep-copied for every node in previous versions.
+    Usage: python -m tests.benchmark_parse [repeat]
+    :param repeat: is the number of times to repeat each benchmark
+    """
+    texts = [path.read_text() for path in example_files()]
+    importer = fl.FllImporter()
+    engines = [importer.from_string(text) for text in texts]
+    functions = formulas(engines)
+    rules = sum(len(block.rules) for engine in engines for block in engine.rule_blocks)
+
+    load = min(timeit.repeat(lambda: [importer.from_string(text) for text in texts],
+                             number=1, repeat=repeat))
+    print(f"loaded {len(texts)} engines with {rules} rules and {len(functions)} functions "
+          f"in {load * 1e3:.1f} ms ({len(texts) / load:.1f} engines per second)")
+
+    cached = fl.FllImporter(cache=fl.EngineCache(capacity=len(texts)))
+    load = min(timeit.repeat(lambda: [cached.from_string(text) for text in texts],
+                             number=1, repeat=repeat + 1))
+    print(f"loaded {len(texts)} engines from the cache "
+          f"in {load * 1e3:.1f} ms ({len(texts) / load:.1f} engines per second)")
+
+    binaries = [fl.BinaryExporter().to_bytes(engine) for engine in engines]
+    load = min(timeit.repeat(lambda: [fl.BinaryImporter().from_bytes(data) for data in binaries],
+                             number=1, repeat=repeat))
+    print(f"loaded {len(texts)} engines from the binary format "
+          f"in {load * 1e3:.1f} ms ({len(texts) / load:.1f} engines per second)")
+
+    number = max(1, 1000 // max(1, len(functions)))
+    parse = min(timeit.repeat(lambda: [fl.Function.parse(formula) for formula in functions],
+                              number=number, repeat=repeat)) / number
+    print(f"parsed {len(functions)} formulas in {parse * 1e3:.3f} ms "
+          f"({len(functions) / parse:.0f} formulas per second)")
+
+
+if __name__ == '__main__':
+    main(*(int(argument) for argument in sys.argv[1:]))
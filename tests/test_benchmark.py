@@ -0,0 +1,174 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import json
+import math
+import tempfile
+import typing
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import fuzzylite as fl
+from fuzzylite.benchmark import Benchmark, main
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_read_fld(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.fld"
+            path.write_text("A B C\n0.0 1.0 nan\n# comment\n\n-inf 2.5 inf\n3 4 5\n")
+            data = Benchmark.read_fld(path)
+            self.assertEqual(3, len(data))
+            self.assertEqual([0.0, 1.0], data[0][:2])
+            self.assertTrue(math.isnan(data[0][2]))
+            self.assertEqual([-fl.inf, 2.5, fl.inf], data[1])
+            self.assertEqual([[0.0, 1.0]], [row[:2] for row in Benchmark.read_fld(path, rows=1)])
+
+    def test_examples_have_no_errors(self) -> None:
+        # the datasets were generated by sampling the terms to defuzzify, and those of the
+        # Mamdani, hybrid and term examples are written with nine decimals
+        for benchmark in Benchmark.examples(["mamdani/**/*", "hybrid/*", "terms/*"], rows=100):
+            with self.subTest(name=benchmark.name):
+                result = benchmark.measure()
+                self.assertEqual((0, 0), (result["errors"], result["exceptions"]))
+
+    def test_percentile(self) -> None:
+        self.assertIsNone(Benchmark.percentile([], 50.0))
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(1.0, Benchmark.percentile(values, 0.0))
+        self.assertEqual(50.0, Benchmark.percentile(values, 50.0))
+        self.assertEqual(99.0, Benchmark.percentile(values, 99.0))
+        self.assertEqual(100.0, Benchmark.percentile(values, 100.0))
+        self.assertEqual(7.0, Benchmark.percentile([7.0], 99.0))
+
+    def test_measure(self) -> None:
+        benchmark, = Benchmark.examples(["mamdani/SimpleDimmer"], rows=100)
+        self.assertEqual("mamdani/SimpleDimmer", benchmark.name)
+        self.assertEqual(100, len(benchmark.data))
+        for mode in Benchmark.MODES:
+            with self.subTest(mode=mode):
+                result = benchmark.measure(mode, batch_size=32)
+                self.assertSetEqual({"name", "mode", "inputs", "outputs", "rules", "rows",
+                                     "seconds", "throughput", "latency", "max_error", "errors",
+                                     "exceptions"}, set(result))
+                self.assertEqual(mode, result["mode"])
+                self.assertEqual((1, 1, 3, 100), (result["inputs"], result["outputs"],
+                                                  result["rules"], result["rows"]))
+                self.assertEqual(0, result["errors"])
+                self.assertEqual(0, result["exceptions"])
+                self.assertLess(result["max_error"], 1e-6)
+                latency = result["latency"]
+                self.assertLessEqual(latency["p50"], latency["p99"])  # type: ignore
+                self.assertLessEqual(latency["p99"], latency["max"])  # type: ignore
+
+        with self.assertRaisesRegex(ValueError, "expected a mode in .*, but found 'other'"):
+            benchmark.measure("other")
+
+    def test_measure_tsukamoto(self) -> None:
+        benchmark, = Benchmark.examples(["tsukamoto/tsukamoto"], rows=200)
+        # the dataset is written with three decimals, which some values round up or down
+        benchmark = Benchmark(benchmark.name, benchmark.engine, benchmark.data, 0.001 + 1e-9)
+
+        # the values of Sigmoids and ZSShapes in the dataset are the weighted averages of the
+        # memberships of the activation degrees, which Term.tsukamoto computes for the terms
+        # that are not inverted
+        fallback = {"tsukamoto": fl.Term.tsukamoto, "tsukamoto_array": fl.Term.tsukamoto_array}
+        with patch.multiple(fl.Sigmoid, **fallback), patch.multiple(fl.SShape, **fallback), \
+                patch.multiple(fl.ZShape, **fallback):
+            for mode in Benchmark.MODES:
+                with self.subTest(mode=mode):
+                    result = benchmark.measure(mode, batch_size=64)
+                    self.assertEqual(0, result["errors"])
+
+        # the terms inverted in closed form give the values of Ramps and Concaves in the dataset,
+        # and the values of Sigmoids and ZSShapes within the ranges of the variables
+        engine = benchmark.engine
+        for values in benchmark.data:
+            engine.input_variable("X").value = values[0]
+            engine.process()
+            for variable, expected in zip(engine.output_variables, values[1:]):
+                with self.subTest(x=values[0], output=variable.name):
+                    if variable.name in {"Ramps", "Concaves"}:
+                        self.assertAlmostEqual(expected, variable.value,
+                                               delta=benchmark.tolerance)
+                    else:
+                        self.assertTrue(variable.minimum <= variable.value <= variable.maximum)
+
+    def test_measure_errors(self) -> None:
+        benchmark, = Benchmark.examples(["mamdani/SimpleDimmer"], rows=3)
+        benchmark.data = [list(benchmark.data[0]), [0.5, 0.6], [0.5, fl.nan]]
+        result = benchmark.measure()
+        self.assertEqual(2, result["errors"])
+        self.assertAlmostEqual(0.1, result["max_error"])  # type: ignore
+
+        # the errors are counted within the tolerance, where nan equals nan
+        benchmark.data = [[0.5, 0.5 + 1e-6], [0.0, fl.nan], [0.5, 0.5 + 1e-3]]
+        self.assertEqual(1, benchmark.measure()["errors"])
+        self.assertEqual(0, Benchmark("", benchmark.engine, benchmark.data, 1e-2)
+                         .measure()["errors"])
+
+        benchmark.data = [[0.5]]
+        with self.assertRaisesRegex(ValueError, "expected 2 values in row 0, but found 1"):
+            benchmark.measure()
+
+    def test_measure_exceptions(self) -> None:
+        benchmark, = Benchmark.examples(["mamdani/SimpleDimmer"], rows=3)
+        engine = benchmark.engine
+        benchmark.data = [[0.25, 0.75], [0.75, 0.25], [0.5, 0.5]]
+        process, process_batch = engine.process, engine.process_batch
+
+        def fail(values: typing.Any) -> bool:
+            return bool(fl.Op.eq(0.75, values))
+
+        def failing_process(*args: typing.Any, **kwargs: typing.Any) -> None:
+            if fail(engine.input_variables[0].value):
+                raise ZeroDivisionError("failed")
+            process(*args, **kwargs)
+
+        def failing_process_batch(inputs: typing.Any) -> typing.Any:
+            if any(fail(value) for value in inputs[:, 0]):
+                raise ZeroDivisionError("failed")
+            return process_batch(inputs)
+
+        engine.process = failing_process  # type: ignore
+        engine.process_batch = failing_process_batch  # type: ignore
+        for mode in Benchmark.MODES:
+            with self.subTest(mode=mode):
+                result = benchmark.measure(mode, batch_size=2)
+                self.assertEqual((3, 1, 1), (result["rows"], result["exceptions"],
+                                             result["errors"]))
+
+    def test_main(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "results.json"
+            main(["mamdani/SimpleDimmer*", "--rows", "10", "--output", str(path)])
+            report = json.loads(path.read_text())
+        self.assertEqual(fl.lib.name, report["library"])
+        self.assertEqual("process", report["mode"])
+        self.assertFalse(report["exact"])
+        self.assertListEqual(["mamdani/SimpleDimmer", "mamdani/SimpleDimmerChained",
+                              "mamdani/SimpleDimmerInverse"],
+                             [result["name"] for result in report["benchmarks"]])
+        for result in report["benchmarks"]:
+            self.assertEqual(10, result["rows"])
+            self.assertEqual(0, result["errors"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import asyncio
+import math
+import sys
+import unittest
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import fuzzylite as fl
+
+SimpleDimmerChained = """\
+Engine: SimpleDimmerChained
+InputVariable: Ambient
+  enabled: true
+  range: 0.000 1.000
+  lock-range: false
+  term: DARK Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: BRIGHT Triangle 0.500 0.750 1.000
+OutputVariable: Power
+  enabled: true
+  range: 0.000 1.000
+  lock-range: false
+  aggregation: Maximum
+  defuzzifier: Centroid 200
+  default: nan
+  lock-previous: true
+  term: LOW Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: HIGH Triangle 0.500 0.750 1.000
+OutputVariable: InversePower
+  enabled: true
+  range: 0.000 1.000
+  lock-range: false
+  aggregation: Maximum
+  defuzzifier: Centroid 500
+  default: nan
+  lock-previous: false
+  term: LOW Cosine 0.200 0.500
+  term: MEDIUM Cosine 0.500 0.500
+  term: HIGH Cosine 0.800 0.500
+RuleBlock:
+  enabled: true
+  conjunction: none
+  disjunction: none
+  implication: Minimum
+  activation: General
+  rule: if Ambient is DARK then Power is HIGH
+  rule: if Ambient is MEDIUM then Power is MEDIUM
+  rule: if Ambient is BRIGHT then Power is LOW
+  rule: if Power is LOW then InversePower is HIGH
+  rule: if Power is MEDIUM then InversePower is MEDIUM
+  rule: if Power is HIGH then InversePower is LOW
+"""
+
+
+class TestContext(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.engine = fl.FllImporter().from_string(SimpleDimmerChained)
+        self.inputs = [0.05 * i for i in range(21)]
+
+    def process(self, ambient: float) -> List[float]:
+        self.engine.input_variable("Ambient").value = ambient
+        self.engine.process()
+        return [variable.value for variable in self.engine.output_variables]
+
+    def expected(self) -> List[List[float]]:
+        engine = fl.FllImporter().from_string(SimpleDimmerChained)
+        result = []
+        for ambient in self.inputs:
+            engine.input_variable("Ambient").value = ambient
+            engine.process()
+            result.append([variable.value for variable in engine.output_variables])
+        return result
+
+    def assert_state_unchanged(self) -> None:
+        for variable in self.engine.variables:
+            self.assertTrue(math.isnan(variable.value))
+        for variable in self.engine.output_variables:
+            self.assertTrue(math.isnan(variable.previous_value))
+            self.assertListEqual([], variable.fuzzy.terms)
+        for rule in self.engine.rule_blocks[0].rules:
+            self.assertEqual(0.0, rule.activation_degree)
+            self.assertFalse(rule.triggered)
+        self.assertDictEqual({}, self.engine.input_variable("Ambient")._memberships)
+
+    def test_current(self) -> None:
+        self.assertIsNone(fl.Context.current())
+        outer, inner = fl.Context(), fl.Context()
+        with outer:
+            self.assertIs(outer, fl.Context.current())
+            with inner:
+                self.assertIs(inner, fl.Context.current())
+                with outer:
+                    self.assertIs(outer, fl.Context.current())
+                self.assertIs(inner, fl.Context.current())
+            self.assertIs(outer, fl.Context.current())
+        self.assertIsNone(fl.Context.current())
+
+    def test_active(self) -> None:
+        from fuzzylite import context
+        self.assertEqual(0, context._active)
+        outer, inner = fl.Context(), fl.Context()
+        with outer:
+            self.assertEqual(1, context._active)
+            with inner, outer:
+                self.assertEqual(3, context._active)
+            self.assertEqual(1, context._active)
+        self.assertEqual(0, context._active)
+
+    def test_thread_local_var(self) -> None:
+        from fuzzylite.context import _ThreadLocalVar
+        variable = _ThreadLocalVar(None)
+        token = variable.set("outer")
+        self.assertIsNone(token)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertIsNone(executor.submit(variable.get).result())
+        inner = variable.set("inner")
+        self.assertEqual("inner", variable.get())
+        variable.reset(inner)
+        self.assertEqual("outer", variable.get())
+        variable.reset(token)
+        self.assertIsNone(variable.get())
+
+    def test_process_in_context(self) -> None:
+        context = fl.Context()
+        with context:
+            obtained = [self.process(ambient) for ambient in self.inputs]
+            power = self.engine.output_variable("Power")
+            self.assertEqual(power.value, context.values[power])
+            self.assertEqual(power.fuzzy, context.fuzzy[power])
+            self.assertEqual(fl.Op.str(obtained[-2][0]), fl.Op.str(power.previous_value))
+            self.process(0.75)
+            self.assertEqual(1.0, self.engine.rule_blocks[0].rules[2].activation_degree)
+            self.assertTrue(self.engine.rule_blocks[0].rules[2].triggered)
+        self.assertEqual(str(self.expected()), str(obtained))
+        self.assert_state_unchanged()
+
+        # the state of the engine is not visible within the contexts
+        self.process(0.25)
+        with fl.Context():
+            self.assertTrue(math.isnan(self.engine.output_variable("Power").value))
+            self.assertListEqual([], self.engine.output_variable("Power").fuzzy.terms)
+            self.assertEqual(0.0, self.engine.rule_blocks[0].rules[0].activation_degree)
+        self.assertAlmostEqual(0.75, self.engine.output_variable("Power").value)
+
+    def test_process_without_context(self) -> None:
+        # the state is read and written in the components without looking up the current context
+        from fuzzylite import context
+        with unittest.mock.patch.object(fl.Context, "current",
+                                        wraps=fl.Context.current) as current:
+            obtained = [self.process(ambient) for ambient in self.inputs]
+            self.assertEqual(0, current.call_count)
+            with unittest.mock.patch.object(context, "_active", 1):
+                self.process(0.5)
+            self.assertLess(0, current.call_count)
+        self.assertEqual(str(self.expected()), str(obtained))
+
+        # processing without contexts is not slower than looking up the current context (eg, while
+        # other threads process within contexts), which finds none and uses the state anyway
+        from fuzzylite.benchmark import Benchmark
+        benchmark, = Benchmark.examples(["takagi_sugeno/approximation"], rows=200)
+        direct, lookup = [], []
+        for _ in range(20):
+            direct.append(benchmark.measure()["seconds"])
+            with unittest.mock.patch.object(context, "_active", 1):
+                lookup.append(benchmark.measure()["seconds"])
+        # allowing for the noise in the timings
+        self.assertLessEqual(min(direct), 1.2 * min(lookup))  # type: ignore
+
+    def test_process_in_threads(self) -> None:
+        def process_all() -> List[List[float]]:
+            with fl.Context():
+                return [self.process(ambient) for ambient in self.inputs]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: process_all(), range(16)))
+
+        expected = str(self.expected())
+        for obtained in results:
+            self.assertEqual(expected, str(obtained))
+        self.assert_state_unchanged()
+
+    @unittest.skipIf(sys.version_info < (3, 7), "contexts are activated per task in Python 3.7+")
+    def test_process_in_tasks(self) -> None:
+        async def process_all() -> List[List[float]]:
+            result = []
+            with fl.Context():
+                for ambient in self.inputs:
+                    result.append(self.process(ambient))
+                    await asyncio.sleep(0)
+            return result
+
+        async def gather() -> List[List[List[float]]]:
+            return await asyncio.gather(*(process_all() for _ in range(8)))  # type: ignore
+
+        expected = str(self.expected())
+        for obtained in asyncio.run(gather()):
+            self.assertEqual(expected, str(obtained))
+        self.assert_state_unchanged()
+
+    def test_process_batch_in_context(self) -> None:
+        import numpy as np
+        with fl.Context():
+            self.engine.process_batch(np.array(self.inputs).reshape(-1, 1))
+        self.assert_state_unchanged()
+        self.engine.process_batch(np.array(self.inputs).reshape(-1, 1))
+        self.assert_state_unchanged()
+
+
+if __name__ == '__main__':
+    unittest.main()
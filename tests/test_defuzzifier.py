@@ -15,8 +15,10 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import math
 import re
 import unittest
+from pathlib import Path
 from typing import Dict
 
 import fuzzylite as fl
@@ -42,6 +44,14 @@ class DefuzzifierAssert(BaseAssert[fl.Defuzzifier]):
             else:
                 self.test.assertAlmostEqual(self.actual.defuzzify(term, minimum, maximum), result,
                                             places=15, msg=f"for {str(term)}")
+        return self.defuzzifies_array(terms, minimum, maximum)
+
+    def defuzzifies_array(self, terms: Dict[fl.Term, float], minimum: float = -fl.inf,
+                          maximum: float = fl.inf) -> 'DefuzzifierAssert':
+        import numpy as np
+        for term, result in terms.items():
+            np.testing.assert_allclose(self.actual.defuzzify_array(term, minimum, maximum),
+                                       result, rtol=0.0, atol=1e-15, err_msg=f"for {str(term)}")
         return self
 
 
@@ -103,6 +113,93 @@ class TestDefuzzifier(unittest.TestCase):
                 ]): 0.6900552486187845
             }, -1, 1)
 
+    def test_centroid_exact(self) -> None:
+        # exact defuzzification is neither configured nor exported in the FuzzyLite Language
+        DefuzzifierAssert(self, fl.Centroid(exact=True)) \
+            .exports_fll("Centroid 100") \
+            .has_parameters("100") \
+            .defuzzifies(
+            {
+                fl.Triangle("", -1, 0): -0.5,
+                fl.Triangle("", -1, 1): 0.0,
+                fl.Triangle("", 0, 1): 0.5,
+                fl.Triangle("", -1, -1, 0): -2.0 / 3.0,
+                fl.Triangle("", 0, 0, 3): 7.0 / 15.0,
+                fl.Rectangle("", -0.5, 1.0): 0.25,
+                fl.Aggregated("", 0, 1, fl.Maximum(), [
+                    fl.Activated(fl.Triangle("Medium", 0.25, 0.5, 0.75), 0.2, fl.Minimum()),
+                    fl.Activated(fl.Triangle("High", 0.5, 0.75, 1.0), 0.8, fl.Minimum())
+                ]): 0.689655172413793,
+                fl.Aggregated("", 0, 1, fl.Maximum(), [
+                    fl.Activated(fl.Ramp("Low", 0.5, 0.0), 0.5, fl.AlgebraicProduct()),
+                    fl.Activated(fl.Discrete("High", [0.5, 0.0, 1.0, 1.0]), 1.0, fl.Minimum())
+                ]): -1.0 / 42.0,
+            }, -1, 1)
+
+    def test_centroid_exact_falls_back_to_sampling(self) -> None:
+        sampling = fl.Centroid()
+        exact = fl.Centroid(exact=True)
+        for term in [fl.Gaussian("", 0.2, 0.3),
+                     fl.Aggregated("", -1, 1, fl.AlgebraicSum(), [
+                         fl.Activated(fl.Triangle("", -1, 0, 1), 0.5, fl.Minimum())]),
+                     fl.Aggregated("", -1, 1, fl.Maximum(), [
+                         fl.Activated(fl.Triangle("", -1, 0, 1), 0.5, fl.EinsteinProduct())])]:
+            self.assertEqual(sampling.defuzzify(term, -1, 1), exact.defuzzify(term, -1, 1))
+        with self.assertRaises(ZeroDivisionError):
+            exact.defuzzify(fl.Aggregated("", -1, 1, fl.Maximum()), -1, 1)
+
+    def test_exact_arrays_of_degrees(self) -> None:
+        import numpy as np
+        degrees = np.array([[0.2, 0.8], [0.8, 0.2], [1.0, 0.5], [0.5, 0.5], [0.0, 0.3]])
+
+        def aggregated(medium: float, high: float) -> fl.Aggregated:
+            return fl.Aggregated("", 0, 1, fl.Maximum(), [
+                fl.Activated(fl.Triangle("Medium", 0.25, 0.5, 0.75), medium, fl.Minimum()),
+                fl.Activated(fl.Trapezoid("High", 0.5, 0.75, 1.0, 1.0), high,
+                             fl.AlgebraicProduct()),
+                fl.Activated(fl.Rectangle("Low", 0.0, 0.3), medium, fl.Minimum())])
+
+        for defuzzifier in [fl.Centroid(exact=True), fl.Bisector(exact=True)]:
+            expected = [defuzzifier.defuzzify(aggregated(*row), 0, 1) for row in degrees]
+            obtained = defuzzifier.defuzzify_array(aggregated(*degrees.T), 0, 1)
+            np.testing.assert_allclose(obtained, expected, rtol=0.0, atol=1e-12,
+                                       err_msg=defuzzifier.class_name)
+            # the rows without area cannot be defuzzified exactly
+            self.assertTrue(np.isnan(defuzzifier.defuzzify_exact_array(
+                aggregated(np.array([0.0, 0.5]), np.array([0.0, 0.5])), 0, 1)[0]))
+
+    def test_bisector_exact(self) -> None:
+        DefuzzifierAssert(self, fl.Bisector(exact=True)) \
+            .exports_fll("Bisector 100") \
+            .defuzzifies(
+            {
+                fl.Triangle("", -1, 0): -0.5,
+                fl.Triangle("", -1, 1): 0.0,
+                fl.Triangle("", 0, 1): 0.5,
+                fl.Triangle("", -1, -1, 0): -1.0 / math.sqrt(2.0),
+                fl.Rectangle("", -0.5, 1.0): 0.25,
+                fl.Aggregated("", 0, 1, fl.Maximum(), [
+                    fl.Activated(fl.Triangle("Medium", 0.25, 0.5, 0.75), 0.2, fl.Minimum()),
+                    fl.Activated(fl.Triangle("High", 0.5, 0.75, 1.0), 0.8, fl.Minimum())
+                ]): 0.71875,
+            }, -1, 1)
+        self.assertFalse(fl.FllImporter().defuzzifier("Bisector 300").exact)
+
+    def test_exact_vertices_crossing_at_adjacent_floats(self) -> None:
+        # the activated terms of the shower cross each other at vertices one float apart
+        engine = fl.FllImporter().from_file(
+            Path(fl.__file__).parent / "examples" / "mamdani" / "matlab" / "shower.fll")
+        engine.input_variable("temp").value = -3.75
+        engine.input_variable("flow").value = 0.3125
+        engine.process()
+        sampled = [variable.value for variable in engine.output_variables]
+        for variable in engine.output_variables:
+            variable.defuzzifier.exact = True  # type: ignore
+        engine.process()
+        exact = [variable.value for variable in engine.output_variables]
+        for expected, obtained in zip(sampled, exact):
+            self.assertAlmostEqual(expected, obtained, delta=1e-3)
+
     def test_weighted_defuzzifier(self) -> None:
         self.assertEqual(fl.WeightedDefuzzifier().type, fl.WeightedDefuzzifier.Type.Automatic)
 
@@ -14,7 +14,9 @@
  pyfuzzylite is a trademark of FuzzyLite Limited
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
+import copy
 import unittest
+from math import nan
 from typing import List, Optional
 
 import fuzzylite as fl
@@ -91,6 +93,27 @@ class EngineAssert(BaseAssert[fl.Engine]):
             self.test.assertListEqual(expected, obtained, msg=f"in evaluation line {line}")
         return self
 
+    def evaluates_batch(self, inputs: List[List[float]]) -> 'EngineAssert':
+        import numpy as np
+        self.actual.restart()
+        expected = []
+        for row in inputs:
+            for input_variable, value in zip(self.actual.input_variables, row):
+                input_variable.value = value
+            self.actual.process()
+            expected.append([ov.value for ov in self.actual.output_variables])
+
+        self.actual.restart()
+        obtained = self.actual.process_batch(np.array(inputs, dtype=float))
+        np.testing.assert_allclose(
+            obtained, np.array(expected, dtype=float).reshape(obtained.shape),
+            rtol=0.0, atol=1e-9, err_msg=f"in engine '{self.actual.name}'")
+
+        # the state of the engine is restored after processing the batch
+        np.testing.assert_array_equal([v.value for v in self.actual.variables],
+                                      [nan] * len(self.actual.variables))
+        return self
+
 
 class TestEngine(unittest.TestCase):
 
@@ -219,11 +242,214 @@ class TestEngine(unittest.TestCase):
 10.0000000000000000 3.3333333333333335 13.7092196934510024 13.8888888888888875
 10.0000000000000000 6.6666666666666670 20.2157800031293959 22.7777777777777821
 10.0000000000000000 10.0000000000000000 25.0010497900419928 25.0000000000000000
-""", decimals=16)
+""", decimals=16) \
+            .evaluates_batch([[service, food]
+                              for service in [-1.0, 0.0, 2.5, 5.0, 7.5, 10.0, 11.0, nan]
+                              for food in [-1.0, 0.0, 3.3, 6.7, 10.0, 11.0, nan]])
 
     def test_engine_from_fll(self) -> None:
         pass
 
+    def test_process_batch_of_examples(self) -> None:
+        import importlib
+        import pathlib
+
+        import fuzzylite.examples
+        root = pathlib.Path(next(iter(fuzzylite.examples.__path__)))
+        for path in sorted(root.rglob("*.py")):
+            if path.name == "__init__.py":
+                continue
+            module = ".".join(path.relative_to(root.parent.parent).with_suffix("").parts)
+            engine = importlib.import_module(module).engine
+            lines = path.with_suffix(".fld").read_text().splitlines()[1:]
+            inputs = []
+            for line in lines[::max(1, len(lines) // 10)]:
+                row = [fl.scalar(x) for x in line.split()[:len(engine.input_variables)]]
+                try:
+                    for input_variable, value in zip(engine.input_variables, row):
+                        input_variable.value = value
+                    engine.process()
+                    inputs.append(row)
+                except ArithmeticError:
+                    pass
+            with self.subTest(module=module):
+                EngineAssert(self, engine).evaluates_batch(inputs)
+
+    def test_process_incremental_examples(self) -> None:
+        import copy
+        import importlib
+        import pathlib
+        import random
+
+        import fuzzylite.examples
+        random.seed(0)
+        root = pathlib.Path(next(iter(fuzzylite.examples.__path__)))
+        for path in sorted(root.rglob("*.py")):
+            if path.name == "__init__.py":
+                continue
+            module = ".".join(path.relative_to(root.parent.parent).with_suffix("").parts)
+            engine = copy.deepcopy(importlib.import_module(module).engine)
+            expected = copy.deepcopy(engine)
+            with self.subTest(module=module):
+                for step in range(10):
+                    for a, b in zip(engine.input_variables, expected.input_variables):
+                        if step == 0 or random.random() < 0.3:
+                            a.value = b.value = random.uniform(a.minimum, a.maximum)
+                    try:
+                        expected.process()
+                    except ArithmeticError:
+                        engine.restart()
+                        continue
+                    engine.process(incremental=True)
+                    self.assertEqual(str([v.value for v in expected.output_variables]),
+                                     str([v.value for v in engine.output_variables]))
+                    self.assertEqual([v.fuzzy_value() for v in expected.output_variables],
+                                     [v.fuzzy_value() for v in engine.output_variables])
+
+    def test_process_incremental(self) -> None:
+        import copy
+        from unittest.mock import patch
+        engine = fl.FllImporter().from_string("""\
+Engine: incremental
+InputVariable: A
+  range: 0.000 1.000
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+InputVariable: B
+  range: 0.000 1.000
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+OutputVariable: Y
+  range: 0.000 1.000
+  aggregation: AlgebraicSum
+  defuzzifier: Centroid 100
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+OutputVariable: Z
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: Centroid 100
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+RuleBlock: rules
+  conjunction: Minimum
+  implication: Minimum
+  activation: General
+  rule: if A is low then Y is low
+  rule: if A is high and B is low then Y is high
+  rule: if B is high then Y is high
+  rule: if Y is high then Z is low
+""")
+        input_a, input_b = engine.input_variables
+        rules = engine.rule_blocks[0].rules
+
+        def process(a: float, b: float, incremental: bool = True) -> List[fl.Rule]:
+            input_a.value, input_b.value = a, b
+            with patch.object(fl.Rule, 'activate_with', autospec=True,
+                              side_effect=fl.Rule.activate_with) as activate_with:
+                engine.process(incremental)
+            self.assertAlmostEqual(expected(a, b), engine.output_variable("Y").value)
+            return [call.args[0] for call in activate_with.call_args_list]
+
+        def expected(a: float, b: float) -> float:
+            other = copy.deepcopy(engine)
+            other.input_variable("A").value, other.input_variable("B").value = a, b
+            other.process()
+            return other.output_variable("Y").value
+
+        self.assertListEqual(rules, process(0.2, 0.4))
+        self.assertListEqual([rules[0], rules[1], rules[3]], process(0.6, 0.4))
+        self.assertListEqual([rules[1], rules[2], rules[3]], process(0.6, 0.3))
+        self.assertListEqual([rules[3]], process(0.6, 0.3))
+        self.assertEqual(["(0.400*low)", "(0.600*high)", "(0.300*high)"],
+                         [f"({fl.Op.str(term.degree)}*{term.term.name})"
+                          for term in engine.output_variable("Y").fuzzy.terms])
+
+        # disabled variables are changes
+        input_b.enabled = False
+        self.assertListEqual([rules[1], rules[2], rules[3]], process(0.6, 0.3))
+        input_b.enabled = True
+        self.assertListEqual([rules[1], rules[2], rules[3]], process(0.6, 0.3))
+
+        # non-incremental processes and restarts activate all the rules next
+        self.assertListEqual(rules, process(0.6, 0.3, incremental=False))
+        self.assertListEqual(rules, process(0.6, 0.3))
+        engine.restart()
+        self.assertListEqual(rules, process(0.6, 0.3))
+
+        # changes to the rule blocks activate all the rules
+        engine.rule_blocks[0].implication = fl.AlgebraicProduct()
+        self.assertListEqual(rules, process(0.6, 0.3))
+        rules[2].text = "if B is low then Y is high"
+        rules[2].load(engine)
+        self.assertListEqual(rules, process(0.6, 0.3))
+        self.assertListEqual([rules[3]], process(0.6, 0.3))
+
+        # only General activation is incremental
+        engine.rule_blocks[0].activation = fl.Highest(2)
+        self.assertListEqual(rules, process(0.6, 0.3))
+        self.assertListEqual(rules, process(0.6, 0.3))
+
+        # each context has its own incremental state
+        engine.rule_blocks[0].activation = fl.General()
+        self.assertListEqual(rules, process(0.7, 0.3))
+        with fl.Context():
+            self.assertListEqual(rules, process(0.7, 0.3))
+            self.assertListEqual(rules[1:], process(0.7, 0.8))
+        self.assertListEqual(rules[1:], process(0.7, 0.8))
+
+    def test_process_with_dependent_terms(self) -> None:
+        engine = fl.FllImporter().from_string("""\
+Engine: dependent
+InputVariable: A
+  range: 0.000 1.000
+  term: low Function 1 - x
+  term: below Function B - x
+InputVariable: B
+  range: 0.000 1.000
+  term: any Rectangle 0.000 1.000
+OutputVariable: Y
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: Centroid 100
+  term: low Triangle 0.000 0.000 1.000
+  term: high Triangle 0.000 1.000 1.000
+RuleBlock: rules
+  conjunction: Minimum
+  implication: Minimum
+  activation: General
+  rule: if A is low then Y is low
+  rule: if A is below then Y is high
+""")
+        input_a, input_b = engine.input_variables
+
+        def activated() -> str:
+            return " + ".join(f"{fl.Op.str(term.degree)}/{term.term.name}"
+                              for term in engine.output_variable("Y").fuzzy.terms)
+
+        for incremental in [False, True]:
+            with self.subTest(incremental=incremental):
+                engine.restart()
+                input_a.value, input_b.value = 0.2, 0.4
+                engine.process(incremental)
+                self.assertEqual("0.800/low + 0.200/high", activated())
+
+                # the membership of A to below changes with B, even when A does not change
+                input_b.value = 0.9
+                engine.process(incremental)
+                self.assertEqual("0.800/low + 0.700/high", activated())
+
+    def test_process_batch_of_wrong_shape(self) -> None:
+        import numpy as np
+        engine = fl.Engine(input_variables=[fl.InputVariable("A"), fl.InputVariable("B")])
+        with self.assertRaisesRegex(ValueError, r"expected a matrix of inputs with shape "
+                                                r"\(rows, 2\), but found \(3,\)"):
+            engine.process_batch([1.0, 2.0, 3.0])
+        with self.assertRaisesRegex(ValueError, r"expected a matrix of inputs with shape "
+                                                r"\(rows, 2\), but found \(1, 3\)"):
+            engine.process_batch([[1.0, 2.0, 3.0]])
+        self.assertEqual((0, 0), engine.process_batch(np.zeros((0, 2))).shape)
+
     def test_inputs(self) -> None:
         flc = fl.Engine("name", "description",
                         [fl.InputVariable("A"), fl.InputVariable("B")])
@@ -259,6 +485,142 @@ class TestEngine(unittest.TestCase):
         for i, iv in enumerate(flc.output_variables):
             self.assertEqual(iv.name, names[i])
 
+    def test_activated_terms_are_valid_until_the_next_process(self) -> None:
+        from fuzzylite.examples.mamdani import SimpleDimmer
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        ambient, power = engine.input_variable("Ambient"), engine.output_variable("Power")
+        ambient.value = 0.25
+        engine.process()
+        terms = list(power.fuzzy.terms)
+        copies = [copy.copy(term) for term in terms]
+        self.assertEqual(["HIGH"], [term.term.name for term in terms])
+        self.assertEqual([1.0], [term.degree for term in terms])
+
+        # the next process reuses the activated terms, hence they must be copied to be kept
+        ambient.value = 0.3
+        engine.process()
+        self.assertIs(terms[0], power.fuzzy.terms[0])
+        self.assertAlmostEqual(0.8, terms[0].degree)
+        self.assertEqual([1.0], [term.degree for term in copies])
+
+        # the copies are never reused
+        for ambient.value in [0.25, 0.3, 0.5, 0.75]:
+            engine.process()
+            self.assertFalse({id(term) for term in power.fuzzy.terms} & {id(t) for t in copies})
+        self.assertEqual([1.0], [term.degree for term in copies])
+        self.assertEqual(1.0, fl.Aggregated("Power", 0.0, 1.0, fl.Maximum(), copies)
+                         .membership(0.75))
+
+
+class TestLookupTableEngine(unittest.TestCase):
+
+    def test_create(self) -> None:
+        import numpy as np
+
+        from fuzzylite.examples.mamdani.matlab.tipper import engine
+        lut = fl.LookupTableEngine.create(engine, resolution=8, chunk_size=10)
+        self.assertEqual([("service", 0.0, 10.0), ("food", 0.0, 10.0)], lut.inputs)
+        self.assertEqual(["tip"], lut.outputs)
+        self.assertEqual(81, len(lut.table))
+        self.assertEqual(1, len(lut.error))
+        self.assertLess(0.0, lut.error[0])
+        self.assertLess(lut.error[0], 5.0)
+
+        grid = np.array([[service, food] for service in np.linspace(0, 10, 9)
+                         for food in np.linspace(0, 10, 9)])
+        np.testing.assert_allclose(engine.process_batch(grid).ravel(), lut.table)
+        np.testing.assert_allclose(lut.table, lut.process_batch(grid).ravel())
+
+        centers = grid[(grid < 10.0).all(axis=1)] + 0.625
+        self.assertLessEqual(np.abs(engine.process_batch(centers) - lut.process_batch(centers))
+                             .max(), lut.error[0])
+        for row in centers:
+            np.testing.assert_allclose(lut.process_batch(row.reshape(1, -1))[0],
+                                       lut.process(row))
+        # the state of the engine is unchanged
+        self.assertTrue(all(fl.isnan(v.value) for v in engine.variables))
+
+    def test_create_with_nan(self) -> None:
+        from fuzzylite.examples.mamdani.SimpleDimmer import engine
+        lut = fl.LookupTableEngine.create(engine, resolution=4)
+        self.assertEqual("nan 0.750 0.500 0.250 nan", " ".join(fl.Op.str(x) for x in lut.table))
+        # the corners with nan values are left out of the interpolation
+        self.assertEqual("0.750", fl.Op.str(lut.process([0.25])[0]))
+        self.assertEqual("0.625", fl.Op.str(lut.process([0.375])[0]))
+        self.assertEqual("0.750", fl.Op.str(lut.process([0.125])[0]))
+        self.assertEqual("0.250", fl.Op.str(lut.process([0.999])[0]))
+        self.assertEqual("nan", fl.Op.str(lut.process([0.0])[0]))
+        self.assertEqual(["0.750", "0.250", "nan"], [fl.Op.str(x) for x in lut.process_batch(
+            [[0.125], [0.999], [1.0]]).ravel()])
+        self.assertEqual(1, len(lut.error))
+        self.assertLess(lut.error[0], 1e-12)
+
+    def test_create_with_nan_has_values_where_engine_has_values(self) -> None:
+        import numpy as np
+
+        from fuzzylite.examples.mamdani.SimpleDimmer import engine
+        lut = fl.LookupTableEngine.create(engine, resolution=32)
+        inputs = np.random.RandomState(0).uniform(0.0, 1.0, (2000, 1))
+        expected = engine.process_batch(inputs)
+        obtained = lut.process_batch(inputs)
+        self.assertFalse(np.isnan(expected).any())
+        self.assertFalse(np.isnan(obtained).any())
+        np.testing.assert_allclose(obtained.ravel(), [lut.process(row)[0] for row in inputs])
+        # the error is estimated at the centers of the cells, elsewhere it can be larger
+        self.assertTrue(np.isfinite(lut.error[0]))
+        self.assertLess(np.abs(expected - obtained).max(), 2.0 * lut.error[0])
+
+    def test_interpolation(self) -> None:
+        import numpy as np
+
+        # f(a, b) = a + 2b is interpolated exactly
+        lut = fl.LookupTableEngine("f", [("a", 0.0, 1.0), ("b", -1.0, 1.0)], ["f", "g"], 2,
+                                   [y for a in [0.0, 0.5, 1.0] for b in [-1.0, 0.0, 1.0]
+                                    for y in [a + 2 * b, -a]])
+        self.assertEqual(lut._corners, [(0, 0), (3, 1), (1, 2), (4, 3)])
+        inputs = [[0.0, -1.0], [1.0, 1.0], [0.3, 0.7], [0.75, -0.1], [-1.0, 0.5], [2.0, 3.0]]
+        expected = [[0.0 + -2.0, -0.0], [3.0, -1.0], [0.3 + 1.4, -0.3], [0.75 - 0.2, -0.75],
+                    [0.0 + 1.0, -0.0], [1.0 + 2.0, -1.0]]
+        for row, values in zip(inputs, expected):
+            np.testing.assert_allclose(values, lut.process(row), atol=1e-15)
+        np.testing.assert_allclose(expected, lut.process_batch(inputs), atol=1e-15)
+
+        self.assertEqual("[nan, nan]", fl.Op.str(lut.process([nan, 0.0])))
+        self.assertEqual("[[nan, nan], [-2.0, 0.0]]",
+                         str(lut.process_batch([[0.0, nan], [0.0, -1.0]]).tolist()))
+
+    def test_save_and_load(self) -> None:
+        import pathlib
+        import tempfile
+
+        from fuzzylite.examples.mamdani.matlab.tipper import engine
+        lut = fl.LookupTableEngine.create(engine, resolution=4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "tipper.lut"
+            lut.save(path)
+            loaded = fl.LookupTableEngine.load(path)
+            self.assertEqual(str(lut), str(loaded))
+            self.assertEqual(lut.inputs, loaded.inputs)
+            self.assertEqual(lut.table, loaded.table)
+            self.assertEqual(lut.process([3.3, 7.7]), loaded.process([3.3, 7.7]))
+
+            path.write_bytes(b"Engine: tipper\n")
+            with self.assertRaisesRegex(ValueError, "expected a lookup table in file"):
+                fl.LookupTableEngine.load(path)
+
+    def test_invalid(self) -> None:
+        engine = fl.Engine(input_variables=[fl.InputVariable("A", minimum=0.0, maximum=fl.inf)])
+        with self.assertRaisesRegex(ValueError, r"expected a finite range in input variable "
+                                                r"'A', but found \[0.0, inf\]"):
+            fl.LookupTableEngine.create(engine)
+        with self.assertRaisesRegex(ValueError, "expected a resolution of at least 1, but found 0"):
+            fl.LookupTableEngine(resolution=0)
+        with self.assertRaisesRegex(ValueError, "expected a table of 3 values, but found 2"):
+            fl.LookupTableEngine("", [("A", 0.0, 1.0)], ["Y"], 2, [0.0, 1.0])
+        lut = fl.LookupTableEngine("", [("A", 0.0, 1.0)], ["Y"], 1, [0.0, 1.0])
+        with self.assertRaisesRegex(ValueError, "expected 1 input values, but found 2"):
+            lut.process([0.0, 1.0])
+
 
 if __name__ == '__main__':
     unittest.main()
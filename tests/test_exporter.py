@@ -237,6 +237,8 @@ RuleBlock: rb
         self.assertEqual(fl.FllExporter().to_string(defuzzifier),
                          fl.FllExporter().defuzzifier(defuzzifier))
         self.assertEqual(fl.FllExporter().defuzzifier(defuzzifier), "Centroid 100")
+        defuzzifier = fl.Bisector(200, exact=True)
+        self.assertEqual(fl.FllExporter().defuzzifier(defuzzifier), "Bisector 200")
 
     def test_object(self) -> None:
         with self.assertRaisesRegex(ValueError, rf"expected a fuzzylite object, but found 'object"):
@@ -499,6 +501,10 @@ fl.RuleBlock(
         self.assertEqual(fl.PythonExporter().defuzzifier(defuzzifier),
                          "fl.Centroid(100)")
 
+        defuzzifier = fl.Bisector(200, exact=True)
+        self.assertEqual(fl.PythonExporter().defuzzifier(defuzzifier),
+                         "fl.Bisector(200)")
+
         defuzzifier = fl.WeightedAverage()
         self.assertEqual(fl.PythonExporter().to_string(defuzzifier),
                          fl.PythonExporter().defuzzifier(defuzzifier))
@@ -518,6 +524,8 @@ class TestFldExporter(unittest.TestCase):
         self.assertTrue(exporter.headers)
         self.assertTrue(exporter.input_values)
         self.assertTrue(exporter.output_values)
+        self.assertEqual(1, exporter.workers)
+        self.assertEqual(1024, exporter.chunk_size)
 
     def test_header(self) -> None:
         engine = fl.Engine(
@@ -639,6 +647,146 @@ Ambient Power
 0.510 0.486
 0.511 0.485\n""", writer.getvalue())
 
+    def test_write_from_reader_in_chunks(self) -> None:
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        lines = [f"{0.001 * i:.3f}\n" for i in range(1001)]
+        expected = fl.FldExporter().to_string_from_reader(engine, io.StringIO("".join(lines)))
+
+        class Reader(io.StringIO):
+            def readlines(self, hint: int = -1) -> List[str]:
+                raise AssertionError("expected the lines to be read one at a time")
+
+        class Writer(io.StringIO):
+            writes = 0
+
+            def write(self, s: str) -> int:
+                Writer.writes += 1
+                return super().write(s)
+
+        progress: List[int] = []
+        writer = Writer()
+        fl.FldExporter(chunk_size=100).write_from_reader(
+            engine, writer, Reader("".join(lines)),
+            progress=lambda rows, rate: progress.append(rows) if rate > 0 else None)
+        self.assertEqual(expected, writer.getvalue())
+        self.assertEqual(list(range(100, 1001, 100)) + [1001], progress)
+        self.assertEqual(1 + 11, Writer.writes)  # headers and chunks
+
+    def test_write_from_reader_fails_in_the_middle_of_a_chunk(self) -> None:
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        reader = "0.25\n0.5\n0.75\nbright\n1.0\n"
+        # the rows processed before the failure are written, like writing one row at a time
+        writer = io.StringIO()
+        with self.assertRaisesRegex(ValueError, r"could not convert string to float: 'bright'"):
+            fl.FldExporter(chunk_size=10).write_from_reader(engine, writer, io.StringIO(reader))
+        self.assertEqual("""\
+Ambient Power
+0.250 0.750
+0.500 0.500
+0.750 0.250\n""", writer.getvalue())
+
+        expected = writer.getvalue()
+        writer = io.StringIO()
+        with self.assertRaisesRegex(ValueError, r"could not convert string to float: 'bright'"):
+            fl.FldExporter(chunk_size=1).write_from_reader(engine, writer, io.StringIO(reader))
+        self.assertEqual(expected, writer.getvalue())
+
+    def test_write_from_reader_in_batches(self) -> None:
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        reader = "".join(f"{0.001 * i:.3f} nan\n" for i in range(-5, 1006))
+        for exporter in [fl.FldExporter(chunk_size=64), fl.FldExporter(input_values=False),
+                         fl.FldExporter(output_values=False, separator="\t")]:
+            expected = exporter.to_string_from_reader(engine, io.StringIO(reader))
+            obtained = exporter.to_string_from_reader(engine, io.StringIO(reader), batch=True)
+            self.assertEqual(expected, obtained)
+
+        # the state of the engine is not modified
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        fl.FldExporter().to_string_from_reader(engine, io.StringIO(reader), batch=True)
+        self.assertTrue(fl.isnan(engine.input_variable("Ambient").value))
+        self.assertTrue(fl.isnan(engine.output_variable("Power").value))
+
+        engine.input_variable("Ambient").lock_range = True
+        obtained = fl.FldExporter(headers=False).to_string_from_reader(
+            engine, io.StringIO("-1\n2\n"), batch=True)
+        self.assertEqual("0.000 nan\n1.000 nan\n", obtained)
+
+        with self.assertRaisesRegex(ValueError, r"not enough input values \(1\) "
+                                                r"for the input variables \(2\)"):
+            fl.FldExporter().to_string_from_reader(
+                fl.Engine(input_variables=[fl.InputVariable("a"), fl.InputVariable("b")]),
+                io.StringIO("0.5\n"), batch=True)
+        with self.assertRaisesRegex(ValueError, r"could not convert string to float: 'Ambient'"):
+            fl.FldExporter().to_string_from_reader(engine, io.StringIO("Ambient\n"), batch=True)
+
+    def test_to_array_from_scope(self) -> None:
+        import numpy as np
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        for scope in fl.FldExporter.ScopeOfValues:
+            expected = fl.FldExporter(headers=False).to_string_from_scope(engine, 100, scope)
+            obtained = fl.FldExporter(chunk_size=7).to_array_from_scope(engine, 100, scope)
+            self.assertEqual((100, 2), obtained.shape)
+            self.assertEqual(expected, "".join(" ".join(fl.Op.str(x) for x in row) + "\n"
+                                               for row in obtained.tolist()))
+
+        from fuzzylite.examples.mamdani.matlab import tipper
+        engine = fl.FllImporter().from_string(str(tipper.engine))
+        service, food = engine.input_variables
+        food.value = 7.0
+        obtained = fl.FldExporter(input_values=False).to_array_from_scope(
+            engine, 11, fl.FldExporter.ScopeOfValues.EachVariable, {service})
+        self.assertEqual((11, 1), obtained.shape)
+        expected = fl.FldExporter(input_values=False).to_array_from_inputs(
+            engine, np.column_stack([np.linspace(0, 10, 11), np.full(11, 7.0)]))
+        np.testing.assert_array_equal(expected, obtained)
+        self.assertEqual(7.0, food.value)
+
+    def test_to_array_from_inputs(self) -> None:
+        import numpy as np
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        inputs = np.array([[0.25, 9.0], [0.5, 9.0], [2.0, 9.0]])
+        obtained = fl.FldExporter(chunk_size=2).to_array_from_inputs(engine, inputs)
+        np.testing.assert_allclose([[0.25, 0.75], [0.5, 0.5], [2.0, np.nan]], obtained)
+        with self.assertRaisesRegex(ValueError, r"expected a matrix of inputs with at least 1 "
+                                                r"columns, but got shape \(2,\)"):
+            fl.FldExporter().to_array_from_inputs(engine, np.array([0.5, 0.5]))
+
+    def test_to_npy_and_raw(self) -> None:
+        import numpy as np
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        exporter = fl.FldExporter()
+        values = exporter.to_array_from_scope(engine, 1000)
+        with tempfile.TemporaryDirectory() as directory:
+            for path, write in [(Path(directory) / "values.npy", exporter.to_npy),
+                                (Path(directory) / "values.fld", exporter.to_raw)]:
+                write(path, engine, values)
+                for memory_map in [True, False]:
+                    names, obtained = fl.FldExporter.read_values(path, memory_map)
+                    self.assertEqual(["Ambient", "Power"], names)
+                    np.testing.assert_array_equal(values, obtained)
+                    # the values mapped into memory are read-only
+                    self.assertEqual(memory_map, not obtained.flags.writeable)
+                    del obtained
+
+            # the raw values are aligned to 8 bytes after the magic and header lines
+            data = (Path(directory) / "values.fld").read_bytes()
+            self.assertTrue(data.startswith(b"fuzzylite-fld 1\n"))
+            offset = data.index(b"\n", len(b"fuzzylite-fld 1\n")) + 1
+            self.assertEqual(0, offset % 8)
+            self.assertEqual(8 * values.size, len(data) - offset)
+
+            # empty matrices
+            exporter.to_raw(Path(directory) / "empty.fld", engine, np.empty((0, 2)))
+            names, obtained = fl.FldExporter.read_values(Path(directory) / "empty.fld")
+            self.assertEqual((0, 2), obtained.shape)
+
+            with self.assertRaisesRegex(ValueError, r"expected a matrix of values with 2 "
+                                                    r"columns, but got shape \(1000, 1\)"):
+                exporter.to_raw(Path(directory) / "invalid.fld", engine, values[:, :1])
+            (Path(directory) / "invalid.fld").write_text("Ambient Power\n0.000 nan\n")
+            with self.assertRaisesRegex(ValueError, "expected values in NumPy or raw format"):
+                fl.FldExporter.read_values(Path(directory) / "invalid.fld")
+
     def test_to_file_from_reader(self) -> None:
         engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
         reader = """\
@@ -832,6 +980,44 @@ service food mTip tsTip
 10.000 nan nan nan
 """, writer.getvalue())
 
+    def test_write_from_scope_in_parallel(self) -> None:
+        from fuzzylite.examples.hybrid import tipper
+        engine = fl.FllImporter().from_string(str(tipper.engine))
+        engine.input_variable("food").value = 5.0
+        for scope in fl.FldExporter.ScopeOfValues:
+            for active in [{"service", "food"}, {"service"}]:
+                serial_engine = fl.FllImporter().from_string(str(engine))
+                serial_engine.input_variable("food").value = 5.0
+                expected = fl.FldExporter().to_string_from_scope(
+                    serial_engine, 16, scope,
+                    {serial_engine.input_variable(name) for name in active})
+                for chunk_size in [1, 7, 1024]:
+                    with self.subTest(scope=scope, active=active, chunk_size=chunk_size):
+                        obtained = fl.FldExporter(workers=2, chunk_size=chunk_size) \
+                            .to_string_from_scope(engine, 16, scope,
+                                                  {engine.input_variable(name)
+                                                   for name in active})
+                        self.assertEqual(expected, obtained)
+                        self.assertEqual(5.0, engine.input_variable("food").value)
+                        self.assertTrue(fl.isnan(engine.output_variable("mTip").value))
+
+    def test_write_from_scope_in_parallel_keeps_the_engine(self) -> None:
+        # the state of the engine that FLL cannot express is kept by the workers
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        # (eg, the vertices of the terms are more precise than the decimals written in FLL)
+        engine.input_variable("Ambient").term("MEDIUM").vertex_a = 1.0 / 3.0 - 1e-4
+        scope = fl.FldExporter.ScopeOfValues.AllVariables
+        expected = fl.FldExporter().to_string_from_scope(engine, 16, scope)
+        self.assertNotEqual(expected, fl.FldExporter().to_string_from_scope(
+            fl.FllImporter().from_string(str(engine)), 16, scope))
+        self.assertEqual(expected, fl.FldExporter(workers=2, chunk_size=3)
+                         .to_string_from_scope(engine, 16, scope))
+
+        engine.rule_block("").conjunction = fl.NormLambda(lambda a, b: min(a, b))
+        with self.assertRaisesRegex(ValueError, "expected an engine that can be pickled to "
+                                                "write the values in parallel, but found: "):
+            fl.FldExporter(workers=2).to_string_from_scope(engine, 16, scope)
+
     def test_to_file_from_scope(self) -> None:
         engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
 
@@ -891,6 +1077,78 @@ Ambient Power
 0.003 0.750""", '\n'.join(obtained.split("\n")[:5]))
 
 
+class TestBinaryExporter(unittest.TestCase):
+
+    def test_to_bytes(self) -> None:
+        import struct
+        engine = SimpleDimmer.engine
+        data = fl.BinaryExporter().to_bytes(engine)
+        magic, version, _, size, count = struct.unpack_from("<4sHHQQ", data)
+        self.assertEqual((b"FLLB", 2), (magic, version))
+
+        # the parameters are floats aligned to 8 bytes at the end of the data
+        start = len(data) - 8 * count
+        self.assertEqual(0, start % 8)
+        self.assertGreaterEqual(start, 24 + size)
+        parameters = struct.unpack_from(f"<{count}d", data, start)
+        ambient, power = engine.input_variables[0], engine.output_variables[0]
+        self.assertEqual((ambient.minimum, ambient.maximum, 0.0, 0.25, 0.5, 1.0),
+                         parameters[:6])
+        self.assertEqual(2 * 2 + 2 * 3 * 4 + 1 + 3, count)  # ranges, terms, default, weights
+        self.assertEqual(power.minimum, parameters[14])
+
+    def test_to_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "SimpleDimmer.flb"
+            fl.BinaryExporter().to_file(path, SimpleDimmer.engine)
+            self.assertEqual(fl.BinaryExporter().to_bytes(SimpleDimmer.engine),
+                             path.read_bytes())
+
+        with self.assertRaisesRegex(ValueError, "expected an Engine, but got InputVariable"):
+            fl.BinaryExporter().to_bytes(fl.InputVariable())
+        with self.assertRaisesRegex(ValueError, "cannot be exported to a string"):
+            fl.BinaryExporter().to_string(SimpleDimmer.engine)
+
+    def test_unregistered_components(self) -> None:
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        engine.rule_blocks[0].implication = fl.NormLambda(lambda a, b: a * b)
+        with self.assertRaisesRegex(ValueError, "expected a component registered in the tnorm "
+                                                "factory, but got 'NormLambda'"):
+            fl.BinaryExporter().to_bytes(engine)
+
+        class Custom(fl.Triangle):
+            pass
+
+        engine = fl.FllImporter().from_string(str(SimpleDimmer.engine))
+        engine.input_variables[0].terms.append(Custom("custom"))
+        with self.assertRaisesRegex(ValueError, "expected a term registered in the factory, "
+                                                "but got 'Custom'"):
+            fl.BinaryExporter().to_bytes(engine)
+
+    def test_terms_without_fixed_parameters(self) -> None:
+        engine = fl.Engine("terms", input_variables=[fl.InputVariable("input", terms=[
+            fl.Discrete("discrete", [0.0, 1.0, 0.5, 0.25, 1.0, 0.0], height=0.5),
+            fl.Linear("linear", [1.0, 2.0]),
+            fl.Function.create("function", "2 * x + 1")])])
+        loaded = fl.BinaryImporter().from_bytes(fl.BinaryExporter().to_bytes(engine))
+        self.assertEqual(str(engine), str(loaded))
+        self.assertIs(loaded, loaded.input_variables[0].term("linear").engine)  # type: ignore
+        self.assertEqual(5.0, loaded.input_variables[0].term("function").membership(2.0))
+
+        # other terms registered in the factory are stored with the text of their parameters
+        class Custom(fl.Triangle):
+            pass
+
+        fl.lib.factory_manager.term.constructors["Custom"] = Custom
+        try:
+            engine.input_variables[0].terms = [Custom("custom", 0.0, 0.5, 1.0, 0.5)]
+            loaded = fl.BinaryImporter().from_bytes(fl.BinaryExporter().to_bytes(engine))
+            self.assertIsInstance(loaded.input_variables[0].terms[0], Custom)
+            self.assertEqual(str(engine), str(loaded))
+        finally:
+            del fl.lib.factory_manager.term.constructors["Custom"]
+
+
 class TestExporters(unittest.TestCase):
 
     @unittest.skip("Re-enable after test coverage improved independently")
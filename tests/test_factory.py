@@ -15,6 +15,8 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import operator
+import re
 import unittest
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, Union
 
@@ -208,6 +210,36 @@ class TestFactory(unittest.TestCase):
 
 class TestFunctionFactory(unittest.TestCase):
 
+    def test_share(self) -> None:
+        factory = fl.FunctionFactory()
+        shared = factory.share("+")
+        self.assertIsNot(factory.objects["+"], shared)
+        self.assertEqual(str(factory.objects["+"]), str(shared))
+        self.assertIs(shared, factory.share("+"))
+
+        # the shared copy is copied again after the registered element is modified or replaced
+        factory.objects["+"].description = "Sum"
+        modified = factory.share("+")
+        self.assertIsNot(shared, modified)
+        self.assertEqual("Addition", shared.description)
+        self.assertEqual("Sum", modified.description)
+
+        factory.objects["+"] = fl.Function.Element("+", "Sum", fl.Function.Element.Type.Operator,
+                                                   operator.sub, 2, 70)
+        self.assertIsNot(modified, factory.share("+"))
+        self.assertEqual(operator.sub, factory.share("+").method)
+        self.assertEqual(operator.add, modified.method)
+
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "object with key 'unknown' not found in FunctionFactory")):
+            factory.share("unknown")
+
+    def test_parsed_nodes_share_elements(self) -> None:
+        root = fl.Function.parse("(x + 1) + (y + 2)")
+        self.assertIs(root.left.element, root.right.element)  # type: ignore
+        self.assertIs(root.element, root.left.element)  # type: ignore
+        self.assertIs(fl.lib.factory_manager.function.share("+"), root.element)
+
     def test_factory_precedence(self) -> None:
         precedence_expected = {0: 100, 1: 90, 2: 80, 3: 70, 4: 60, 5: 50,
                                6: 40, 7: 30, 8: 20, 9: 10, 10: 0}
@@ -16,6 +16,7 @@
 """
 
 import unittest
+import warnings
 from math import inf, isnan, nan
 from typing import Dict
 
@@ -31,6 +32,15 @@ class HedgeAssert(BaseAssert[fl.Hedge]):
                 self.test.assertEqual(isnan(self.actual.hedge(a)), True, f"when x={a}")
             else:
                 self.test.assertEqual(self.actual.hedge(a), z, f"when x={a}")
+        return self.evaluates_array(az)
+
+    def evaluates_array(self, az: Dict[float, float]) -> 'HedgeAssert':
+        import numpy as np
+        a = np.array(list(az.keys()), dtype=float)
+        z = np.array(list(az.values()), dtype=float)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # the edge cases are computed without warnings
+            np.testing.assert_array_equal(z, self.actual.hedge_array(a))
         return self
 
 
@@ -18,11 +18,15 @@
 import glob
 import io
 import os
+import pickle
 import re
+import sys
 import tempfile
 import unittest
+from array import array
+from copy import deepcopy
 from typing import cast
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import fuzzylite as fl
 
@@ -264,6 +268,31 @@ RuleBlock: steer_away
                 "but found 'description: value1 value2'")):
             fl.FllImporter().extract_value("description: value1 value2", "DESCRIPTION")
 
+    def test_engine_in_single_pass(self) -> None:
+        fll = """\
+description: ignored before the engine
+Engine: Bell # comment
+RuleBlock: steer_away
+  enabled: false
+InputVariable: obstacle
+
+  term: left Triangle 0.000 0.333 0.666 # comment
+OutputVariable: steer
+  term: right Bell 0.666 0.167 3.000
+  default: 1
+RuleBlock: steer_back
+  rule: if obstacle is left then steer is right
+"""
+        engine = fl.FllImporter().from_string(fll)
+        self.assertEqual("Bell", engine.name)
+        self.assertEqual("", engine.description)
+        self.assertEqual(["obstacle"], [v.name for v in engine.input_variables])
+        self.assertEqual(["steer"], [v.name for v in engine.output_variables])
+        self.assertEqual(1.0, engine.output_variable("steer").default_value)
+        self.assertEqual(["steer_away", "steer_back"], [b.name for b in engine.rule_blocks])
+        self.assertFalse(engine.rule_blocks[0].enabled)
+        self.assertEqual(1, len(engine.rule_blocks[1].rules))
+
     def test_invalid_components(self) -> None:
         with self.assertRaisesRegex(SyntaxError, re.escape(
                 "'invalid' is not a valid component of 'Engine'")):
@@ -287,6 +316,206 @@ RuleBlock: steer_away
             fl.FllImporter().component(fl.Variable, """Variable: Invalid""")  # type: ignore
 
 
+class TestEngineCache(unittest.TestCase):
+
+    def test_cache_in_memory(self) -> None:
+        cache = fl.EngineCache(capacity=2)
+        importer = fl.FllImporter(cache=cache)
+        engine = importer.from_string(BELL_FLL)
+        self.assertEqual([cache.key(BELL_FLL + "\n")], list(cache.engines))
+
+        # the cached engines are copies rather than parsed again
+        importer._engine = MagicMock(side_effect=AssertionError("parsed again"))  # type: ignore
+        cached = importer.from_string(BELL_FLL)
+        self.assertIsNot(engine, cached)
+        self.assertEqual(BELL_FLL, str(cached))
+        self.assertIsNot(engine.input_variables[0], cached.input_variables[0])
+        antecedent = cached.rule_blocks[0].rules[0].antecedent
+        self.assertIs(cached.input_variable("obstacle"),
+                      antecedent._program[2].__globals__["variable1"])  # type: ignore
+
+        cached.input_variable("obstacle").value = 0.25
+        cached.process()
+        self.assertEqual("0.665", fl.Op.str(cached.output_variable("steer").value))
+        self.assertTrue(fl.isnan(engine.output_variable("steer").value))
+
+        # the least recently used engines are discarded
+        importer = fl.FllImporter(cache=cache)
+        importer.from_string(BELL_FLL.replace("Engine: Bell", "Engine: Bell1"))
+        importer.from_string(BELL_FLL.replace("Engine: Bell", "Engine: Bell2"))
+        self.assertEqual(2, len(cache.engines))
+        self.assertNotIn(cache.key(BELL_FLL + "\n"), cache.engines)
+        cache.clear()
+        self.assertEqual(0, len(cache.engines))
+
+    def test_cache_in_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            fl.FllImporter(cache=fl.EngineCache(directory, secret=b"secret")).from_string(BELL_FLL)
+            key = fl.EngineCache().key(BELL_FLL + "\n")
+            self.assertEqual([f"{key}.pickle"], os.listdir(directory))
+
+            importer = fl.FllImporter(cache=fl.EngineCache(directory, secret=b"secret"))
+            importer._engine = MagicMock(side_effect=AssertionError("parsed again"))  # type: ignore
+            self.assertEqual(BELL_FLL, str(importer.from_string(BELL_FLL)))
+
+            # the entries that cannot be unpickled are parsed again
+            with open(os.path.join(directory, f"{key}.pickle"), "wb") as file:
+                file.write(fl.EngineCache(directory, secret=b"secret")._digest(b"invalid")
+                           + b"invalid")
+            cache = fl.EngineCache(directory, secret=b"secret")
+            self.assertEqual(BELL_FLL, str(fl.FllImporter(cache=cache).from_string(BELL_FLL)))
+
+    def test_cache_authenticates_the_directory(self) -> None:
+        import pickle
+        with tempfile.TemporaryDirectory() as directory:
+            key = fl.EngineCache().key(BELL_FLL + "\n")
+            path = os.path.join(directory, f"{key}.pickle")
+
+            # the engines saved with another secret key are parsed again
+            fl.FllImporter(cache=fl.EngineCache(directory)).from_string(BELL_FLL)
+            importer = fl.FllImporter(cache=fl.EngineCache(directory))
+            importer._engine = MagicMock(wraps=importer._engine)  # type: ignore
+            importer.from_string(BELL_FLL)
+            importer._engine.assert_called_once()  # type: ignore
+
+            # the engines saved with the same secret key are unpickled
+            fl.FllImporter(cache=fl.EngineCache(directory, secret=b"secret")).from_string(BELL_FLL)
+            importer = fl.FllImporter(cache=fl.EngineCache(directory, secret=b"secret"))
+            importer._engine = MagicMock(side_effect=AssertionError("parsed again"))  # type: ignore
+            self.assertEqual(BELL_FLL, str(importer.from_string(BELL_FLL)))
+
+            # the pickles written by others are not unpickled
+            with open(path, "rb") as file:
+                signed = file.read()
+            with open(path, "wb") as file:
+                file.write(signed[:32] + pickle.dumps(fl.Engine("tampered")))
+            self.assertIsNone(fl.EngineCache(directory, secret=b"secret").load(key))
+
+    def test_engines_that_cannot_be_pickled(self) -> None:
+        cache = fl.EngineCache()
+        engine = fl.FllImporter().from_string(BELL_FLL)
+        engine.rule_blocks[0].conjunction = fl.NormLambda(lambda a, b: min(a, b))
+        cache.save("key", engine)
+        self.assertIsNone(cache.load("key"))
+
+    def test_pickled_functions_are_compiled(self) -> None:
+        import pickle
+        function = fl.Function.create("f", "2 * x + 1")
+        copy = pickle.loads(pickle.dumps(function))
+        self.assertIsNotNone(copy._program)
+        self.assertEqual(5.0, copy.membership(2.0))
+
+
+class TestBinaryImporter(unittest.TestCase):
+
+    def test_import_examples(self) -> None:
+        import pathlib
+        import random
+        importer, exporter = fl.BinaryImporter(), fl.BinaryExporter()
+        root = pathlib.Path(next(iter(fl.examples.__path__)))  # type: ignore
+        paths = sorted(root.glob("**/*.fll"))
+        self.assertTrue(paths)
+        for path in paths:
+            with self.subTest(path=path.relative_to(root)):
+                engine = fl.FllImporter().from_file(path)
+                loaded = importer.from_bytes(exporter.to_bytes(engine))
+                self.assertEqual(fl.FllExporter().to_string(engine),
+                                 fl.FllExporter().to_string(loaded))
+                for rule in (rule for block in loaded.rule_blocks for rule in block.rules):
+                    self.assertTrue(rule.is_loaded())
+                    self.assertIsNotNone(rule.antecedent._program)
+
+                for _ in range(5):
+                    for variable in engine.input_variables:
+                        variable.value = random.uniform(variable.minimum, variable.maximum)
+                        loaded.input_variable(variable.name).value = variable.value
+                    engine.process()
+                    loaded.process()
+                    self.assertEqual(
+                        [fl.Op.str(variable.value) for variable in engine.output_variables],
+                        [fl.Op.str(variable.value) for variable in loaded.output_variables])
+
+    def test_from_file(self) -> None:
+        engine = fl.FllImporter().from_string(BELL_FLL)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bell.flb")
+            fl.BinaryExporter().to_file(path, engine)
+            for memory_map in [False, True]:
+                loaded = fl.BinaryImporter().from_file(path, memory_map=memory_map)
+                self.assertEqual(BELL_FLL, str(loaded))
+                loaded.input_variable("obstacle").value = 0.25
+                loaded.process()
+                self.assertEqual("0.665", fl.Op.str(loaded.output_variable("steer").value))
+
+    def test_from_file_memory_map(self) -> None:
+        engine = fl.FllImporter().from_string(BELL_FLL)
+        engine.output_variable("steer").terms.append(
+            fl.Discrete("center", [0.25, 0.0, 0.5, 1.0, 0.75, 0.0], height=0.5))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bell.flb")
+            fl.BinaryExporter().to_file(path, engine)
+            copied = fl.BinaryImporter().from_file(path)
+            mapped = fl.BinaryImporter().from_file(path, memory_map=True)
+            self.assertEqual(str(engine), str(mapped))
+
+            # the values of discrete terms are views of the mapped file, unless read into memory
+            term = cast(fl.Discrete, copied.output_variable("steer").term("center"))
+            self.assertIsInstance(term.x(), array)
+            term = cast(fl.Discrete, mapped.output_variable("steer").term("center"))
+            if sys.byteorder == "little":
+                self.assertIsInstance(term.x(), memoryview)
+                self.assertTrue(cast(memoryview, term.x()).readonly)
+            self.assertEqual([0.25, 0.5, 0.75], list(term.x()))
+            self.assertEqual([0.0, 1.0, 0.0], list(term.y()))
+            self.assertEqual(0.5, term.height)
+            self.assertEqual(0.25, term.membership(0.375))
+
+            # the views are copied when pickled
+            for other in (pickle.loads(pickle.dumps(mapped)), deepcopy(mapped)):
+                other_term = cast(fl.Discrete, other.output_variable("steer").term("center"))
+                self.assertIsInstance(other_term.x(), array)
+                self.assertEqual(str(term), str(other_term))
+
+            # the file is unmapped when the terms are garbage collected
+            del mapped, term
+
+    def test_rules_are_not_parsed(self) -> None:
+        engine = fl.FllImporter().from_string(BELL_FLL.replace(
+            "rule: if obstacle is left then steer is right",
+            "rule: if obstacle is very left or obstacle is not any then steer is right with 0.5"))
+        data = fl.BinaryExporter().to_bytes(engine)
+        with patch.object(fl.Antecedent, "load", side_effect=AssertionError), \
+                patch.object(fl.Consequent, "load", side_effect=AssertionError):
+            loaded = fl.BinaryImporter().from_bytes(data)
+        rule = loaded.rule_blocks[0].rules[0]
+        self.assertEqual("if obstacle is very left or obstacle is not any then steer is right "
+                         "with 0.500", rule.text)
+        self.assertEqual(0.5, rule.weight)
+        expression = cast(fl.Operator, rule.antecedent.expression)
+        self.assertEqual(fl.Rule.OR, expression.name)
+        left, right = cast(fl.Proposition, expression.left), cast(fl.Proposition, expression.right)
+        self.assertIs(loaded.input_variable("obstacle"), left.variable)
+        self.assertIs(loaded.input_variable("obstacle").term("left"), left.term)
+        self.assertEqual(["very"], [hedge.name for hedge in left.hedges])
+        self.assertEqual(["not", "any"], [hedge.name for hedge in right.hedges])
+        self.assertIsNone(right.term)
+        conclusion = rule.consequent.conclusions[0]
+        self.assertIs(loaded.output_variable("steer").term("right"), conclusion.term)
+
+    def test_invalid_data(self) -> None:
+        importer = fl.BinaryImporter()
+        data = fl.BinaryExporter().to_bytes(fl.FllImporter().from_string(BELL_FLL))
+        with self.assertRaisesRegex(ValueError, "expected an engine in binary format"):
+            importer.from_bytes(BELL_FLL.encode())
+        with self.assertRaisesRegex(ValueError, "expected version 2 of the binary format, "
+                                                "but got version 3"):
+            importer.from_bytes(data[:4] + b"\x03" + data[5:])
+        with self.assertRaisesRegex(ValueError, "truncated data"):
+            importer.from_bytes(data[:-8])
+        with self.assertRaisesRegex(ValueError, "the binary format cannot be imported"):
+            importer.from_string(BELL_FLL)
+
+
 class TestFllImporterBatch(unittest.TestCase):
 
     @unittest.skip("Re-enable after test coverage improved independently")
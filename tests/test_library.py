@@ -15,7 +15,9 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import sys
 import unittest
+from typing import List
 
 import fuzzylite
 
@@ -31,14 +33,18 @@ inf isinf isnan lib nan scalar
 
 activation Activation First General Highest Last Lowest Proportional Threshold
 
+benchmark
+
+context Context
+
 defuzzifier Bisector Centroid Defuzzifier IntegralDefuzzifier LargestOfMaximum MeanOfMaximum
 SmallestOfMaximum WeightedAverage WeightedDefuzzifier WeightedSum
 
-engine Engine
+engine Engine LookupTableEngine
 
 examples
 
-exporter Exporter FldExporter FllExporter PythonExporter
+exporter BinaryExporter Exporter FldExporter FllExporter PythonExporter
 
 factory ActivationFactory CloningFactory ConstructionFactory DefuzzifierFactory FactoryManager
 FunctionFactory HedgeFactory SNormFactory TNormFactory TermFactory
@@ -46,15 +52,19 @@ FunctionFactory HedgeFactory SNormFactory TNormFactory TermFactory
 hedge Any Extremely Hedge HedgeFunction HedgeLambda Maximum Minimum NilpotentMaximum
 NilpotentMinimum Norm NormFunction NormLambda NormalizedSum Not Seldom Somewhat Very
 
-importer FllImporter Importer
+importer BinaryImporter EngineCache FllImporter Importer
 
 library Library
 
+named Named NamedList
+
 norm AlgebraicProduct AlgebraicSum BoundedDifference BoundedSum DrasticProduct DrasticSum
 EinsteinProduct EinsteinSum HamacherProduct HamacherSum SNorm TNorm UnboundedSum
 
 operation Op Operation
 
+profiler Profiler
+
 rule Antecedent Consequent Expression Operator Proposition Rule RuleBlock
 
 term Activated Aggregated Bell Binary Concave Constant Cosine Discrete Function Gaussian
@@ -63,13 +73,68 @@ Spike Term Trapezoid Triangle ZShape
 
 variable InputVariable OutputVariable Variable
 """
-        self.assertSetEqual(set(expected.split()), set(dir(fuzzylite)))
+        obtained = set(dir(fuzzylite))
+        if sys.version_info < (3, 7):
+            # the attributes of modules (PEP 562) require Python 3.7
+            obtained -= {"__dir__", "__getattr__", "sys", "typing"}
+        self.assertSetEqual(set(expected.split()), obtained)
 
     def test_library_vars(self) -> None:
         self.assertEqual(fuzzylite.__name__, "pyfuzzylite")
         self.assertEqual(fuzzylite.__version__, "7.0b3")
         self.assertEqual(fuzzylite.__doc__, fuzzylite.lib.summary)
 
+    def test_library_debugging(self) -> None:
+        import logging
+        root, logger = logging.getLogger(), fuzzylite.lib.logger
+        root_level, level = root.level, logger.level
+        records: List[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append  # type: ignore
+        logger.addHandler(handler)
+        term = fuzzylite.Activated(fuzzylite.Triangle("A", 0.0, 0.5, 1.0), 0.5,
+                                   fuzzylite.Minimum())
+        try:
+            # debugging the library requires setting the level of its logger, so that
+            # applications debugging with the root logger do not log every membership value
+            root.setLevel(logging.DEBUG)
+            self.assertFalse(fuzzylite.lib.debugging)
+            term.membership(0.25)
+            self.assertListEqual([], records)
+
+            logger.setLevel(logging.DEBUG)
+            self.assertTrue(fuzzylite.lib.debugging)
+            term.membership(0.25)
+            self.assertListEqual(["0.500: term: _ Activated Minimum(0.500,A)"],
+                                 [record.getMessage() for record in records])
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+            root.setLevel(root_level)
+
+    def test_library_imports_lazily(self) -> None:
+        import subprocess
+        program = ("import sys; import fuzzylite; "
+                   "print(fuzzylite.lib._factory_manager is None); "
+                   "print(' '.join(sorted(sys.modules)))")
+        created_factory, modules = subprocess.run(
+            [sys.executable, "-c", program], check=True, stdout=subprocess.PIPE,
+            universal_newlines=True).stdout.splitlines()
+        self.assertEqual("True", created_factory)
+        lazy_modules = ["inspect", "multiprocessing", "numpy", "pathlib"]
+        if sys.version_info >= (3, 7):
+            # the examples and the benchmark are imported up front in Python 3.6
+            lazy_modules.extend(["fuzzylite.benchmark", "fuzzylite.examples"])
+        for module in lazy_modules:
+            self.assertNotIn(module, modules.split())
+
+        self.assertIsNotNone(fuzzylite.lib.factory_manager)
+        self.assertEqual("fuzzylite.examples", fuzzylite.examples.__name__)
+        self.assertEqual("fuzzylite.benchmark", fuzzylite.benchmark.__name__)
+        with self.assertRaisesRegex(AttributeError,
+                                    "module 'fuzzylite' has no attribute 'example'"):
+            fuzzylite.example  # type: ignore
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import copy
+import pickle
+import unittest
+
+import fuzzylite as fl
+
+
+class TestNamedList(unittest.TestCase):
+
+    def test_find(self) -> None:
+        terms = fl.NamedList([fl.Triangle("a"), fl.Triangle("b"), fl.Triangle("a")])
+        self.assertIs(terms[0], terms.find("a"))
+        self.assertIs(terms[1], terms.find("b"))
+        self.assertIsNone(terms.find("c"))
+        self.assertIs(terms[1], fl.NamedList.search(terms, "b"))
+        self.assertIs(terms[1], fl.NamedList.search(list(terms), "b"))
+        self.assertIsNone(fl.NamedList.search(list(terms), "c"))
+
+        self.assertIs(terms[2], terms.find("a", last=True))
+        self.assertIs(terms[1], terms.find("b", last=True))
+        self.assertIsNone(terms.find("c", last=True))
+        self.assertIs(terms[2], fl.NamedList.search(terms, "a", last=True))
+        self.assertIs(terms[2], fl.NamedList.search(list(terms), "a", last=True))
+        self.assertIsNone(fl.NamedList.search(list(terms), "c", last=True))
+
+    def test_rules_use_the_last_term_of_each_name(self) -> None:
+        engine = fl.Engine(
+            input_variables=[fl.InputVariable("a", terms=[fl.Triangle("x"), fl.Triangle("x")])],
+            output_variables=[fl.OutputVariable("y", terms=[fl.Constant("z", 1.0),
+                                                            fl.Constant("z", 2.0)])])
+        rule = fl.Rule.create("if a is x then y is z", engine)
+        proposition: fl.Proposition = rule.antecedent.expression  # type: ignore
+        self.assertIs(engine.input_variables[0].terms[1], proposition.term)
+        self.assertIs(engine.output_variables[0].terms[1], rule.consequent.conclusions[0].term)
+        self.assertIs(engine.output_variables[0].terms[0], engine.output_variables[0].term("z"))
+
+    def test_index_is_rebuilt_after_modifications(self) -> None:
+        a, b, c = fl.Triangle("a"), fl.Triangle("b"), fl.Triangle("c")
+        modifications = {
+            "append": (lambda terms: terms.append(c), "c", c),
+            "extend": (lambda terms: terms.extend([c]), "c", c),
+            "insert": (lambda terms: terms.insert(0, c), "c", c),
+            "iadd": (lambda terms: terms.__iadd__([c]), "c", c),
+            "setitem": (lambda terms: terms.__setitem__(0, c), "a", None),
+            "setslice": (lambda terms: terms.__setitem__(slice(0, 2), [c]), "b", None),
+            "delitem": (lambda terms: terms.__delitem__(0), "a", None),
+            "remove": (lambda terms: terms.remove(b), "b", None),
+            "pop": (lambda terms: terms.pop(), "b", None),
+            "clear": (lambda terms: terms.clear(), "a", None),
+            "imul": (lambda terms: terms.__imul__(0), "a", None),
+            "rename": (lambda terms: setattr(a, "name", "c"), "c", a),
+        }
+        for name, (modify, key, expected) in modifications.items():
+            with self.subTest(modification=name):
+                a.name, b.name = "a", "b"
+                terms = fl.NamedList([a, b])
+                self.assertIs(a, terms.find("a"))
+                modify(terms)
+                self.assertIs(expected, terms.find(key))
+
+        terms = fl.NamedList([fl.Triangle("x", 1.0), fl.Triangle("x", 0.0)])
+        self.assertEqual(1.0, terms.find("x").vertex_a)  # type: ignore
+        terms.sort(key=lambda term: term.vertex_a)  # type: ignore
+        self.assertEqual(0.0, terms.find("x").vertex_a)  # type: ignore
+        terms.reverse()
+        self.assertEqual(1.0, terms.find("x").vertex_a)  # type: ignore
+
+    def test_renames_discard_only_the_indexes_of_their_lists(self) -> None:
+        a, b = fl.Triangle("a"), fl.Triangle("b")
+        terms, others, other_terms = fl.NamedList([a]), fl.NamedList([a, b]), fl.NamedList([b])
+        for named_list in (terms, others, other_terms):
+            named_list.find("")
+        index = other_terms._index
+
+        a.name = "c"
+        self.assertIsNone(terms._index)
+        self.assertIsNone(others._index)
+        self.assertIs(index, other_terms._index)
+        self.assertIs(a, terms.find("c"))
+        self.assertIs(a, others.find("c"))
+
+        # the lists are not kept alive by their components
+        del terms
+        a.name = "d"
+        self.assertEqual(1, sum(owner() is not None for owner in a._owners))  # type: ignore
+        self.assertIs(a, others.find("d"))
+
+        engine = fl.Engine(input_variables=[fl.InputVariable("x")],
+                           output_variables=[fl.OutputVariable("y")])
+        self.assertIsNotNone(engine.variable("x"))
+        self.assertIsNotNone(engine.output_variable("y"))
+        index = engine.input_variables._index  # type: ignore
+        engine.output_variables[0].name = "z"
+        self.assertIsNone(engine.output_variables._index)  # type: ignore
+        self.assertIs(index, engine.input_variables._index)  # type: ignore
+        self.assertIs(engine.output_variables[0], engine.variable("z"))
+
+    def test_copies_do_not_share_the_index(self) -> None:
+        variable = fl.InputVariable("x", terms=[fl.Triangle("a"), fl.Triangle("b")])
+        self.assertIsNotNone(variable.terms.find("a"))  # type: ignore
+        for clone in [copy.deepcopy(variable), pickle.loads(pickle.dumps(variable))]:
+            self.assertIsInstance(clone.terms, fl.NamedList)
+            self.assertIsNot(variable.term("a"), clone.term("a"))
+            self.assertIs(clone.terms[0], clone.term("a"))
+
+    def test_engine_lookups(self) -> None:
+        engine = fl.Engine(input_variables=[fl.InputVariable("a")],
+                           output_variables=[fl.OutputVariable("a"), fl.OutputVariable("b")],
+                           rule_blocks=[fl.RuleBlock("rules")])
+        self.assertIs(engine.input_variables[0], engine.variable("a"))
+        self.assertIs(engine.output_variables[1], engine.variable("b"))
+        self.assertIs(engine.output_variables[0], engine.output_variable("a"))
+        self.assertIs(engine.rule_blocks[0], engine.rule_block("rules"))
+
+        engine.output_variables[1].name = "c"
+        self.assertIs(engine.output_variables[1], engine.output_variable("c"))
+        with self.assertRaisesRegex(ValueError, "output variable 'b' not found"):
+            engine.output_variable("b")
+
+        # lists assigned to the engine are searched from the start
+        engine.input_variables = [fl.InputVariable("d")]
+        self.assertIs(engine.input_variables[0], engine.input_variable("d"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@
 """
 
 import unittest
+import warnings
 from typing import Dict, Tuple
 
 import fuzzylite as fl
@@ -40,6 +41,19 @@ class NormAssert(BaseAssert[fl.Norm]):
             if commutative:
                 self.test.assertEqual(z, self.actual.compute(*reversed(ab)),
                                       f"when ({tuple(reversed(ab))})")
+        return self.evaluates_array(abz, commutative)
+
+    def evaluates_array(self,
+                        abz: Dict[Tuple[float, float], float],
+                        commutative: bool = True) -> 'NormAssert':
+        import numpy as np
+        a, b = np.array(list(abz.keys()), dtype=float).T
+        z = np.array(list(abz.values()), dtype=float)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # the edge cases are computed without warnings
+            np.testing.assert_array_equal(z, self.actual.compute_array(a, b))
+            if commutative:
+                np.testing.assert_array_equal(z, self.actual.compute_array(b, a))
         return self
 
 
@@ -427,7 +441,16 @@ class NormFunctions(unittest.TestCase):
                 (1.00, 1.00): 1.00,
             })
 
-        pass
+        # the functions are evaluated on the arrays, falling back to scalars only if needed
+        import numpy as np
+        from unittest.mock import patch
+        norm = fl.NormFunction(fl.Function.create("AlgebraicSum", "a + b - (a * b)"))
+        with patch.object(fl.NormFunction, "compute", side_effect=AssertionError):
+            np.testing.assert_array_equal([0.75, 1.0], norm.compute_array(
+                np.array([0.5, 1.0]), np.array(0.5)))
+        norm = fl.NormFunction(fl.Function.create("Maximum", "max(a, b)"))
+        np.testing.assert_array_equal([0.5, 1.0], norm.compute_array(
+            np.array([0.5, 1.0]), np.array(0.5)))
 
     def test_norm_lambda(self) -> None:
         NormAssert(self, fl.NormLambda(lambda a, b: a + b - (a * b))) \
@@ -0,0 +1,111 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import itertools
+import unittest
+from typing import List, Tuple
+
+import fuzzylite as fl
+from fuzzylite.examples.mamdani.SimpleDimmer import engine as simple_dimmer
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.engine = fl.FllImporter().from_string(str(simple_dimmer))
+        # the clock advances one second every time it is read
+        self.profiler = fl.Profiler(clock=itertools.count().__next__)  # type: ignore
+        self.engine.profiler = self.profiler
+
+    def test_process(self) -> None:
+        block = self.engine.rule_blocks[0]
+        power = self.engine.output_variable("Power")
+        for ambient in [0.3, 0.5]:
+            self.engine.input_variable("Ambient").value = ambient
+            self.engine.process()
+
+        profiler = self.profiler
+        self.assertEqual(2, profiler.processes)
+        self.assertEqual(12.0, profiler.seconds)
+        self.assertEqual(2.0, profiler.fuzzification)
+        self.assertDictEqual({block: 2.0}, profiler.rule_blocks)
+        self.assertDictEqual({block: 3}, profiler.fired)
+        self.assertDictEqual({"General": 2.0}, profiler.activations)
+        self.assertDictEqual({power: 2.0}, profiler.output_variables)
+        self.assertDictEqual({"Centroid": 2.0}, profiler.defuzzifiers)
+        self.assertEqual("""\
+2 processes in 12.000000 seconds (6000000.0 us per process)
+fuzzification                                                2.000000 s  1000000.0 us
+rule block '' (3 rules fired)                                2.000000 s  1000000.0 us
+activation General                                           2.000000 s  1000000.0 us
+output variable 'Power'                                      2.000000 s  1000000.0 us
+defuzzifier Centroid                                         2.000000 s  1000000.0 us""",
+                         str(profiler))
+
+        profiler.reset()
+        self.assertEqual(0, profiler.processes)
+        self.assertDictEqual({}, profiler.rule_blocks)
+        self.assertEqual("0 processes in 0.000000 seconds (0.0 us per process)\n"
+                         f"{'fuzzification':<56}     0.000000 s        0.0 us", str(profiler))
+
+    def test_process_incremental(self) -> None:
+        block = self.engine.rule_blocks[0]
+        for ambient in [0.3, 0.3, 0.6]:
+            self.engine.input_variable("Ambient").value = ambient
+            self.engine.process(incremental=True)
+        self.assertEqual(3, self.profiler.processes)
+        self.assertDictEqual({block: 3.0}, self.profiler.rule_blocks)
+        self.assertDictEqual({block: 6}, self.profiler.fired)
+
+        block.activation = fl.First(2)
+        self.engine.process(incremental=True)
+        self.assertDictEqual({"General": 3.0, "First": 1.0}, self.profiler.activations)
+        self.assertDictEqual({block: 8}, self.profiler.fired)
+
+    def test_hooks(self) -> None:
+        class Hooks(fl.Profiler):
+            def __init__(self) -> None:
+                super().__init__()
+                self.calls: List[Tuple[str, str]] = []
+
+            def fuzzified(self, engine: fl.Engine, seconds: float) -> None:
+                self.calls.append(("fuzzified", engine.name))
+
+            def activated(self, block: fl.RuleBlock, seconds: float, fired: int) -> None:
+                self.calls.append(("activated", f"{fired} rules fired"))
+
+            def defuzzified(self, variable: fl.OutputVariable, seconds: float) -> None:
+                self.calls.append(("defuzzified", variable.name))
+
+            def processed(self, engine: fl.Engine, seconds: float) -> None:
+                self.calls.append(("processed", engine.name))
+
+        hooks = Hooks()
+        self.engine.profiler = hooks
+        self.engine.input_variable("Ambient").value = 0.25
+        self.engine.process()
+        self.assertListEqual([("fuzzified", "SimpleDimmer"), ("activated", "1 rules fired"),
+                              ("defuzzified", "Power"), ("processed", "SimpleDimmer")],
+                             hooks.calls)
+
+        self.engine.profiler = None
+        self.engine.process()
+        self.assertEqual(4, len(hooks.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,9 +15,13 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import pickle
+import typing
 import unittest
+from copy import deepcopy
+from math import nan
 from typing import Dict, List, Optional, Type, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import fuzzylite as fl
 from tests.assert_component import BaseAssert
@@ -143,6 +147,11 @@ class AssertAntecedent:
                 expected = values[index]
                 self.test.assertAlmostEqual(expected, obtained, places=decimal_places,
                                             msg=f"at index {index}")
+                walked = antecedent.activation_degree(
+                    conjunction=conjunction, disjunction=disjunction,
+                    node=antecedent.expression)
+                self.test.assertEqual(fl.Op.str(walked), fl.Op.str(obtained),
+                                      msg=f"compiled vs walked at index {index}")
             index += 1
 
         return self
@@ -371,6 +380,93 @@ class TestAntecedent(unittest.TestCase):
             disjunction=fl.Maximum()
         )
 
+    def test_compiled_activation_degree(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        antecedent = fl.Antecedent("Ambient is very DARK or Ambient is not MEDIUM")
+        self.assertIsNone(antecedent._program)
+        antecedent.load(engine)
+        self.assertIsNotNone(antecedent._program)
+
+        engine.input_variable("Ambient").value = 0.4
+        self.assertAlmostEqual(0.4, antecedent.activation_degree(disjunction=fl.Maximum()))
+        with self.assertRaisesRegex(ValueError, "expected a disjunction operator, "
+                                                "but found none for antecedent: "):
+            antecedent.activation_degree(conjunction=fl.Minimum())
+
+        # replacing the expression falls back to walking the expression tree
+        other = fl.Antecedent("Ambient is DARK and Ambient is MEDIUM")
+        other.load(engine)
+        antecedent.expression = other.expression
+        self.assertAlmostEqual(0.4, antecedent.activation_degree(conjunction=fl.Minimum()))
+        with self.assertRaisesRegex(ValueError, "expected a conjunction operator, "
+                                                "but found none for antecedent: "):
+            antecedent.activation_degree(disjunction=fl.Maximum())
+
+        antecedent.unload()
+        self.assertIsNone(antecedent._program)
+        with self.assertRaisesRegex(RuntimeError, "antecedent '.*' is not loaded"):
+            antecedent.activation_degree()
+
+    def test_compiled_activation_degree_after_changes(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        ambient = engine.input_variable("Ambient")
+        ambient.value = 0.4
+        antecedent = fl.Antecedent("Ambient is DARK or Ambient is BRIGHT")
+        antecedent.load(engine)
+        disjunction = fl.Maximum()
+        self.assertAlmostEqual(0.4, antecedent.activation_degree(disjunction=disjunction))
+
+        def compiled() -> bool:
+            # whether the activation degree is computed by the compiled function
+            program = antecedent._program
+            return bool(program and program[0] is antecedent.expression and program[2])
+
+        # changes to the propositions and operators in place discard the compiled function,
+        # which is compiled again when the activation degree is computed next
+        operator = typing.cast(fl.Operator, antecedent.expression)
+        proposition = typing.cast(fl.Proposition, operator.left)
+        proposition.term = ambient.term("MEDIUM")
+        self.assertIsNone(antecedent._program)
+        self.assertAlmostEqual(0.6, antecedent.activation_degree(disjunction=disjunction))
+        self.assertTrue(compiled())
+        with patch.object(fl.Antecedent, "compile", side_effect=AssertionError("compiled")):
+            self.assertAlmostEqual(0.6, antecedent.activation_degree(disjunction=disjunction))
+
+        proposition.hedges.append(fl.Very())
+        self.assertIsNone(antecedent._program)
+        self.assertAlmostEqual(0.36, antecedent.activation_degree(disjunction=disjunction))
+        self.assertTrue(compiled())
+
+        proposition.hedges = [fl.Not()]
+        self.assertIsNone(antecedent._program)
+        self.assertAlmostEqual(0.4, antecedent.activation_degree(disjunction=disjunction))
+        self.assertTrue(compiled())
+        proposition.hedges.clear()
+
+        operator.name = fl.Rule.AND
+        self.assertIsNone(antecedent._program)
+        self.assertAlmostEqual(0.0, antecedent.activation_degree(conjunction=fl.Minimum()))
+        self.assertTrue(compiled())
+
+        # the expressions that cannot be compiled are not compiled again until they change
+        operator.name = "xor"
+        with self.assertRaisesRegex(ValueError, "operator 'xor' not recognized"):
+            antecedent.activation_degree(conjunction=fl.Minimum())
+        self.assertFalse(compiled())
+        with patch.object(fl.Antecedent, "compile", side_effect=AssertionError("compiled")):
+            with self.assertRaisesRegex(ValueError, "operator 'xor' not recognized"):
+                antecedent.activation_degree(conjunction=fl.Minimum())
+        operator.name = fl.Rule.AND
+        self.assertAlmostEqual(0.0, antecedent.activation_degree(conjunction=fl.Minimum()))
+        self.assertTrue(compiled())
+
+        # copies keep their compiled function, which is discarded by their own changes
+        for copy in (pickle.loads(pickle.dumps(antecedent)), deepcopy(antecedent)):
+            self.assertIsNotNone(copy._program)
+            typing.cast(fl.Operator, copy.expression).left.hedges.append(fl.Not())
+            self.assertIsNone(copy._program)
+            self.assertIsNotNone(antecedent._program)
+
     def test_activation_degrees_output(self) -> None:
         engine = fl.FllImporter().from_string(SimpleDimmer)
 
@@ -572,6 +668,37 @@ class TestConsequent(unittest.TestCase):
         AssertConsequent(self, engine).modify_consequent(
             "Power is LOW and Power is very HIGH", 0.5, {power: []})
 
+    def test_modify_consequent_reuses_activated_terms(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        power = engine.output_variable("Power")
+        consequent = fl.Consequent("Power is LOW and Power is HIGH")
+        consequent.load(engine)
+
+        consequent.modify(0.5, fl.Minimum())
+        low, high = power.fuzzy.terms
+        power.fuzzy.clear()
+        implication = fl.AlgebraicProduct()
+        consequent.modify(0.25, implication)
+        self.assertIs(low, power.fuzzy.terms[0])
+        self.assertIs(high, power.fuzzy.terms[1])
+        self.assertEqual(0.25, low.degree)
+        self.assertIs(implication, high.implication)
+
+        # terms not cleared from the output are not reused
+        consequent.modify(0.75, implication)
+        self.assertEqual([0.25, 0.25, 0.75, 0.75], [term.degree for term in power.fuzzy.terms])
+        self.assertEqual(4, len({id(term) for term in power.fuzzy.terms}))
+
+        # terms are not reused within contexts
+        with fl.Context():
+            consequent.modify(0.5, implication)
+            terms = list(power.fuzzy.terms)
+            self.assertEqual(2, len(terms))
+            self.assertFalse({id(term) for term in terms} & {id(low), id(high)})
+            power.fuzzy.clear()
+            consequent.modify(0.5, implication)
+            self.assertFalse({id(term) for term in power.fuzzy.terms} & {id(t) for t in terms})
+
     def test_cannot_modify_consequent(self) -> None:
         with self.assertRaisesRegex(RuntimeError, "consequent is not loaded"):
             fl.Consequent("").modify(fl.nan, None)
@@ -872,6 +999,319 @@ class TestRuleBlock(unittest.TestCase):
         rule.unload.assert_called()  # type: ignore
         rule.load.assert_called_once_with(engine)  # type: ignore
 
+    def test_dependencies(self) -> None:
+        engine = fl.Engine(
+            input_variables=[fl.InputVariable("A", terms=[fl.Triangle("a")]),
+                             fl.InputVariable("B", terms=[fl.Triangle("b")])],
+            output_variables=[fl.OutputVariable("Y", terms=[fl.Triangle("y")]),
+                              fl.OutputVariable("Z", terms=[fl.Triangle("z")])])
+        input_a, input_b = engine.input_variables
+        output_y, output_z = engine.output_variables
+        rules = [fl.Rule.create("if A is a then Y is y"),
+                 fl.Rule.create("if A is a and (B is b or A is very a) then Y is y"),
+                 fl.Rule.create("if Y is y then Z is z")]
+        rb = fl.RuleBlock(rules=rules)
+        self.assertDictEqual({}, rb.dependencies())
+
+        rb.load_rules(engine)
+        self.assertListEqual([input_a, input_b], rules[1].antecedent.variables())
+        dependencies = rb.dependencies()
+        self.assertDictEqual({input_a: rules[:2], input_b: [rules[1]],
+                              output_y: [rules[2]]}, dependencies)
+        self.assertIs(dependencies, rb.dependencies())
+
+        rules[0].text = "if B is b then Z is z"
+        rules[0].load(engine)
+        self.assertDictEqual({input_a: [rules[1]], input_b: rules[:2],
+                              output_y: [rules[2]]}, rb.dependencies())
+
+        rb.unload_rules()
+        self.assertDictEqual({}, rb.dependencies())
+
+    def test_firing_rules(self) -> None:
+        engine = fl.Engine(
+            input_variables=[
+                fl.InputVariable("A", terms=[fl.Triangle("low", 0.0, 0.0, 0.5),
+                                             fl.Triangle("high", 0.5, 1.0, 1.0)]),
+                fl.InputVariable("B", terms=[fl.Triangle("low", 0.0, 0.0, 0.5),
+                                             fl.Triangle("high", 0.5, 1.0, 1.0)])],
+            output_variables=[fl.OutputVariable("Y", terms=[fl.Triangle("y")])])
+        input_a, input_b = engine.input_variables
+        rules = [fl.Rule.create(f"if {antecedent} then Y is y") for antecedent in [
+            "A is low and B is low",
+            "A is low and B is high",
+            "A is high and B is low",
+            "A is high and B is high",
+            "A is very high and B is somewhat low",
+            "A is not high and B is high",
+            "A is high or B is high",
+            "A is any and B is low",
+            "Y is y and A is high"]]
+        rb = fl.RuleBlock(conjunction=fl.Minimum(), rules=rules)
+        rb.load_rules(engine)
+
+        # the activation degrees of output variables are not known to be in [0,1], hence the
+        # last rule always fires
+        input_a.value, input_b.value = 0.25, 0.75
+        self.assertListEqual([rules[1], rules[5], rules[6], rules[8]], rb.firing_rules())
+        input_a.value, input_b.value = 0.75, 0.25
+        self.assertListEqual([rules[2], rules[4], rules[6], rules[7], rules[8]],
+                             rb.firing_rules())
+        input_a.value = 0.5
+        self.assertListEqual([rules[6], rules[7], rules[8]], rb.firing_rules())
+
+        # disabled variables do not fire, and nan memberships fire every rule
+        input_a.value = 0.75
+        input_b.enabled = False
+        self.assertListEqual([rules[6], rules[8]], rb.firing_rules())
+        input_b.enabled = True
+        input_b.value = nan
+        self.assertListEqual(rules, rb.firing_rules())
+
+        # conjunctions that are not zero when an operand is zero do not index the propositions
+        input_b.value = 0.25
+        rb.conjunction = fl.NormLambda(lambda a, b: max(a, b))
+        self.assertListEqual(rules, rb.firing_rules())
+        rb.conjunction = fl.AlgebraicProduct()
+        self.assertListEqual([rules[2], rules[4], rules[6], rules[7], rules[8]],
+                             rb.firing_rules())
+
+        # changes to the rules are indexed
+        rules[0].text = "if B is low then Y is y"
+        rules[0].load(engine)
+        rb.rules.pop()
+        self.assertListEqual([rules[0], rules[2], rules[4], rules[6], rules[7]],
+                             rb.firing_rules())
+
+    def test_general_activation_with_nan_inputs(self) -> None:
+        # the rules that do not fire have the activation degrees of activating every rule
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        engine.input_variables.append(fl.InputVariable("Other", terms=[fl.Triangle("LOW")]))
+        rb = fl.RuleBlock(conjunction=fl.Minimum(), implication=fl.Minimum(),
+                          activation=fl.General(), rules=[
+                              fl.Rule.create("if Other is LOW and Ambient is DARK "
+                                             "then Power is HIGH", engine),
+                              fl.Rule.create("if Ambient is BRIGHT then Power is LOW", engine)])
+        engine.rule_blocks.append(rb)
+        engine.input_variable("Ambient").value = 0.9
+        engine.input_variable("Other").value = 0.5
+        engine.process()
+        self.assertListEqual(rb.rules[1:], rb.firing_rules())
+        engine.input_variable("Other").value = nan
+        engine.process()
+        self.assertListEqual(rb.rules, rb.firing_rules())
+        self.assertListEqual(["nan", "0.400"],
+                             [fl.Op.str(rule.activation_degree) for rule in rb.rules])
+
+        import pathlib
+        root = pathlib.Path(next(iter(fl.examples.__path__)))  # type: ignore
+        for path in sorted(root.glob("**/*.fll")):
+            engine = fl.FllImporter().from_file(path)
+            if not (engine.input_variables
+                    and all(isinstance(block.activation, fl.General)
+                            for block in engine.rule_blocks)):
+                continue
+            with self.subTest(path=path.relative_to(root)):
+                for index, variable in enumerate(engine.input_variables):
+                    variable.value = nan if index == 0 else variable.minimum
+                engine.process()
+                obtained = [fl.Op.str(rule.activation_degree)
+                            for block in engine.rule_blocks for rule in block.rules]
+                expected = [fl.Op.str(rule.activate_with(block.conjunction, block.disjunction))
+                            for block in engine.rule_blocks for rule in block.rules]
+                self.assertListEqual(expected, obtained)
+
+    def test_indexes_follow_the_changes_to_the_rules(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        rules = [fl.Rule.create(rule, engine) for rule in [
+            "if Ambient is DARK then Power is HIGH",
+            "if Ambient is MEDIUM then Power is MEDIUM"]]
+        rb = fl.RuleBlock(conjunction=fl.Minimum(), rules=rules)
+        index = rb._index_conjunctions()
+        self.assertIs(index, rb._index_conjunctions())
+
+        rb.rules.append(fl.Rule.create("if Ambient is BRIGHT then Power is LOW", engine))
+        self.assertIsNot(index, rb._index_conjunctions())
+        engine.input_variable("Ambient").value = 0.9
+        self.assertListEqual(rb.rules[2:], rb.firing_rules())
+
+        # antecedents without operators are indexed regardless of the conjunction
+        rb.conjunction = None
+        self.assertIsNot(index, rb._index_conjunctions())
+        self.assertListEqual(rb.rules[2:], rb.firing_rules())
+
+        # other lists of rules are copied into lists that discard the indexes when modified
+        index = rb._index_conjunctions()
+        rules = rb.rules[1:]
+        rb.rules = rules
+        self.assertIsNot(rules, rb.rules)
+        self.assertIsNot(index, rb._index_conjunctions())
+        self.assertListEqual(rb.rules[1:], rb.firing_rules())
+        rb.rules.pop()
+        self.assertListEqual([], rb.firing_rules())
+
+        # changes to the antecedents discard the indexes of the rule blocks that contain them
+        rule = rb.rules[0]
+        index = rb._index_conjunctions()
+        rule.antecedent.text = "Ambient is BRIGHT"
+        rule.antecedent.load(engine)
+        self.assertIsNot(index, rb._index_conjunctions())
+        self.assertListEqual([rule], rb.firing_rules())
+
+        index = rb._index_conjunctions()
+        rule.antecedent = fl.Antecedent("Ambient is DARK")
+        self.assertIsNot(index, rb._index_conjunctions())
+        rule.antecedent.load(engine)
+        self.assertListEqual([], rb.firing_rules())
+
+    def test_general_deactivates_fired_rules(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        rules = [fl.Rule.create(rule, engine) for rule in [
+            "if Ambient is DARK then Power is HIGH",
+            "if Ambient is MEDIUM then Power is MEDIUM",
+            "if Ambient is BRIGHT then Power is LOW"]]
+        rb = fl.RuleBlock(conjunction=fl.Minimum(), implication=fl.Minimum(),
+                          activation=fl.General(), rules=rules)
+        engine.rule_blocks.append(rb)
+        ambient = engine.input_variable("Ambient")
+
+        def process(value: float) -> List[float]:
+            ambient.value = value
+            with patch.object(fl.Rule, "deactivate", autospec=True,
+                              side_effect=fl.Rule.deactivate) as deactivate:
+                engine.process()
+            self.assertListEqual([call[0][0] for call in deactivate.call_args_list],
+                                 deactivated)
+            return [rule.activation_degree for rule in rules]
+
+        # the rules are deactivated once, and then only the rules that fired before
+        deactivated = rules
+        self.assertListEqual([0.0, 0.5, 0.5], process(0.625))
+        deactivated = rules[1:]
+        self.assertListEqual([0.5, 0.5, 0.0], process(0.375))
+        deactivated = rules[:2]
+        self.assertListEqual([0.0, 0.0, 1.0], process(0.75))
+        self.assertListEqual([False, False, True], [rule.triggered for rule in rules])
+
+        # other activations deactivate every rule
+        rb.activation = fl.First()
+        deactivated = rules
+        self.assertListEqual([0.0, 1.0, 0.0], process(0.5))
+        rb.activation = fl.General()
+        self.assertListEqual([1.0, 0.0, 0.0], process(0.25))
+
+        # the rules fired within contexts are deactivated within the contexts
+        with fl.Context():
+            deactivated = rules
+            self.assertListEqual([0.0, 0.0, 1.0], process(0.75))
+            deactivated = rules[2:]
+            self.assertListEqual([0.0, 1.0, 0.0], process(0.5))
+        deactivated = rules[:1]
+        self.assertListEqual([0.0, 0.0, 1.0], process(0.75))
+
+    def test_changes_to_propositions(self) -> None:
+        def create_engine(rules: List[str]) -> fl.Engine:
+            engine = fl.FllImporter().from_string(SimpleDimmer)
+            engine.rule_blocks.append(fl.RuleBlock(
+                "rules", conjunction=fl.Minimum(), implication=fl.Minimum(),
+                activation=fl.General(),
+                rules=[fl.Rule.create(rule, engine) for rule in rules]))
+            engine.input_variable("Ambient").value = 0.6
+            return engine
+
+        engine = create_engine(["if Ambient is DARK then Power is HIGH",
+                                "if Ambient is MEDIUM then Power is MEDIUM",
+                                "if Ambient is BRIGHT then Power is LOW"])
+        ambient, power = engine.input_variable("Ambient"), engine.output_variable("Power")
+        rule_block = engine.rule_block("rules")
+        rules = rule_block.rules
+        engine.process()
+        self.assertListEqual(rules[1:], rule_block.firing_rules())
+        self.assertDictEqual({ambient: rules}, rule_block.dependencies())
+
+        # changing the term of a proposition after processing updates the compiled function
+        # of the antecedent and the indexes of the rule block
+        proposition = typing.cast(fl.Proposition, rules[0].antecedent.expression)
+        proposition.term = ambient.term("BRIGHT")
+        engine.process()
+        self.assertListEqual(rules, rule_block.firing_rules())
+        expected = create_engine(["if Ambient is BRIGHT then Power is HIGH",
+                                  "if Ambient is MEDIUM then Power is MEDIUM",
+                                  "if Ambient is BRIGHT then Power is LOW"])
+        expected.process()
+        self.assertEqual(expected.output_variable("Power").value, power.value)
+        self.assertAlmostEqual(0.4, rules[0].activation_degree)
+
+        other = fl.InputVariable("Other", terms=[fl.Triangle("BRIGHT")])
+        proposition.variable = other
+        self.assertDictEqual({other: rules[:1], ambient: rules[1:]}, rule_block.dependencies())
+
+    def test_firing_rules_with_unbounded_terms(self) -> None:
+        # the bounded difference of memberships 0 and 2 is 1, so the rule fires
+        engine = fl.FllImporter().from_string("""\
+Engine: unbounded
+InputVariable: A
+  range: 0.000 1.000
+  term: near Triangle 0.000 0.000 0.500 2.000
+  term: far Triangle 0.500 1.000 1.000 2.000
+InputVariable: B
+  range: 0.000 1.000
+  term: x Rectangle 0.000 1.000 2.000
+OutputVariable: Y
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: WeightedAverage TakagiSugeno
+  default: nan
+  term: y Constant 0.500
+RuleBlock: rules
+  conjunction: BoundedDifference
+  implication: AlgebraicProduct
+  activation: General
+  rule: if A is far and B is x then Y is y
+""")
+        rb = engine.rule_block("rules")
+        rule = rb.rules[0]
+        engine.input_variable("A").value = 0.0
+        engine.input_variable("B").value = 0.5
+        self.assertListEqual([rule], rb.firing_rules())
+        engine.process()
+        self.assertEqual(1.0, rule.activation_degree)
+        self.assertEqual(0.5, engine.output_variable("Y").value)
+
+        # the memberships are checked on every call, so changes to the terms need no reloading
+        # (the memberships computed by the previous process are discarded when the value is set)
+        engine.input_variable("A").term("far").height = 1.0
+        engine.input_variable("B").term("x").height = 1.0
+        engine.input_variable("B").value = 0.5
+        self.assertListEqual([], rb.firing_rules())
+        engine.input_variable("A").term("far").height = 1.5
+        engine.input_variable("B").term("x").height = 2.0
+        engine.input_variable("B").value = 0.5
+        self.assertListEqual([rule], rb.firing_rules())
+        engine.process()
+        self.assertEqual(1.0, rule.activation_degree)
+        engine.input_variable("B").term("x").height = 1.0
+
+        # replacing a term in place of another
+        engine.input_variable("B").terms[0] = fl.Rectangle("x", 0.0, 1.0, 2.0)
+        rule.antecedent.expression.right.term = engine.input_variable("B").terms[0]  # type: ignore
+        engine.input_variable("B").value = 0.5
+        self.assertListEqual([rule], rb.firing_rules())
+
+        # unbounded disjunctions are not indexed either, and neither are unbounded constants
+        engine.input_variable("B").term("x").height = 1.0
+        engine.input_variable("B").value = 0.5
+        rb.disjunction = fl.UnboundedSum()
+        rule.text = "if A is far and (B is x or B is x) then Y is y"
+        rule.load(engine)
+        self.assertListEqual([rule], rb.firing_rules())
+        rb.disjunction = fl.Maximum()
+        self.assertListEqual([], rb.firing_rules())
+        engine.input_variable("B").terms.append(fl.Constant("c", 1.5))
+        rule.text = "if A is far and B is c then Y is y"
+        rule.load(engine)
+        self.assertListEqual([rule], rb.firing_rules())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,7 @@ import operator
 import platform
 import re
 import unittest
+from pathlib import Path
 from typing import Callable, Dict, NoReturn, Optional, Sequence, Type
 
 import fuzzylite as fl
@@ -65,6 +66,19 @@ class TermAssert(BaseAssert[fl.Term]):
             self.test.assertEqual(mf, self.actual.membership(x), message)
         else:  # use approximate values in other platforms
             self.test.assertAlmostEqual(mf, self.actual.membership(x), places=15, msg=message)
+        return self.has_membership_array(x, mf)
+
+    def has_membership_array(self, x: float, mf: float) -> 'TermAssert':
+        import numpy as np
+        message = "\n".join([f"{str(self.actual)}",
+                             f"expected: \u03BC(x={x:.3f})={mf} in array, but"])
+        obtained = self.actual.membership_array(np.array([x, x]))
+        self.test.assertEqual((2,), obtained.shape, message)
+        if math.isnan(mf):
+            self.test.assertEqual([str(fl.nan)] * 2, [str(y) for y in obtained], message)
+        else:
+            self.test.assertAlmostEqual(mf, obtained[0], places=15, msg=message)
+            self.test.assertAlmostEqual(mf, obtained[1], places=15, msg=message)
         return self
 
     def has_memberships(self, x_mf: Dict[float, float], height: float = 1.0) -> 'TermAssert':
@@ -93,6 +107,19 @@ class TermAssert(BaseAssert[fl.Term]):
         else:
             self.test.assertEqual(mf, self.actual.tsukamoto(x, minimum, maximum),
                                   f"{str(self.actual)}\nwhen x={x:.3f}")
+        return self.has_tsukamoto_array(x, mf, minimum, maximum)
+
+    def has_tsukamoto_array(self, x: float, mf: float, minimum: float = -1.0,
+                            maximum: float = 1.0) -> 'TermAssert':
+        import numpy as np
+        message = f"{str(self.actual)}\nwhen x={x:.3f} in array"
+        obtained = self.actual.tsukamoto_array(np.array([x, x]), minimum, maximum)
+        self.test.assertEqual((2,), obtained.shape, message)
+        if math.isnan(mf):
+            self.test.assertEqual([str(fl.nan)] * 2, [str(z) for z in obtained], message)
+        else:
+            self.test.assertAlmostEqual(mf, obtained[0], places=15, msg=message)
+            self.test.assertAlmostEqual(mf, obtained[1], places=15, msg=message)
         return self
 
     def has_tsukamotos(self, x_mf: Dict[float, float], minimum: float = -1.0,
@@ -140,6 +167,30 @@ class TestTerm(unittest.TestCase):
                           0.8: 0.19999999999999996,
                           1.0: 0.0})
 
+    def test_discretize_without_numpy(self) -> None:
+        from unittest.mock import patch
+
+        import numpy as np
+        term = fl.Gaussian("gaussian", 0.0, 0.5, height=2.0)
+        for bounded_mf in [True, False]:
+            with self.subTest(bounded_mf=bounded_mf):
+                expected = term.discretize(-1.0, 1.0, 10, bounded_mf)
+                with patch.dict("sys.modules", {"numpy": None}):
+                    with self.assertRaises(ImportError):
+                        import numpy  # noqa: F401
+                    obtained = term.discretize(-1.0, 1.0, 10, bounded_mf)
+                np.testing.assert_allclose(expected.values(), obtained.values(), rtol=1e-15)
+                self.assertEqual(bounded_mf, max(obtained.y()) <= 1.0)
+
+    def test_slots(self) -> None:
+        import inspect
+        terms = [cls for _, cls in inspect.getmembers(fl.term, inspect.isclass)
+                 if issubclass(cls, fl.Term) and cls.__module__ == fl.term.__name__]
+        self.assertEqual(24, len(terms))
+        for term in terms:
+            with self.subTest(term=term.__name__):
+                self.assertFalse(hasattr(term.__new__(term), "__dict__"))
+
     def test_activated(self) -> None:
         TermAssert(self,
                    fl.Activated(
@@ -234,6 +285,32 @@ class TestTerm(unittest.TestCase):
 
         self.assertEqual(aggregated.range(), 2.0)
 
+    def test_aggregated_activation_degrees_are_indexed(self) -> None:
+        low, high = fl.Triangle("LOW"), fl.Triangle("HIGH")
+        aggregated = fl.Aggregated("fuzzy_output", aggregation=fl.Maximum(),
+                                   terms=[fl.Activated(low, 0.2), fl.Activated(low, 0.7),
+                                          fl.Activated(high, 0.5)])
+        self.assertEqual(0.7, aggregated.activation_degree(low))
+        self.assertEqual(0.5, aggregated.activation_degree(high))
+        self.assertEqual(0.0, aggregated.activation_degree(fl.Triangle("LOW")))
+
+        # the index is rebuilt after the terms are modified
+        aggregated.terms.pop(1)
+        self.assertEqual(0.2, aggregated.activation_degree(low))
+        aggregated.terms[0] = fl.Activated(high, 0.9)
+        self.assertEqual(0.0, aggregated.activation_degree(low))
+        self.assertEqual(0.9, aggregated.activation_degree(high))
+        aggregated.aggregation = None
+        self.assertEqual(0.9 + 0.5, aggregated.activation_degree(high))
+        aggregated.clear()
+        self.assertEqual(0.0, aggregated.activation_degree(high))
+
+        # lists assigned to the terms are searched from the start
+        aggregated.terms = [fl.Activated(low, 0.3), fl.Activated(low, 0.4)]
+        self.assertEqual(0.3 + 0.4, aggregated.activation_degree(low))
+        aggregated.terms.append(fl.Activated(low, 0.1))
+        self.assertAlmostEqual(0.3 + 0.4 + 0.1, aggregated.activation_degree(low))
+
     def test_bell(self) -> None:
         TermAssert(self, fl.Bell("bell")) \
             .exports_fll("term: bell Bell nan nan nan") \
@@ -404,6 +481,11 @@ class TestTerm(unittest.TestCase):
                               math.inf: 0.0,
                               -math.inf: 0.0}, height=0.5)
 
+        # arrays of memberships result in nan when dividing by a width of zero
+        TermAssert(self, fl.Cosine("cosine", 0.0, 0.0)) \
+            .has_membership_array(0.0, math.nan) \
+            .has_membership_array(0.5, 0.0)
+
     def test_discrete(self) -> None:
         TermAssert(self, fl.Discrete("discrete")) \
             .exports_fll("term: discrete Discrete") \
@@ -482,6 +564,109 @@ class TestTerm(unittest.TestCase):
             term.xy = []
             term.membership(0.0)
 
+    def test_discrete_arrays(self) -> None:
+        import numpy as np
+        x = np.linspace(-1.0, 1.0, 101)
+        y = np.abs(x)
+        term = fl.Discrete("discrete")
+        term.set_arrays(x, y)
+        self.assertIs(x, term.x())
+        self.assertIs(y, term.y())
+        self.assertEqual(101, len(term.xy))
+
+        # the pairs are created from the arrays on first use, which are kept until modified
+        xy = term.xy
+        self.assertIs(xy, term.xy)
+        self.assertEqual(fl.Discrete.Pair(-1.0, 1.0), xy[0])
+        self.assertEqual([(-1.0, 1.0), (1.0, 1.0)], xy[::100])
+        self.assertEqual(101, len(list(term)))
+        self.assertIs(x, term.x())
+        self.assertEqual(1.0, term.membership(-1.0))
+
+        # the arrays are updated on first use after the pairs are modified
+        xy[0].y = 0.5
+        self.assertEqual(0.5, term.membership(-1.0))
+        self.assertIsNot(x, term.x())
+        self.assertEqual(1.0, y[0])
+        xy[-1].values = (1.0, 0.5)
+        xy.append(fl.Discrete.Pair(2.0, 2.0))
+        self.assertEqual(1.25, term.membership(1.5))
+        np.testing.assert_allclose([-1.0, 0.0, 2.0], term.arrays()[0][[0, 50, -1]])
+        pair = fl.Discrete.Pair(-2.0, 0.0)
+        xy.insert(0, pair)
+        self.assertEqual(0.25, term.membership(-1.5))
+        pair.y = 1.0
+        self.assertEqual(0.75, term.membership(-1.5))
+        del xy[0]
+        xy[0] = fl.Discrete.Pair(-1.0, 0.0)
+        self.assertEqual(0.0, term.membership(-1.0))
+        self.assertEqual(102, len(term.values()) // 2)
+        xy.reverse()
+        self.assertFalse(term.is_monotonic())
+        term.sort()
+        self.assertEqual([-1.0, 0.0], term.values()[:2])
+
+        # the copies of the pairs are not those of the term
+        clone = copy.deepcopy(xy)
+        self.assertEqual(xy, clone)
+        clone[0].y = 1.0
+        self.assertEqual(0.0, term.membership(-1.0))
+        clone = copy.deepcopy(term)
+        self.assertEqual(term.values(), clone.values())
+        clone.xy[0].y = 1.0
+        self.assertEqual(0.0, term.membership(-1.0))
+        self.assertEqual(1.0, clone.membership(-1.0))
+
+        # setting the arrays replaces the pairs
+        term.set_arrays(x, y)
+        self.assertIsNot(xy, term.xy)
+        xy[0].y = 0.0
+        self.assertEqual(1.0, term.membership(-1.0))
+
+        term.xy = [fl.Discrete.Pair(0.0, 0.0), fl.Discrete.Pair(1.0, 1.0)]
+        self.assertEqual("d", term.x().typecode)  # type: ignore
+        self.assertEqual([0.0, 0.0, 1.0, 1.0], term.values())
+
+        term.set_arrays(x, y)
+        values = np.random.default_rng(0).uniform(-1.5, 1.5, 1000)
+        np.testing.assert_allclose(term.membership_array(values),
+                                   [term.membership(value) for value in values.tolist()])
+        for value in [-1.0, -0.5, 0.0, 0.02, 1.0, fl.nan]:
+            self.assertEqual(fl.Op.str(abs(value)), fl.Op.str(term.membership(value)))
+
+        with self.assertRaisesRegex(ValueError, "expected the same number of values of x and y, "
+                                                "but got 2 and 1"):
+            term.set_arrays([0.0, 1.0], [0.0])
+        with self.assertRaisesRegex(ValueError, re.escape("expected a one-dimensional array, "
+                                                          "but got shape (2, 2)")):
+            term.set_arrays(np.zeros((2, 2)), np.zeros((2, 2)))
+
+    def test_discrete_tsukamoto(self) -> None:
+        import numpy as np
+        degrees = [fl.nan, -1.0, 0.0, 0.1, 0.25, 0.5, 0.6, 1.0, 2.0]
+        for values, expected in [
+            # increasing, with a plateau
+            ("0 0 1 0.5 2 0.5 3 1", [fl.nan, 0.0, 0.0, 0.2, 0.5, 1.0, 2.2, 3.0, 3.0]),
+            # decreasing
+            ("0 1 2 0", [fl.nan, 2.0, 2.0, 1.8, 1.5, 1.0, 0.8, 0.0, 0.0]),
+            # not monotonic, where the first crossing from the left (or the closest) is found
+            ("0 0.2 1 1 2 0", [fl.nan, 2.0, 2.0, 1.9, 0.0625, 0.375, 0.5, 1.0, 1.0]),
+        ]:
+            with self.subTest(values=values):
+                term = fl.Discrete("discrete")
+                term.configure(values)
+                obtained = [term.tsukamoto(degree, 0.0, 3.0) for degree in degrees]
+                self.assertEqual([fl.Op.str(z) for z in expected],
+                                 [fl.Op.str(z) for z in obtained])
+                np.testing.assert_allclose(
+                    expected, term.tsukamoto_array(np.array(degrees), 0.0, 3.0))
+
+        term = fl.Discrete("discrete", [0, 0, 2, 1], height=0.5)
+        self.assertTrue(term.is_monotonic())
+        self.assertEqual(1.0, term.tsukamoto(0.25, 0.0, 2.0))
+        term.configure("0 0 1 1 2 0")
+        self.assertFalse(term.is_monotonic())
+
     def test_discrete_pairs(self) -> None:
         pairs = [fl.Discrete.Pair(*pair) for pair in [(1, 0), (3, 0), (5, 0), (2, 0), (4, 0)]]
         self.assertListEqual([(1, 0), (2, 0), (3, 0), (4, 0), (5, 0)],
@@ -829,6 +1014,16 @@ class TestTerm(unittest.TestCase):
                               math.nan: math.nan,
                               math.inf: 1.0,
                               -math.inf: 0.0}) \
+            .has_tsukamotos({0.0: -0.4,
+                             0.1: -0.22111456180001685,
+                             0.25: -0.11715728752538096,
+                             0.5: 0.0,
+                             0.75: 0.11715728752538096,
+                             0.9: 0.22111456180001687,
+                             1.0: 0.4,
+                             math.nan: math.nan,
+                             math.inf: 0.4,
+                             -math.inf: -0.4}) \
             .configured_as("-0.4 0.4 0.5") \
             .exports_fll("term: s_shape SShape -0.400 0.400 0.500") \
             .has_memberships({-0.5: 0.0,
@@ -842,7 +1037,17 @@ class TestTerm(unittest.TestCase):
                               0.5: 1.0,
                               math.nan: math.nan,
                               math.inf: 1.0,
-                              -math.inf: 0.0}, height=0.5)
+                              -math.inf: 0.0}, height=0.5) \
+            .has_tsukamotos({0.0: -0.4,
+                             0.1: -0.14701778718652964,
+                             0.25: 0.0,
+                             0.5: 0.4,
+                             0.75: 0.4,
+                             0.9: 0.4,
+                             1.0: 0.4,
+                             math.nan: math.nan,
+                             math.inf: 0.4,
+                             -math.inf: -0.4})
 
     def test_sigmoid(self) -> None:
         TermAssert(self, fl.Sigmoid("sigmoid")) \
@@ -863,6 +1068,16 @@ class TestTerm(unittest.TestCase):
                               math.nan: math.nan,
                               math.inf: 1.0,
                               -math.inf: 0.0}) \
+            .has_tsukamotos({0.0: -1.0,
+                             0.1: -0.21972245773362195,
+                             0.25: -0.10986122886681098,
+                             0.5: 0.0,
+                             0.75: 0.109861228866811,
+                             0.9: 0.21972245773362192,
+                             1.0: 1.0,
+                             math.nan: math.nan,
+                             math.inf: 1.0,
+                             -math.inf: -1.0}) \
             .configured_as("0 10 .5") \
             .exports_fll("term: sigmoid Sigmoid 0.000 10.000 0.500") \
             .has_memberships({-0.5: 0.0066928509242848554,
@@ -876,7 +1091,17 @@ class TestTerm(unittest.TestCase):
                               0.5: 0.9933071490757153,
                               math.nan: math.nan,
                               math.inf: 1.0,
-                              -math.inf: 0.0}, height=0.5)
+                              -math.inf: 0.0}, height=0.5) \
+            .has_tsukamotos({0.0: -1.0,
+                             0.1: -0.13862943611198905,
+                             0.25: 0.0,
+                             0.5: 1.0,
+                             0.75: 1.0,
+                             0.9: 1.0,
+                             1.0: 1.0,
+                             math.nan: math.nan,
+                             math.inf: 1.0,
+                             -math.inf: -1.0})
 
     def test_sigmoid_difference(self) -> None:
         TermAssert(self, fl.SigmoidDifference("sigmoid_difference")) \
@@ -981,6 +1206,11 @@ class TestTerm(unittest.TestCase):
                               math.inf: 0.0,
                               -math.inf: 0.0}, height=0.5)
 
+        # arrays of memberships result in nan when dividing by a width of zero
+        TermAssert(self, fl.Spike("spike", 0.0, 0.0)) \
+            .has_membership_array(0.0, math.nan) \
+            .has_membership_array(0.5, 0.0)
+
     def test_trapezoid(self) -> None:
         TermAssert(self, fl.Trapezoid("trapezoid", 0.0, 1.0)).exports_fll(
             "term: trapezoid Trapezoid 0.000 0.200 0.800 1.000")
@@ -1200,6 +1430,16 @@ class TestTerm(unittest.TestCase):
                               math.nan: math.nan,
                               math.inf: 0.0,
                               -math.inf: 1.0}) \
+            .has_tsukamotos({0.0: 0.4,
+                             0.1: 0.22111456180001685,
+                             0.25: 0.11715728752538096,
+                             0.5: 0.0,
+                             0.75: -0.11715728752538096,
+                             0.9: -0.22111456180001687,
+                             1.0: -0.4,
+                             math.nan: math.nan,
+                             math.inf: -0.4,
+                             -math.inf: 0.4}) \
             .configured_as("-0.4 0.4 0.5") \
             .exports_fll("term: z_shape ZShape -0.400 0.400 0.500") \
             .has_memberships({-0.5: 1.0,
@@ -1213,7 +1453,17 @@ class TestTerm(unittest.TestCase):
                               0.5: 0.0,
                               math.nan: math.nan,
                               math.inf: 0.0,
-                              -math.inf: 1.0}, height=0.5)
+                              -math.inf: 1.0}, height=0.5) \
+            .has_tsukamotos({0.0: 0.4,
+                             0.1: 0.14701778718652964,
+                             0.25: 0.0,
+                             0.5: -0.4,
+                             0.75: -0.4,
+                             0.9: -0.4,
+                             1.0: -0.4,
+                             math.nan: math.nan,
+                             math.inf: -0.4,
+                             -math.inf: 0.4})
 
     # @unittest.skip("division by zero not handled well by Python")
     def test_division_by_zero_fails_with_float(self) -> None:
@@ -1258,9 +1508,62 @@ class TestTerm(unittest.TestCase):
         fl.lib.floating_point_type = float
         self.assertEqual(fl.lib.floating_point_type, float)
 
-    @unittest.skip("Testing of Tsukamoto")
+    @staticmethod
+    def invert(term: fl.Term, activation_degree: float, minimum: float, maximum: float) -> float:
+        # finds the value of the monotonic term at the activation degree by bisection, which is
+        # independent of the closed forms in Term.tsukamoto
+        increasing = term.membership(maximum) > term.membership(minimum)
+        for _ in range(200):
+            middle = 0.5 * (minimum + maximum)
+            if (term.membership(middle) < activation_degree) == increasing:
+                minimum = middle
+            else:
+                maximum = middle
+        return 0.5 * (minimum + maximum)
+
     def test_tsukamoto(self) -> None:
-        pass
+        import numpy as np
+        terms = [fl.Sigmoid("", 0.13, 30.0), fl.Sigmoid("", 0.5, -30.0),
+                 fl.Sigmoid("", 0.0, 10.0, 0.5), fl.SShape("", 0.0, 0.25),
+                 fl.SShape("", 0.7, 1.0, 0.5), fl.ZShape("", 0.3, 0.6),
+                 fl.ZShape("", -0.4, 0.4, 0.5), fl.Ramp("", 0.6, 0.4)]
+        for term in terms:
+            degrees = [term.height * y for y in (0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.999)]
+            expected = [TestTerm.invert(term, degree, -10.0, 10.0) for degree in degrees]
+            with self.subTest(term=str(term)):
+                np.testing.assert_allclose(
+                    [term.tsukamoto(degree, -10.0, 10.0) for degree in degrees], expected,
+                    rtol=0.0, atol=1e-12)
+                np.testing.assert_allclose(
+                    term.tsukamoto_array(np.array(degrees), -10.0, 10.0), expected,
+                    rtol=0.0, atol=1e-12)
+
+        # the values beyond the range are bounded to the range
+        sigmoid = fl.Sigmoid("", 0.83, 30.0)
+        self.assertEqual(1.0, sigmoid.tsukamoto(0.99999, 0.0, 1.0))
+        self.assertEqual(0.0, sigmoid.tsukamoto(1e-15, 0.0, 1.0))
+        np.testing.assert_array_equal(
+            [0.0, 1.0], sigmoid.tsukamoto_array(np.array([1e-15, 0.99999]), 0.0, 1.0))
+
+        # the weighted average of the values inverted by bisection within the range, weighted by
+        # the membership of the input value to the terms of the antecedents
+        engine = fl.FllImporter().from_file(
+            Path(fl.__file__).parent / "examples" / "tsukamoto" / "tsukamoto.fll")
+        x = engine.input_variable("X")
+        for value in (-9.0, -4.5, -0.25, 2.0, 7.5):
+            x.value = value
+            engine.process()
+            weights = [x.term(name).membership(value) for name in ("small", "medium", "large")]
+            for output in ("Sigmoids", "ZSShapes"):
+                variable = engine.output_variable(output)
+                values = [TestTerm.invert(variable.term(name), weight,
+                                          variable.minimum, variable.maximum)
+                          for name, weight in zip("abc", weights)]
+                with self.subTest(x=value, output=output):
+                    self.assertTrue(variable.minimum <= variable.value <= variable.maximum)
+                    self.assertAlmostEqual(
+                        math.fsum(w * z for w, z in zip(weights, values)) / math.fsum(weights),
+                        variable.value, places=6)
 
 
 class FunctionNodeAssert(BaseAssert[fl.Function.Node]):
@@ -1366,6 +1669,120 @@ class TestFunction(unittest.TestCase):
             function_a.update_reference(engine_b)
             function_a.membership(0.0)
 
+    def test_function_compile(self) -> None:
+        formulas = ["2*x**3 +2*y - 3", "x - y - 1.5 * .-x", "sin(x) / cos(y) + pi()",
+                    "max(x, y) % 3 ^ 2", "gt(x, y) * ~ x + x and y or 0", "(x - y) / 0.0"]
+        for formula in formulas:
+            function = fl.Function.create("f", formula)
+            self.assertIsNotNone(function._program)
+            for x in [-1.5, 0.0, 0.5, 2.0, fl.inf, fl.nan]:
+                variables = {"x": x, "y": 0.25}
+                with self.subTest(formula=formula, x=x):
+                    try:
+                        expected = fl.Op.str(function.root.evaluate(variables))  # type: ignore
+                    except (ArithmeticError, ValueError) as error:
+                        expected = type(error).__name__
+                    try:
+                        obtained = fl.Op.str(function.evaluate(variables))
+                    except (ArithmeticError, ValueError) as error:
+                        obtained = type(error).__name__
+                    self.assertEqual(expected, obtained)
+
+        # the variables are bound by position, and the built-in operators are inlined
+        function = fl.Function.create("f", "y * x + sin(y)")
+        self.assertEqual(("y", "x"), function._program[1])  # type: ignore
+        bound = function._program[2].__globals__.values()  # type: ignore
+        self.assertIn(math.sin, bound)
+        self.assertNotIn(operator.mul, bound)
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected a map of variables containing the value for 'y', "
+                "but the map contains: {'x': 1.0}")):
+            function.evaluate({"x": 1.0})
+
+        # the compiled function is discarded when the expression tree changes
+        function.root = fl.Function.parse("x + 1")
+        self.assertEqual(3.0, function.evaluate({"x": 2.0}))
+        function.unload()
+        self.assertIsNone(function._program)
+
+        # the variables of the engine are bound again when their names change
+        a, b = fl.InputVariable("a"), fl.OutputVariable("b")
+        engine = fl.Engine(input_variables=[a], output_variables=[b])
+        function = fl.Function.create("f", "a + 10 * x", engine)
+        a.value = 1.0
+        self.assertEqual(21.0, function.membership(2.0))
+        bindings = function._bindings
+        self.assertIs(a, bindings[1][0])  # type: ignore
+        a.value = 3.0
+        self.assertEqual(23.0, function.membership(2.0))
+        self.assertIs(bindings, function._bindings)
+        a.name, b.name = "c", "a"
+        b.value = 5.0
+        self.assertEqual(25.0, function.membership(2.0))
+        self.assertIs(b, function._bindings[1][0])  # type: ignore
+
+        # the variables of the engine are bound again when the lists of variables change
+        d = fl.InputVariable("a")
+        d.value = 7.0
+        engine.output_variables.clear()
+        engine.input_variables.append(d)
+        self.assertEqual(27.0, function.membership(2.0))
+        self.assertIs(d, function._bindings[1][0])  # type: ignore
+        engine.input_variables = [a, fl.InputVariable("a")]
+        engine.input_variables[1].value = 9.0
+        self.assertEqual(29.0, function.membership(2.0))
+        engine.input_variables[1].name = "e"
+        engine.input_variables.append(fl.InputVariable("a"))
+        engine.input_variables[2].value = 11.0
+        self.assertEqual(31.0, function.membership(2.0))
+
+    def test_function_compile_after_changes_to_nodes(self) -> None:
+        function = fl.Function.create("f", "2*x+1")
+        other = fl.Function.create("g", "x - 1")
+        self.assertEqual(3.0, function.evaluate({"x": 1.0}))
+
+        # the functions are compiled again after the nodes change in place
+        function.root.right.constant = 5.0  # type: ignore
+        self.assertEqual(7.0, function.evaluate({"x": 1.0}))
+        self.assertEqual(7.0, function.membership(1.0))
+        self.assertEqual(5.0, function._program[2](0.0))  # type: ignore
+        self.assertEqual(0.0, other.membership(1.0))
+
+        function.root.left.left = fl.Function.Node(variable="y")  # type: ignore
+        self.assertEqual(8.0, function.evaluate({"x": 1.0, "y": 3.0}))
+        self.assertEqual(("y", "x"), function._program[1])  # type: ignore
+
+        function.root.element = fl.lib.factory_manager.function.copy("-")  # type: ignore
+        self.assertEqual(-2.0, function.evaluate({"x": 1.0, "y": 3.0}))
+
+        # parsing functions does not change the nodes of other functions
+        self.assertEqual(0.0, other.membership(1.0))
+        program = other._program
+        fl.Function.create("h", "sin(x) * 2 + 1")
+        self.assertEqual(0.0, other.membership(1.0))
+        self.assertIs(program, other._program)
+
+        # the changes are counted only in the functions compiled from the nodes
+        function.root.right.constant = 6.0  # type: ignore
+        self.assertEqual(0.0, other.membership(1.0))
+        self.assertIs(program, other._program)
+
+        shared = fl.Function("s", "x + 1", load=False)
+        shared.root = other.root
+        shared.compile()
+        self.assertEqual(1.0, shared.evaluate({"x": 2.0}))
+        other.root.right.constant = 3.0  # type: ignore
+        self.assertEqual(-1.0, other.evaluate({"x": 2.0}))
+        self.assertEqual(-1.0, shared.evaluate({"x": 2.0}))
+
+        # the copies count their changes apart from the original
+        clone = copy.deepcopy(other)
+        program = other._program
+        clone.root.right.constant = 4.0  # type: ignore
+        self.assertEqual(-2.0, clone.evaluate({"x": 2.0}))
+        self.assertEqual(-1.0, other.evaluate({"x": 2.0}))
+        self.assertIs(program, other._program)
+
     def test_element(self) -> None:
         element = fl.Function.Element("function", "math function()",  # type: ignore
                                       fl.Function.Element.Type.Function, None, 0, 0,
@@ -201,6 +201,52 @@ class TestInputVariable(unittest.TestCase):
                            -math.inf: "0.000/Low + 0.000/Medium + 0.000/High",
                            })
 
+    def test_fuzzify_terms(self) -> None:
+        low, high = fl.Triangle('Low', -1.0, -1.0, 0.0), fl.Triangle('High', 0.0, 1.0, 1.0)
+        error = fl.Function.create('Error', '1 / 0')
+        variable = fl.InputVariable(name="name", minimum=-1.0, maximum=1.0,
+                                    terms=[low, high, error])
+        variable.value = -0.5
+        self.assertDictEqual({low: 0.5, high: 0.0}, variable.fuzzify_terms())
+        self.assertEqual(0.5, variable.membership(low))
+
+        # the table is used until the value changes
+        low.vertex_b = -0.5
+        self.assertEqual(0.5, variable.membership(low))
+        with self.assertRaises(ZeroDivisionError):
+            variable.membership(error)
+
+        variable.value = -0.5
+        self.assertDictEqual({}, variable._memberships)
+        self.assertEqual(1.0, variable.membership(low))
+        self.assertDictEqual({}, variable._memberships)
+
+    def test_fuzzify_terms_with_dependent_terms(self) -> None:
+        engine = fl.Engine(input_variables=[fl.InputVariable("A"), fl.InputVariable("B")])
+        input_a, input_b = engine.input_variables
+        function = fl.Function.create("function", "x * B", engine)
+        linear = fl.Linear("linear", [1.0, 2.0], engine)
+        local = fl.Function.create("local", "x * k")
+        local.variables["k"] = 2.0
+        constant = fl.Constant("constant", 0.5)
+        input_a.terms = [function, linear, local, constant]
+        for term in input_a.terms:
+            self.assertEqual(term is not constant, fl.InputVariable.is_dependent(term))
+        self.assertFalse(fl.InputVariable.is_dependent(fl.Function.create("f", "2 * x")))
+
+        input_a.value, input_b.value = 0.5, 0.2
+        self.assertDictEqual({constant: 0.5}, input_a.fuzzify_terms())
+        self.assertAlmostEqual(0.1, input_a.membership(function))
+        self.assertAlmostEqual(0.9, input_a.membership(linear))
+        self.assertAlmostEqual(1.0, input_a.membership(local))
+
+        # the memberships of the dependent terms follow the other values
+        input_b.value = 0.4
+        local.variables["k"] = 3.0
+        self.assertAlmostEqual(0.2, input_a.membership(function))
+        self.assertAlmostEqual(1.3, input_a.membership(linear))
+        self.assertAlmostEqual(1.5, input_a.membership(local))
+
 
 class OutputVariableAssert(BaseAssert[fl.OutputVariable]):
 